@@ -347,3 +347,21 @@ class TestUserAnalytics:
         assert cache.get(cache_key1) is not None
         assert cache.get(cache_key2) is not None
         assert cache.get(cache_key1) != cache.get(cache_key2)
+
+    @patch("whimo.analytics.services.default_storage.exists")
+    def test_not_modified(self, mock_storage_exists: Mock, client: APIClient) -> None:
+        # Arrange
+        mock_storage_exists.return_value = False
+        user = UserFactory.create()
+        TransactionFactory.create(buyer=user)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        # Act
+        response = client.get(path=self.URL, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert not response.content
@@ -158,3 +158,23 @@ class TestOTPVerify:
             # Assert
             assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, response_json
             assert response_json == snapshot
+
+    def test_verified_gadget_grants_access(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create(with_gadgets=False)
+        gadget = GadgetFactory.create(user=user, email=True, is_verified=False)
+
+        cache_key = OTP_CACHE_KEY.format(user_id=gadget.user_id, identifier=gadget.identifier)
+        cache.set(cache_key, OTP_CODE)
+
+        client.login(user)
+        assert client.get(path=reverse("notification_settings")).status_code == HTTPStatus.FORBIDDEN
+
+        client.post(path=self.URL, data={"identifier": gadget.identifier, "code": OTP_CODE})
+
+        # Act
+        response = client.get(path=reverse("notification_settings"))
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
@@ -1,7 +1,14 @@
-from typing import Callable
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
 from unittest.mock import MagicMock
 
 import pytest
+from authlib.jose import RSAKey, jwt
 from pytest_mock import MockerFixture
 
 from whimo.auth.social.schemas.dto import OAuthUserInfo
@@ -33,3 +40,78 @@ def mock_code(mock_parse_code: MagicMock) -> Callable[[str], None]:
         mock_parse_code.return_value = userinfo.model_dump()
 
     return parse_code
+
+
+@pytest.fixture
+def mock_monotonic(mocker: MockerFixture) -> MagicMock:
+    mock_time = mocker.patch("whimo.auth.social.clients.time")
+    mock_time.monotonic.return_value = 0
+    return mock_time.monotonic
+
+
+@dataclass
+class OpenIDProviderStub:
+    url: str
+    key: RSAKey
+    requests: list[str] = field(default_factory=list)
+    is_down: bool = False
+
+    @property
+    def metadata_url(self) -> str:
+        return f"{self.url}/.well-known/openid-configuration"
+
+    def rotate_key(self, kid: str) -> None:
+        self.key = RSAKey.generate_key(2048, is_private=True, options={"kid": kid})
+
+    def issue_id_token(self, email: str, client_id: str, nonce: str) -> str:
+        now = int(time.time())
+        claims = {
+            "iss": self.url,
+            "sub": email,
+            "aud": client_id,
+            "email": email,
+            "email_verified": True,
+            "nonce": nonce,
+            "iat": now,
+            "exp": now + 600,
+        }
+        header = {"alg": "RS256", "kid": self.key.kid}
+        return jwt.encode(header, claims, self.key).decode()
+
+
+@pytest.fixture
+def openid_provider() -> Iterator[OpenIDProviderStub]:
+    """OpenID provider serving the discovery document and JWKS from a local HTTP server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            provider.requests.append(self.path)
+            documents = {
+                "/.well-known/openid-configuration": {"issuer": provider.url, "jwks_uri": f"{provider.url}/jwks"},
+                "/jwks": {"keys": [provider.key.as_dict(is_private=False)]},
+            }
+            if provider.is_down or self.path not in documents:
+                self.send_response(HTTPStatus.SERVICE_UNAVAILABLE)
+                self.end_headers()
+                return
+
+            content = json.dumps(documents[self.path]).encode()
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *_: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    provider = OpenIDProviderStub(
+        url=f"http://127.0.0.1:{server.server_port}",
+        key=RSAKey.generate_key(2048, is_private=True, options={"kid": "initial"}),
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield provider
+    server.shutdown()
+    server.server_close()
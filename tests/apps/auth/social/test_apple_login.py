@@ -93,7 +93,7 @@ class TestAppleLogin:
         }
         mock_oauth.apple = mock_apple_client
 
-        mocker.patch("whimo.auth.social.service.OAuth", return_value=mock_oauth)
+        mocker.patch("whimo.auth.social.service.CachedOAuth", return_value=mock_oauth)
 
         request_data = {
             "id_token": "valid-token",
@@ -124,7 +124,7 @@ class TestAppleLogin:
         mock_apple_client.parse_id_token.side_effect = OAuthError
         mock_oauth.apple = mock_apple_client
 
-        mocker.patch("whimo.auth.social.service.OAuth", return_value=mock_oauth)
+        mocker.patch("whimo.auth.social.service.CachedOAuth", return_value=mock_oauth)
 
         request_data = {
             "id_token": "invalid-token",
@@ -87,7 +87,7 @@ class TestAppleWebLogin:
         }
         mock_oauth.apple = mock_apple_client
 
-        mocker.patch("whimo.auth.social.service.OAuth", return_value=mock_oauth)
+        mocker.patch("whimo.auth.social.service.CachedOAuth", return_value=mock_oauth)
 
         request_data = {
             "code": "valid-code",
@@ -119,7 +119,7 @@ class TestAppleWebLogin:
         mock_apple_client.fetch_access_token.side_effect = OAuthError
         mock_oauth.apple = mock_apple_client
 
-        mocker.patch("whimo.auth.social.service.OAuth", return_value=mock_oauth)
+        mocker.patch("whimo.auth.social.service.CachedOAuth", return_value=mock_oauth)
 
         request_data = {
             "code": "invalid-code",
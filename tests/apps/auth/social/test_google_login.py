@@ -93,7 +93,7 @@ class TestGoogleLogin:
         }
         mock_oauth.google = mock_google_client
 
-        mocker.patch("whimo.auth.social.service.OAuth", return_value=mock_oauth)
+        mocker.patch("whimo.auth.social.service.CachedOAuth", return_value=mock_oauth)
 
         request_data = {
             "id_token": "valid-token",
@@ -120,7 +120,7 @@ class TestGoogleLogin:
         mock_google_client.parse_id_token.side_effect = OAuthError
         mock_oauth.google = mock_google_client
 
-        mocker.patch("whimo.auth.social.service.OAuth", return_value=mock_oauth)
+        mocker.patch("whimo.auth.social.service.CachedOAuth", return_value=mock_oauth)
 
         request_data = {
             "id_token": "invalid-token",
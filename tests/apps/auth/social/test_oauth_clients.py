@@ -0,0 +1,139 @@
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from authlib.jose.errors import JoseError
+from pytest_mock import MockerFixture
+from requests import HTTPError
+
+from tests.apps.auth.social.fixtures import OpenIDProviderStub
+from tests.helpers.constants import USER_EMAIL
+from whimo.auth.social.clients import (
+    OPENID_DOCUMENT_CACHE_TIMEOUT,
+    OPENID_DOCUMENT_RETRY_INTERVAL,
+    OPENID_DOCUMENT_STALE_TIMEOUT,
+    OPENID_JWKS_REFRESH_INTERVAL,
+    CachedOAuth,
+    CachedOAuth2App,
+)
+from whimo.auth.social.service import OAuthService
+
+pytestmark = [pytest.mark.django_db]
+
+CLIENT_ID = "whimo"
+NONCE = "nonce"
+METADATA_PATH = "/.well-known/openid-configuration"
+JWKS_PATH = "/jwks"
+
+
+class TestOAuthClients:
+    @staticmethod
+    def _parse(provider: OpenIDProviderStub) -> dict:
+        oauth = CachedOAuth()
+        oauth.register(name="provider", client_id=CLIENT_ID, server_metadata_url=provider.metadata_url)
+
+        token = {"id_token": provider.issue_id_token(USER_EMAIL, CLIENT_ID, NONCE)}
+        return oauth.provider.parse_id_token(token=token, nonce=NONCE)
+
+    def test_documents_fetched_once(self, openid_provider: OpenIDProviderStub) -> None:
+        # Act
+        first = self._parse(openid_provider)
+        second = self._parse(openid_provider)
+
+        # Assert
+        assert first["email"] == second["email"] == USER_EMAIL
+        assert openid_provider.requests == [METADATA_PATH, JWKS_PATH]
+
+    def test_documents_refetched_after_timeout(
+        self, openid_provider: OpenIDProviderStub, mock_monotonic: MagicMock
+    ) -> None:
+        # Arrange
+        self._parse(openid_provider)
+        mock_monotonic.return_value = OPENID_DOCUMENT_CACHE_TIMEOUT
+
+        # Act
+        self._parse(openid_provider)
+
+        # Assert
+        assert openid_provider.requests == [METADATA_PATH, JWKS_PATH, METADATA_PATH, JWKS_PATH]
+
+    def test_stale_documents_served_when_provider_down(
+        self, openid_provider: OpenIDProviderStub, mock_monotonic: MagicMock
+    ) -> None:
+        # Arrange
+        self._parse(openid_provider)
+        mock_monotonic.return_value = OPENID_DOCUMENT_CACHE_TIMEOUT
+        openid_provider.is_down = True
+
+        # Act
+        first = self._parse(openid_provider)
+        second = self._parse(openid_provider)
+
+        # Assert
+        assert first["email"] == second["email"] == USER_EMAIL
+        # Failed refreshes are retried only after the retry interval
+        assert openid_provider.requests == [METADATA_PATH, JWKS_PATH, METADATA_PATH, JWKS_PATH]
+
+        mock_monotonic.return_value += OPENID_DOCUMENT_RETRY_INTERVAL
+        self._parse(openid_provider)
+        assert openid_provider.requests == [METADATA_PATH, JWKS_PATH] * 3
+
+    def test_error_when_stale_documents_expired(
+        self, openid_provider: OpenIDProviderStub, mock_monotonic: MagicMock
+    ) -> None:
+        # Arrange
+        self._parse(openid_provider)
+        mock_monotonic.return_value = OPENID_DOCUMENT_CACHE_TIMEOUT + OPENID_DOCUMENT_STALE_TIMEOUT
+        openid_provider.is_down = True
+
+        # Act & Assert
+        with pytest.raises(HTTPError):
+            self._parse(openid_provider)
+
+    def test_rotated_key_refetched(self, openid_provider: OpenIDProviderStub, mock_monotonic: MagicMock) -> None:
+        # Arrange
+        self._parse(openid_provider)
+        mock_monotonic.return_value = OPENID_JWKS_REFRESH_INTERVAL
+        openid_provider.rotate_key(kid="rotated")
+
+        # Act
+        data = self._parse(openid_provider)
+
+        # Assert
+        assert data["email"] == USER_EMAIL
+        assert openid_provider.requests == [METADATA_PATH, JWKS_PATH, JWKS_PATH]
+
+    def test_rotated_key_refetch_rate_limited(self, openid_provider: OpenIDProviderStub) -> None:
+        # Arrange
+        self._parse(openid_provider)
+        openid_provider.rotate_key(kid="rotated")
+
+        # Act & Assert
+        with pytest.raises((JoseError, ValueError)):
+            self._parse(openid_provider)
+
+        assert openid_provider.requests == [METADATA_PATH, JWKS_PATH]
+
+    @pytest.mark.parametrize(
+        ("get_oauth", "name", "metadata_url"),
+        [
+            (OAuthService._get_google_oauth, "google", "https://accounts.google.com/.well-known/openid-configuration"),
+            (OAuthService._get_apple_oauth, "apple", "https://appleid.apple.com/.well-known/openid-configuration"),
+        ],
+    )
+    def test_provider_metadata_url(
+        self,
+        mocker: MockerFixture,
+        get_oauth: Callable[[bool], CachedOAuth],
+        name: str,
+        metadata_url: str,
+    ) -> None:
+        # Arrange
+        mock_fetch = mocker.patch.object(CachedOAuth2App, "_fetch_document", return_value={"issuer": metadata_url})
+
+        # Act
+        metadata = getattr(get_oauth(False), name).load_server_metadata()
+
+        # Assert
+        assert metadata["issuer"] == metadata_url
+        mock_fetch.assert_called_once_with(metadata_url)
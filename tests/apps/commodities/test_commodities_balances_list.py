@@ -52,11 +52,12 @@ class TestCommoditiesBalancesList:
         assert response_balance_ids == balance_ids
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select count
-        # 4. select entities (with has_recipe annotation)
-        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select count
+        # 3. select entities
+        # 4. select commodity groups catalog
+        # 5. select commodities catalog (with has_recipe annotation)
+        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison
 
     def test_search_by_commodity_name(
         self,
@@ -7,6 +7,7 @@ from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from freezegun.api import FrozenDateTimeFactory
+from rest_framework.renderers import JSONRenderer
 from syrupy import SnapshotAssertion
 
 from tests.factories.balances import BalanceFactory
@@ -65,12 +66,11 @@ class TestCommoditiesGroupsList:
         assert response_balance_volumes == {balance.volume for balance in balances}
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select count
-        # 4. select entities
-        # 5. prefetch related entities (with has_recipe annotation)
-        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select commodity groups catalog
+        # 3. select commodities catalog (with has_recipe annotation)
+        # 4. select balances
+        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison
 
     def test_search_by_name(
         self,
@@ -191,3 +191,81 @@ class TestCommoditiesGroupsList:
         # Assert
         assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
         assert response_json == snapshot
+
+    def test_not_modified(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        commodity = CommodityFactory.create()
+        BalanceFactory.create(user=user, commodity=commodity)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+        # No queries: the auth state is cached by the first request
+        assert not queries, queries_to_str(queries)
+
+    def test_modified_after_balance_change(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        commodity = CommodityFactory.create()
+        balance = BalanceFactory.create(user=user, commodity=commodity)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        balance.volume += 1
+        balance.save()
+
+        # Act
+        response = client.get(path=self.URL, headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[CommodityGroupWithCommoditiesBalancesDTO]](**response_json)
+        assert data_response.data[0].commodities[0].balance == balance.volume
+
+    def test_modified_after_commodity_change(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        commodity = CommodityFactory.create()
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        commodity.name = "cocoa"
+        commodity.save()
+
+        # Act
+        response = client.get(path=self.URL, headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[CommodityGroupWithCommoditiesBalancesDTO]](**response_json)
+        assert data_response.data[0].commodities[0].name == "cocoa"
+
+    def test_rendered_like_drf_encoder(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        BalanceFactory.create(user=user)
+
+        client.login(user)
+
+        # Act
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+        assert response.content == JSONRenderer().render(response.data)
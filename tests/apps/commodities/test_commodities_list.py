@@ -47,11 +47,10 @@ class TestCommoditiesList:
         assert len(data_response.data) == SMALL_BATCH_SIZE
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select count
-        # 4. select entities (with has_recipe annotation)
-        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select commodity groups catalog
+        # 3. select commodities catalog (with has_recipe annotation)
+        assert len(queries) == 3, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison  # noqa: PLR2004 Magic value used in comparison
 
     def test_search_by_name(
         self,
@@ -257,3 +256,67 @@ class TestCommoditiesList:
 
         data_response = PaginatedDataResponse[list[CommodityDTO]](**response_json)
         assert len(data_response.data) == len(commodities)
+
+    def test_catalog_cached(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        CommodityFactory.create_batch(size=SMALL_BATCH_SIZE)
+
+        client.login(user)
+        client.get(path=self.URL)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[CommodityWithGroupDTO]](**response_json)
+        assert len(data_response.data) == SMALL_BATCH_SIZE
+
+        # No queries: the auth state is cached by the first request
+        assert not queries, queries_to_str(queries)
+
+    def test_catalog_invalidated_on_commodity_change(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        commodity = CommodityFactory.create(name="cocoa")
+
+        client.login(user)
+        client.get(path=self.URL)
+
+        commodity.name = "coffee"
+        commodity.save()
+        new_commodity = CommodityFactory.create()
+
+        # Act
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[CommodityWithGroupDTO]](**response_json)
+        assert {item.id for item in data_response.data} == {commodity.id, new_commodity.id}
+        assert {item.name for item in data_response.data} >= {"coffee"}
+
+    def test_search_by_name_variant(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        commodity = CommodityFactory.create(name_variants=["Cacao en grano", "Fèves de cacao"])
+        CommodityFactory.create_batch(size=SMALL_BATCH_SIZE, name=factory.Faker("numerify", text="####"))
+
+        client.login(user)
+
+        # Act
+        response = client.get(path=f"{self.URL}?search=feves")
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[CommodityWithGroupDTO]](**response_json)
+        assert len(data_response.data) == 1
+        assert data_response.data[0].id == commodity.id
@@ -0,0 +1,78 @@
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+import pytest
+from django.urls import reverse
+from pytest_mock import MockerFixture
+
+from tests.factories.transactions import TransactionFactory
+from tests.factories.users import UserFactory
+from tests.helpers.clients import APIClient
+from tests.helpers.constants import SMALL_BATCH_SIZE
+from whimo.common.cache import CacheVersion, VersionedCache, pin_versioned_caches
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def loader() -> MagicMock:
+    return MagicMock(side_effect=lambda: ["data"])
+
+
+class TestPinVersionedCaches:
+    def test_version_checked_once(self, loader: MagicMock, mocker: MockerFixture) -> None:
+        # Arrange
+        versioned_cache = VersionedCache[list[str]]("test", loader)
+        get_version = mocker.spy(CacheVersion, "get")
+
+        # Act
+        with pin_versioned_caches():
+            values = [versioned_cache.get() for _ in range(3)]
+            version = versioned_cache.get_version()
+
+        # Assert
+        assert values == [["data"]] * 3
+        assert get_version.call_count == 1
+        assert version == versioned_cache.version.get()
+        loader.assert_called_once()
+
+    def test_version_checked_every_time_outside(self, loader: MagicMock, mocker: MockerFixture) -> None:
+        # Arrange
+        versioned_cache = VersionedCache[list[str]]("test", loader)
+        get_version = mocker.spy(CacheVersion, "get")
+
+        # Act
+        for _ in range(3):
+            versioned_cache.get()
+
+        # Assert
+        assert get_version.call_count == 3  # noqa: PLR2004
+        loader.assert_called_once()
+
+    def test_invalidate_inside(self, loader: MagicMock) -> None:
+        # Arrange
+        versioned_cache = VersionedCache[list[str]]("test", loader)
+
+        # Act
+        with pin_versioned_caches():
+            versioned_cache.get()
+            versioned_cache.invalidate()
+            versioned_cache.get()
+
+        # Assert
+        assert loader.call_count == 2  # noqa: PLR2004
+
+    def test_transactions_list(self, client: APIClient, mocker: MockerFixture) -> None:
+        # Arrange
+        user = UserFactory.create()
+        TransactionFactory.create_batch(size=SMALL_BATCH_SIZE, buyer=user)
+        client.login(user)
+        client.get(path=reverse("transactions_list"))
+        get_version = mocker.spy(CacheVersion, "get")
+
+        # Act
+        response = client.get(path=reverse("transactions_list"))
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert [call.args[0].key for call in get_version.call_args_list].count("commodities:version") == 1
@@ -0,0 +1,134 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, router, transaction
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from tests.factories.transactions import TransactionFactory
+from tests.factories.users import GadgetFactory, UserFactory
+from tests.helpers.clients import APIClient
+from whimo.common.schemas.errors import NotFound
+from whimo.db.models import Transaction
+from whimo.db.routers import REPLICA_DATABASE, pin_primary_reads, using_replica
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+
+@pytest.fixture
+def replica(settings: SettingsWrapper) -> None:
+    settings.DATABASES = {
+        **settings.DATABASES,
+        REPLICA_DATABASE: {**settings.DATABASES[DEFAULT_DB_ALIAS], "TEST": {"MIRROR": DEFAULT_DB_ALIAS}},
+    }
+
+
+class TestReplicaRouter:
+    @pytest.mark.usefixtures("replica")
+    def test_reads_outside_context_use_primary(self) -> None:
+        # Act & Assert
+        assert router.db_for_read(Transaction) == DEFAULT_DB_ALIAS
+        assert router.db_for_write(Transaction) == DEFAULT_DB_ALIAS
+
+    @pytest.mark.usefixtures("replica")
+    def test_reads_inside_context_use_replica(self) -> None:
+        # Act
+        with using_replica():
+            read_database = router.db_for_read(Transaction)
+            write_database = router.db_for_write(Transaction)
+
+        # Assert
+        assert read_database == REPLICA_DATABASE
+        assert write_database == DEFAULT_DB_ALIAS
+
+    def test_reads_use_primary_without_replica(self) -> None:
+        # Act
+        with using_replica():
+            read_database = router.db_for_read(Transaction)
+
+        # Assert
+        assert read_database == DEFAULT_DB_ALIAS
+
+    @pytest.mark.usefixtures("replica")
+    def test_reads_inside_transaction_use_primary(self) -> None:
+        # Act
+        with using_replica(), transaction.atomic():
+            read_database = router.db_for_read(Transaction)
+
+        # Assert
+        assert read_database == DEFAULT_DB_ALIAS
+
+    @pytest.mark.usefixtures("replica")
+    def test_reads_after_own_writes_use_primary(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create(with_gadgets=False)
+        other_user = UserFactory.create()
+        GadgetFactory.create(email=True, user=user, is_verified=True)
+        unverified_gadget = GadgetFactory.create(phone=True, user=user, is_verified=False)
+
+        client.login(user)
+
+        # Act
+        response = client.delete(path=reverse("gadgets"), data={"identifier": unverified_gadget.identifier})
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+
+        with using_replica(user_id=user.id):
+            assert router.db_for_read(Transaction) == DEFAULT_DB_ALIAS
+
+        with using_replica(user_id=other_user.id):
+            assert router.db_for_read(Transaction) == REPLICA_DATABASE
+
+    @pytest.mark.usefixtures("replica")
+    def test_reads_after_own_reads_use_replica(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        client.login(user)
+
+        # Act
+        response = client.get(path=reverse("users_profile"))
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+
+        with using_replica(user_id=user.id):
+            assert router.db_for_read(Transaction) == REPLICA_DATABASE
+
+    @pytest.mark.usefixtures("replica")
+    @pytest.mark.parametrize(
+        ("url", "method"),
+        [
+            ("transactions_chain_download", "get_chain_feature_collection"),
+            ("transactions_chain_csv_download", "get_chain_csv_export"),
+            ("transactions_chain_bundle_download", "get_chain_location_bundle"),
+        ],
+    )
+    def test_chain_downloads_after_own_writes_use_primary(
+        self,
+        client: APIClient,
+        mocker: MockerFixture,
+        url: str,
+        method: str,
+    ) -> None:
+        # Arrange
+        user = UserFactory.create()
+        transaction = TransactionFactory.create(buyer=user)
+        pin_primary_reads(user.id)
+
+        read_databases = []
+
+        def read_database(*_: object, **__: object) -> None:
+            read_databases.append(router.db_for_read(Transaction))
+            raise NotFound(errors={"transaction": [transaction.id]})
+
+        mocker.patch(f"whimo.transactions.services.TransactionsService.{method}", side_effect=read_database)
+        client.login(user)
+
+        # Act
+        response = client.get(path=reverse(url, args=(transaction.id,)))
+
+        # Assert
+        assert response.status_code == HTTPStatus.NOT_FOUND, response.json()
+        assert read_databases == [DEFAULT_DB_ALIAS]
@@ -0,0 +1,147 @@
+from http import HTTPStatus
+from typing import Any, Iterator
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from tests.factories.notifications import NotificationFactory
+from tests.factories.transactions import TransactionFactory
+from tests.factories.users import UserFactory
+from tests.helpers.budgets import check_query_budgets
+from tests.helpers.clients import APIClient
+from whimo.common.metrics import Metrics, metrics_recorded
+from whimo.contrib.tasks.cleanup import cleanup_unverified_gadgets
+from whimo.notifications.views import NotificationsListView
+
+pytestmark = [pytest.mark.django_db]
+
+METRICS_TOKEN = "metrics-token"
+
+
+@pytest.fixture
+def recorded_metrics() -> Iterator[list[tuple[str, Metrics]]]:
+    recorded = []
+
+    def record(name: str, metrics: Metrics, **_: Any) -> None:
+        recorded.append((name, metrics))
+
+    metrics_recorded.connect(record, dispatch_uid="recorded_metrics")
+    yield recorded
+    metrics_recorded.disconnect(dispatch_uid="recorded_metrics")
+
+
+class TestMetrics:
+    @pytest.fixture(autouse=True)
+    def metrics_settings(self, settings: SettingsWrapper) -> None:
+        settings.METRICS_ENABLED = True
+        settings.METRICS_TOKEN = METRICS_TOKEN
+
+    def test_server_timing(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create(received_by=user)
+        client.login(user)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=reverse("notifications_list"))
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+
+        server_timing = response.headers["Server-Timing"]
+        assert "db;dur=" in server_timing
+        assert f'desc="{len(queries)} queries"' in server_timing
+        assert 'storage;dur=0.0;desc="0 calls"' in server_timing
+        assert "serialization;dur=" in server_timing
+        assert "total;dur=" in server_timing
+
+    def test_streamed_queries_recorded(self, client: APIClient, recorded_metrics: list[tuple[str, Metrics]]) -> None:
+        # Arrange
+        user = UserFactory.create()
+        transaction = TransactionFactory.create(buyer=user)
+        client.login(user)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=reverse("transactions_chain_graph_download", args=(transaction.id,)))
+            # Rows are fetched while the body is streamed, metrics are recorded once it ends
+            assert not recorded_metrics
+            response.getvalue()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert [(name, metrics.queries) for name, metrics in recorded_metrics] == [
+            ("transactions_chain_graph_download", len(queries))
+        ]
+
+    def test_export(self, client: APIClient, recorded_metrics: list[tuple[str, Metrics]]) -> None:
+        # Arrange
+        user = UserFactory.create()
+        client.login(user)
+
+        client.get(path=reverse("notifications_list"))
+        client.get(path=reverse("notifications_list"))
+        queries = sum(metrics.queries for name, metrics in recorded_metrics if name == "notifications_list")
+
+        cleanup_unverified_gadgets.apply()
+
+        client.logout()
+
+        # Act
+        response = client.get(path=reverse("system_metrics"), headers={"Authorization": f"Bearer {METRICS_TOKEN}"})
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"].startswith("text/plain")
+
+        content = response.content.decode()
+        assert "# TYPE whimo_requests_total counter" in content
+        assert 'whimo_requests_total{view="notifications_list"} 2' in content
+        assert f'whimo_request_db_queries_total{{view="notifications_list"}} {queries}' in content
+        assert 'whimo_tasks_total{task="whimo.contrib.tasks.cleanup.cleanup_unverified_gadgets"} 1' in content
+
+    @pytest.mark.parametrize("authorization", ["", "Bearer invalid"])
+    def test_export_forbidden(self, client: APIClient, authorization: str) -> None:
+        # Act
+        response = client.get(path=reverse("system_metrics"), headers={"Authorization": authorization})
+
+        # Assert
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+class TestQueryBudgets:
+    @pytest.fixture
+    def enforce_query_budgets(self) -> None:
+        """Budgets are checked by the tests themselves."""
+
+    def test_budget_exceeded(self, client: APIClient, mocker: MockerFixture) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create(received_by=user)
+        client.login(user)
+
+        mocker.patch.object(NotificationsListView, "query_budget", 1)
+
+        # Act & Assert
+        with (
+            pytest.raises(pytest.fail.Exception, match="request notifications_list: .* queries, budget 1"),
+            check_query_budgets(),
+        ):
+            client.get(path=reverse("notifications_list"))
+
+    def test_budget_kept(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create(received_by=user)
+        client.login(user)
+
+        # Act & Assert
+        with check_query_budgets():
+            response = client.get(path=reverse("notifications_list"))
+
+        assert response.status_code == HTTPStatus.OK, response.json()
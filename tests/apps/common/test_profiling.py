@@ -0,0 +1,107 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from tests.helpers.clients import APIClient
+from whimo.common.profiling import (
+    PROFILE_HEADER,
+    PROFILE_PATH_HEADER,
+    REQUEST_PROFILE,
+    profile,
+    profiled_targets,
+    update_profiled_targets,
+)
+from whimo.common.sampling import build_traces_sampler
+from whimo.contrib.tasks.cleanup import cleanup_unverified_gadgets
+
+pytestmark = [pytest.mark.django_db]
+
+PROFILING_TOKEN = "profiling-token"
+
+
+class TestProfiling:
+    @pytest.fixture(autouse=True)
+    def profiling_settings(self, settings: SettingsWrapper) -> None:
+        settings.PROFILING_TOKEN = PROFILING_TOKEN
+        profiled_targets.clear()
+
+    def test_profile_request_with_header(self, client: APIClient, mocker: MockerFixture) -> None:
+        # Arrange
+        mock_save = mocker.patch("whimo.common.profiling.default_storage.save", side_effect=lambda path, _: path)
+
+        # Act
+        response = client.get(path=reverse("system_healthcheck"), headers={PROFILE_HEADER: PROFILING_TOKEN})
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        mock_save.assert_called_once()
+
+        path = response.headers[PROFILE_PATH_HEADER]
+        assert path == mock_save.call_args.args[0]
+        assert path.startswith("profiles/request/")
+        assert path.endswith(".prof")
+
+    def test_profile_request_with_invalid_header(self, client: APIClient, mocker: MockerFixture) -> None:
+        # Arrange
+        mock_save = mocker.patch("whimo.common.profiling.default_storage.save")
+
+        # Act
+        response = client.get(path=reverse("system_healthcheck"), headers={PROFILE_HEADER: "invalid"})
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert PROFILE_PATH_HEADER not in response.headers
+        mock_save.assert_not_called()
+
+    def test_profile_admin_targets(self, client: APIClient, mocker: MockerFixture) -> None:
+        # Arrange
+        mock_save = mocker.patch("whimo.common.profiling.default_storage.save", side_effect=lambda path, _: path)
+        update_profiled_targets(
+            key="PROFILED_TARGETS",
+            new_value=f"{reverse('system_healthcheck')}, {cleanup_unverified_gadgets.name}",
+        )
+
+        # Act
+        response = client.get(path=reverse("system_healthcheck"))
+        cleanup_unverified_gadgets.apply()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert [call.args[0].split("/")[1] for call in mock_save.call_args_list] == ["request", "task"]
+
+        # Clearing the targets stops profiling
+        update_profiled_targets(key="PROFILED_TARGETS", new_value="")
+        client.get(path=reverse("system_healthcheck"))
+        assert mock_save.call_count == 2  # noqa: PLR2004 Magic value used in comparison
+
+    def test_profile_request_while_profiling(self, client: APIClient, mocker: MockerFixture) -> None:
+        # Arrange
+        mock_save = mocker.patch("whimo.common.profiling.default_storage.save", side_effect=lambda path, _: path)
+
+        # Act
+        # A concurrent request of a threaded worker finds the profiler of the first one active
+        with profile(REQUEST_PROFILE, "concurrent") as paths:
+            response = client.get(path=reverse("system_healthcheck"), headers={PROFILE_HEADER: PROFILING_TOKEN})
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert PROFILE_PATH_HEADER not in response.headers
+        assert paths == [mock_save.call_args.args[0]]
+        mock_save.assert_called_once()
+
+    def test_traces_sampler(self) -> None:
+        # Arrange
+        default_rate, api_rate = 0.1, 0.5
+        sampler = build_traces_sampler(
+            default_rate, {"/api/v1/": api_rate, "/api/v1/system/": 0.0, "whimo.contrib.tasks": 1.0}
+        )
+
+        # Act & Assert
+        assert sampler({"wsgi_environ": {"PATH_INFO": "/api/v1/system/healthcheck/"}}) == 0.0
+        assert sampler({"wsgi_environ": {"PATH_INFO": "/api/v1/transactions/"}}) == api_rate
+        assert sampler({"wsgi_environ": {"PATH_INFO": "/admin/"}}) == default_rate
+        assert sampler({"celery_job": {"task": "whimo.contrib.tasks.cleanup.archive_notifications"}}) == 1.0
+        assert sampler({"parent_sampled": True, "wsgi_environ": {"PATH_INFO": "/api/v1/system/"}}) == 1.0
@@ -1,13 +1,24 @@
+import csv
+import gzip
+import io
+import json
+from datetime import timedelta
 from http import HTTPStatus
+from uuid import uuid4
 
 import pytest
 from django.urls import reverse
+from freezegun.api import FrozenDateTimeFactory
+from pytest_mock import MockerFixture
 
 from tests.factories.transactions import TransactionFactory
 from tests.factories.users import GadgetFactory, UserFactory
 from tests.helpers.clients import AdminClient
+from tests.helpers.constants import DEFAULT_DATETIME
 from whimo.contrib.admin.transactions import TransactionAdmin
-from whimo.db.enums import GadgetType
+from whimo.db.enums import GadgetType, TransactionStatus, TransactionType
+from whimo.db.models import Transaction
+from whimo.db.storages import ChainsStorage
 
 pytestmark = [pytest.mark.django_db]
 
@@ -141,3 +152,209 @@ class TestTransactionsAdmin:
         assert type_labeled_result is not None
         assert status_labeled_result is not None
         assert traceability_labeled_result is not None or traceability_labeled_result is None
+
+
+class TestTransactionsAdminDownstream:
+    CHANGELIST_URL = "admin:db_transaction_changelist"
+
+    @pytest.fixture
+    def downstream(self, freezer: FrozenDateTimeFactory) -> tuple[Transaction, list[Transaction], Transaction]:
+        # earlier sale of farmer | harvest -> farmer -> trader -> buyer | unrelated
+        farmer, trader, buyer = UserFactory.create_batch(size=3)
+
+        freezer.move_to(DEFAULT_DATETIME)
+        earlier_sale = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM, seller=farmer, status=TransactionStatus.ACCEPTED
+        )
+
+        freezer.tick(timedelta(days=1))
+        harvest = TransactionFactory.create(producer=True, buyer=farmer)
+
+        freezer.tick(timedelta(days=1))
+        trader_purchase = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM, seller=farmer, buyer=trader, status=TransactionStatus.ACCEPTED
+        )
+
+        freezer.tick(timedelta(days=1))
+        buyer_purchase = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM, seller=trader, buyer=buyer, status=TransactionStatus.ACCEPTED
+        )
+        TransactionFactory.create(producer=True)
+
+        return harvest, [harvest, trader_purchase, buyer_purchase], earlier_sale
+
+    def test_download_downstream(
+        self,
+        admin_client: AdminClient,
+        downstream: tuple[Transaction, list[Transaction], Transaction],
+    ) -> None:
+        # Arrange
+        admin = UserFactory.create(superuser=True)
+        harvest, downstream_transactions, earlier_sale = downstream
+
+        admin_client.login(admin)
+
+        # Act
+        response = admin_client.post(
+            reverse(self.CHANGELIST_URL),
+            data={"action": "download_downstream", "_selected_action": [str(harvest.pk)]},
+        )
+        rows = list(csv.DictReader(io.StringIO(response.getvalue().decode())))
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert {row["Transaction ID"] for row in rows} == {str(item.pk) for item in downstream_transactions}
+        assert str(earlier_sale.pk) not in {row["Transaction ID"] for row in rows}
+
+    def test_download_downstream_through_conversion(
+        self,
+        admin_client: AdminClient,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        # Arrange
+        # harvest -> farmer -> processor -> beans to oil conversion -> oil buyer
+        admin = UserFactory.create(superuser=True)
+        farmer, processor, oil_buyer = UserFactory.create_batch(size=3)
+        group_id = uuid4()
+
+        freezer.move_to(DEFAULT_DATETIME)
+        harvest = TransactionFactory.create(producer=True, buyer=farmer)
+
+        freezer.tick(timedelta(days=1))
+        processor_purchase = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=farmer,
+            buyer=processor,
+            commodity=harvest.commodity,
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        freezer.tick(timedelta(days=1))
+        conversion_input = TransactionFactory.create(
+            type=TransactionType.CONVERSION,
+            seller=processor,
+            buyer=None,
+            created_by=processor,
+            commodity=harvest.commodity,
+            status=TransactionStatus.ACCEPTED,
+            group_id=group_id,
+        )
+        conversion_output = TransactionFactory.create(
+            type=TransactionType.CONVERSION,
+            seller=None,
+            buyer=processor,
+            created_by=processor,
+            status=TransactionStatus.ACCEPTED,
+            group_id=group_id,
+        )
+        # A conversion of another group is not made of the harvest
+        other_processor = UserFactory.create()
+        TransactionFactory.create(
+            type=TransactionType.CONVERSION,
+            seller=None,
+            buyer=other_processor,
+            created_by=other_processor,
+            status=TransactionStatus.ACCEPTED,
+            group_id=uuid4(),
+        )
+
+        freezer.tick(timedelta(days=1))
+        oil_sale = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=processor,
+            buyer=oil_buyer,
+            commodity=conversion_output.commodity,
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        admin_client.login(admin)
+
+        # Act
+        response = admin_client.post(
+            reverse(self.CHANGELIST_URL),
+            data={"action": "download_downstream", "_selected_action": [str(harvest.pk)]},
+        )
+        rows = list(csv.DictReader(io.StringIO(response.getvalue().decode())))
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert {row["Transaction ID"] for row in rows} == {
+            str(item.pk) for item in (harvest, processor_purchase, conversion_input, conversion_output, oil_sale)
+        }
+
+    def test_downstream_skips_sales_before_purchase(
+        self,
+        downstream: tuple[Transaction, list[Transaction], Transaction],
+    ) -> None:
+        # Arrange
+        harvest, _, earlier_sale = downstream
+
+        # Act
+        upstream_ids = {item.id for item in ChainsStorage.get_chain_transactions(earlier_sale.id)}
+        downstream_ids = {item.id for item in ChainsStorage.get_downstream_transactions([harvest.id])}
+
+        # Assert
+        # The harvest is in the chain of every sale of the farmer, but was bought after the earlier sale
+        assert harvest.id in upstream_ids
+        assert earlier_sale.id not in downstream_ids
+
+    def test_notify_downstream_buyers(
+        self,
+        admin_client: AdminClient,
+        downstream: tuple[Transaction, list[Transaction], Transaction],
+        mocker: MockerFixture,
+    ) -> None:
+        # Arrange
+        admin = UserFactory.create(superuser=True)
+        harvest, _, _ = downstream
+
+        mock_notify = mocker.patch("whimo.contrib.admin.transactions.notify_downstream_buyers_task.delay")
+
+        admin_client.login(admin)
+
+        # Act
+        response = admin_client.post(
+            reverse(self.CHANGELIST_URL),
+            data={"action": "notify_downstream_buyers", "_selected_action": [str(harvest.pk)]},
+        )
+
+        # Assert
+        assert response.status_code == HTTPStatus.FOUND
+        mock_notify.assert_called_once_with(transaction_ids=[str(harvest.pk)])
+
+
+class TestTransactionsAdminChainGraph:
+    URL = "admin:db_transaction_download_chain_graph"
+
+    def test_download_chain_graph(self, admin_client: AdminClient) -> None:
+        # Arrange
+        # harvest -> farmer -> trader | unrelated
+        admin = UserFactory.create(superuser=True)
+        farmer, trader = UserFactory.create_batch(size=2)
+
+        harvest = TransactionFactory.create(producer=True, buyer=farmer)
+        trader_purchase = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=farmer,
+            buyer=trader,
+            commodity=harvest.commodity,
+            status=TransactionStatus.ACCEPTED,
+        )
+        TransactionFactory.create(producer=True)
+
+        admin_client.login(admin)
+
+        # Act
+        response = admin_client.get(reverse(self.URL, args=(trader_purchase.pk,)))
+        _, *rows = gzip.decompress(response.getvalue()).decode().splitlines()
+        tables = [json.loads(row) for row in rows]
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/gzip"
+        assert (
+            response["Content-Disposition"]
+            == f'attachment; filename="transaction_{trader_purchase.short_id}_chain.ndjson.gz"'
+        )
+        assert {row[1] for row in tables if row[0] == "nodes"} == {str(farmer.pk), str(trader.pk)}
+        assert {row[1] for row in tables if row[0] == "edges"} == {str(harvest.pk), str(trader_purchase.pk)}
@@ -0,0 +1,121 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from django.core.management import call_command
+from freezegun.api import FrozenDateTimeFactory
+
+from tests.factories.balances import BalanceFactory
+from tests.factories.commodities import CommodityFactory
+from tests.factories.transactions import TransactionFactory
+from tests.factories.users import UserFactory
+from tests.helpers.constants import DEFAULT_DATETIME
+from whimo.db.enums import TransactionStatus, TransactionType
+from whimo.db.enums.transactions import TransactionTraceability
+from whimo.db.models import Balance, Transaction
+
+pytestmark = [pytest.mark.django_db]
+
+
+class TestBackfillTraceabilityShares:
+    def test_replay_producer_sale_conversion(self, freezer: FrozenDateTimeFactory) -> None:
+        # Arrange
+        seller = UserFactory.create()
+        user = UserFactory.create()
+        beans = CommodityFactory.create(name="Cacao Beans")
+        oil = CommodityFactory.create(name="Cacao Oil")
+
+        def at(minutes: int) -> None:
+            freezer.move_to(DEFAULT_DATETIME + timedelta(minutes=minutes))
+
+        at(0)
+        full_harvest = TransactionFactory.create(
+            producer=True,
+            buyer=seller,
+            commodity=beans,
+            volume=Decimal("100"),
+            traceability=TransactionTraceability.FULL,
+        )
+        at(1)
+        partial_harvest = TransactionFactory.create(
+            producer=True,
+            buyer=seller,
+            commodity=beans,
+            volume=Decimal("300"),
+            traceability=TransactionTraceability.PARTIAL,
+        )
+        at(2)
+        sale = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=seller,
+            buyer=user,
+            commodity=beans,
+            volume=Decimal("80"),
+            status=TransactionStatus.ACCEPTED,
+        )
+        pending_sale = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=seller,
+            buyer=user,
+            commodity=beans,
+            volume=Decimal("10"),
+            status=TransactionStatus.PENDING,
+        )
+        at(3)
+        group_id = uuid4()
+        conversion_input = TransactionFactory.create(
+            type=TransactionType.CONVERSION,
+            seller=user,
+            buyer=None,
+            created_by=user,
+            commodity=beans,
+            volume=Decimal("-40"),
+            status=TransactionStatus.ACCEPTED,
+            group_id=group_id,
+        )
+        conversion_output = TransactionFactory.create(
+            type=TransactionType.CONVERSION,
+            seller=None,
+            buyer=user,
+            created_by=user,
+            commodity=oil,
+            volume=Decimal("20"),
+            status=TransactionStatus.ACCEPTED,
+            group_id=group_id,
+        )
+
+        seller_balance = BalanceFactory.create(user=seller, commodity=beans, volume=Decimal("320"))
+        beans_balance = BalanceFactory.create(user=user, commodity=beans, volume=Decimal("40"))
+        oil_balance = BalanceFactory.create(user=user, commodity=oil, volume=Decimal("20"))
+        other_balance = BalanceFactory.create(traceability_shares={"full": 1.0})
+
+        out = StringIO()
+
+        # Act
+        call_command("backfill_traceability_shares", "--batch-size", "2", stdout=out)
+
+        # Assert
+        sold_shares = {"full": 0.25, "partial": 0.75}
+
+        shares = dict(Transaction.objects.values_list("id", "traceability_shares"))
+        assert shares == {
+            full_harvest.id: {"full": 1.0},
+            partial_harvest.id: {"partial": 1.0},
+            sale.id: sold_shares,
+            pending_sale.id: None,
+            conversion_input.id: sold_shares,
+            conversion_output.id: sold_shares,
+        }
+
+        balance_shares = dict(Balance.objects.values_list("id", "traceability_shares"))
+        assert balance_shares == {
+            seller_balance.id: sold_shares,
+            beans_balance.id: sold_shares,
+            oil_balance.id: sold_shares,
+            # Balances without accepted transactions have no shares
+            other_balance.id: None,
+        }
+
+        assert out.getvalue() == "Replayed 3 balances\n"
@@ -2,11 +2,14 @@ from datetime import timedelta
 
 import pytest
 from freezegun.api import FrozenDateTimeFactory
+from pytest_django.fixtures import SettingsWrapper
 
+from tests.factories.notifications import NotificationFactory
 from tests.factories.users import GadgetFactory
 from tests.helpers.constants import DEFAULT_DATETIME
-from whimo.contrib.tasks.cleanup import cleanup_unverified_gadgets
-from whimo.db.models import Gadget
+from whimo.contrib.tasks.cleanup import archive_notifications, cleanup_unverified_gadgets
+from whimo.db.enums.notifications import NotificationStatus
+from whimo.db.models import ArchivedNotification, Gadget, Notification
 
 pytestmark = [pytest.mark.django_db]
 
@@ -59,3 +62,45 @@ class TestCleanupTasks:
         # Assert
         final_count = Gadget.objects.count()
         assert final_count == initial_count
+
+    def test_archive_expired_notifications(self, freezer: FrozenDateTimeFactory, settings: SettingsWrapper) -> None:
+        # Arrange
+        settings.NOTIFICATIONS_READ_RETENTION_DAYS = 30
+        settings.NOTIFICATIONS_RETENTION_DAYS = 180
+        settings.NOTIFICATIONS_ARCHIVE_BATCH_SIZE = 1
+
+        freezer.move_to(DEFAULT_DATETIME - timedelta(days=181))
+        old_pending_notification = NotificationFactory.create(status=NotificationStatus.PENDING)
+
+        freezer.move_to(DEFAULT_DATETIME - timedelta(days=31))
+        read_notification = NotificationFactory.create(status=NotificationStatus.PENDING)
+        read_notification.status = NotificationStatus.READ
+        read_notification.save()
+        pending_notification = NotificationFactory.create(status=NotificationStatus.PENDING)
+
+        freezer.move_to(DEFAULT_DATETIME - timedelta(days=29))
+        recent_read_notification = NotificationFactory.create(status=NotificationStatus.READ)
+
+        freezer.move_to(DEFAULT_DATETIME)
+
+        # Act
+        archive_notifications()
+
+        # Assert
+        remaining_ids = set(Notification.objects.values_list("id", flat=True))
+        assert remaining_ids == {pending_notification.id, recent_read_notification.id}
+
+        archived_notifications = ArchivedNotification.objects.in_bulk()
+        assert set(archived_notifications) == {old_pending_notification.id, read_notification.id}
+
+        archived_notification = archived_notifications[read_notification.id]
+        assert archived_notification.created_at == read_notification.created_at
+        assert archived_notification.status == NotificationStatus.READ
+        assert archived_notification.received_by_id == read_notification.received_by_id
+        assert [(record["history_type"], record["status"]) for record in archived_notification.history] == [
+            ("+", NotificationStatus.PENDING),
+            ("~", NotificationStatus.READ),
+        ]
+
+        # History moves to the archive, archiving itself is not recorded
+        assert not Notification.history.filter(id__in=archived_notifications).exists()
@@ -0,0 +1,175 @@
+import json
+from decimal import Decimal
+from typing import Callable, ContextManager
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_redis import get_redis_connection
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from tests.factories.balances import BalanceFactory
+from tests.factories.commodities import CommodityFactory
+from tests.factories.users import UserFactory
+from tests.helpers.utils import queries_to_str
+from whimo.contrib.tasks.history import write_historical_records
+from whimo.db.enums.history import HistoryPolicy
+from whimo.db.history import (
+    HISTORY_DEAD_LETTER_KEY,
+    HISTORY_QUEUE_KEY,
+    bulk_create_with_history,
+    bulk_update_with_history,
+    validate_history_policies,
+)
+from whimo.db.models import Balance
+
+pytestmark = [pytest.mark.django_db]
+
+CaptureOnCommitCallbacks = Callable[..., ContextManager[list[Callable[[], None]]]]
+
+
+class TestHistoryTasks:
+    def test_off_policy(self, settings: SettingsWrapper) -> None:
+        # Arrange
+        settings.HISTORY_POLICIES = {"db.Balance": HistoryPolicy.OFF}
+
+        # Act
+        balance = BalanceFactory.create()
+        balance.volume += 1
+        balance.save()
+
+        # Assert
+        assert not balance.history.exists()
+
+    def test_sampled_policy(self, settings: SettingsWrapper, mocker: MockerFixture) -> None:
+        # Arrange
+        settings.HISTORY_POLICIES = {"db.Balance": HistoryPolicy.SAMPLED}
+        mock_is_sampled = mocker.patch("whimo.db.history.is_sampled", return_value=False)
+
+        # Act
+        balance = BalanceFactory.create()
+        balance.volume += 1
+        balance.save()
+
+        mock_is_sampled.return_value = True
+        balance.volume += 1
+        balance.save()
+
+        # Assert
+        # Creations are always recorded, changes only when sampled
+        assert list(balance.history.order_by("history_date").values_list("history_type", "volume")) == [
+            ("+", balance.volume - 2),
+            ("~", balance.volume),
+        ]
+
+    def test_async_policy(
+        self, settings: SettingsWrapper, django_capture_on_commit_callbacks: CaptureOnCommitCallbacks
+    ) -> None:
+        # Arrange
+        settings.HISTORY_POLICIES = {"db.Balance": HistoryPolicy.ASYNC}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            balance = BalanceFactory.create(volume=Decimal("10.00"))
+            balance.volume = Decimal("12.50")
+            balance.save()
+
+        assert not balance.history.exists()
+
+        # Act
+        write_historical_records()
+
+        # Assert
+        assert list(balance.history.order_by("history_date").values_list("history_type", "volume")) == [
+            ("+", Decimal("10.00")),
+            ("~", Decimal("12.50")),
+        ]
+
+        # The queue is drained
+        write_historical_records()
+        assert balance.history.count() == 2  # noqa: PLR2004 Magic value used in comparison
+
+    @pytest.mark.parametrize(
+        "bad_record",
+        [
+            # Fails on insert
+            {"fields": {"volume": None}},
+            # Fails on deserialization
+            {"model": "db.missing"},
+        ],
+    )
+    def test_async_policy_bad_record(
+        self,
+        settings: SettingsWrapper,
+        django_capture_on_commit_callbacks: CaptureOnCommitCallbacks,
+        bad_record: dict,
+    ) -> None:
+        # Arrange
+        settings.HISTORY_POLICIES = {"db.Balance": HistoryPolicy.ASYNC}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            balance = BalanceFactory.create(volume=Decimal("10.00"))
+
+        redis = get_redis_connection()
+        record = json.loads(redis.lindex(HISTORY_QUEUE_KEY, 0))
+        bad_item = json.dumps({**record, **bad_record, "fields": {**record["fields"], **bad_record.get("fields", {})}})
+        redis.lpush(HISTORY_QUEUE_KEY, bad_item)
+
+        # Act
+        write_historical_records()
+
+        # Assert
+        # The record queued after the bad one is written, the bad one is parked
+        assert list(balance.history.values_list("history_type", "volume")) == [("+", Decimal("10.00"))]
+        assert redis.llen(HISTORY_QUEUE_KEY) == 0
+        assert [json.loads(item) for item in redis.lrange(HISTORY_DEAD_LETTER_KEY, 0, -1)] == [json.loads(bad_item)]
+
+    def test_bulk_history_single_insert(self) -> None:
+        # Arrange
+        balances = BalanceFactory.build_batch(3, user=UserFactory.create(), commodity=CommodityFactory.create())
+
+        # Act
+        with CaptureQueriesContext(connection) as create_queries:
+            bulk_create_with_history(balances, Balance)
+
+        for balance in balances:
+            balance.volume += 1
+
+        with CaptureQueriesContext(connection) as update_queries:
+            bulk_update_with_history(balances, Balance, ["volume"])
+
+        # Assert
+        for balance in balances:
+            assert list(balance.history.order_by("history_date").values_list("history_type", "volume")) == [
+                ("+", balance.volume - 1),
+                ("~", balance.volume),
+            ]
+
+        # Queries:
+        # 1. insert or update balances
+        # 2. insert historical records
+        assert len(create_queries) == 2, queries_to_str(create_queries)  # noqa: PLR2004 Magic value used in comparison
+        assert len(update_queries) == 2, queries_to_str(update_queries)  # noqa: PLR2004 Magic value used in comparison
+
+    @pytest.mark.parametrize(
+        ("policies", "message"),
+        [
+            ({"db.Balance": "never"}, "never policy of db.Balance is not one of sync, sampled, async, off"),
+            ({"db.Missing": HistoryPolicy.OFF}, "db.Missing is not a model with history"),
+        ],
+    )
+    def test_invalid_policies(self, settings: SettingsWrapper, policies: dict[str, str], message: str) -> None:
+        # Arrange
+        settings.HISTORY_POLICIES = policies
+
+        # Act & Assert
+        with pytest.raises(ImproperlyConfigured, match=message):
+            validate_history_policies()
+
+    def test_valid_policies(self, settings: SettingsWrapper) -> None:
+        # Arrange
+        settings.HISTORY_POLICIES = {"db.Balance": HistoryPolicy.ASYNC, "db.Notification": HistoryPolicy.OFF}
+
+        # Act & Assert
+        validate_history_policies()
@@ -3,10 +3,15 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
 
+from tests.factories.notifications import NotificationFactory
 from tests.factories.users import UserFactory
-from whimo.contrib.tasks.notifications import send_apns_push, send_gcm_push
+from tests.helpers.utils import queries_to_str
+from whimo.contrib.tasks.notifications import get_firebase_app, send_apns_push, send_gcm_push
 from whimo.db.enums.notifications import NotificationStatus, NotificationType
 
 pytestmark = [pytest.mark.django_db]
@@ -95,89 +100,143 @@ class TestNotificationTasks:
         assert result is None
         mock_apns_device.objects.filter.assert_not_called()
 
-    # TODO: Uncomment when IOS app is ready
-    # @patch("whimo.contrib.tasks.notifications.APNSDevice")
-    # @patch("whimo.contrib.tasks.notifications.NotificationSettings")
-    # @patch("whimo.contrib.tasks.notifications.Notification")
-    # def test_send_apns_push_with_badge_count_zero(
-    #     self, mock_notification: MagicMock, mock_settings: MagicMock, mock_apns_device: MagicMock
-    # ) -> None:
-    #     user = UserFactory.create()
-    #     notification_data: dict[str, Any] = {
-    #         "id": str(uuid4()),
-    #         "created_at": timezone.now().isoformat(),
-    #         "type": NotificationType.GEODATA_MISSING.value,
-    #         "status": NotificationStatus.PENDING.value,
-    #         "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
-    #         "created_by": None,
-    #         "data": {},
-    #     }
-    #     mock_settings.objects.filter.return_value.exists.return_value = True
-    #     mock_notification.objects.filter.return_value.count.return_value = 0
-    #     mock_device = MagicMock()
-    #     mock_apns_device.objects.filter.return_value = [mock_device]
-    #
-    #     send_apns_push(notification_data)
-    #
-    #     mock_device.send_message.assert_called_once()
-    #     call_kwargs = mock_device.send_message.call_args[1]
-    #     assert call_kwargs["badge"] == 0
-    #     assert call_kwargs["mutable_content"] is True
-    #
-    # @patch("whimo.contrib.tasks.notifications.APNSDevice")
-    # @patch("whimo.contrib.tasks.notifications.NotificationSettings")
-    # @patch("whimo.contrib.tasks.notifications.Notification")
-    # def test_send_apns_push_with_badge_count_multiple(
-    #     self, mock_notification: MagicMock, mock_settings: MagicMock, mock_apns_device: MagicMock
-    # ) -> None:
-    #     user = UserFactory.create()
-    #     notification_data: dict[str, Any] = {
-    #         "id": str(uuid4()),
-    #         "created_at": timezone.now().isoformat(),
-    #         "type": NotificationType.GEODATA_MISSING.value,
-    #         "status": NotificationStatus.PENDING.value,
-    #         "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
-    #         "created_by": None,
-    #         "data": {},
-    #     }
-    #     mock_settings.objects.filter.return_value.exists.return_value = True
-    #     mock_notification.objects.filter.return_value.count.return_value = 5
-    #     mock_device = MagicMock()
-    #     mock_apns_device.objects.filter.return_value = [mock_device]
-    #
-    #     send_apns_push(notification_data)
-    #
-    #     mock_device.send_message.assert_called_once()
-    #     call_kwargs = mock_device.send_message.call_args[1]
-    #     assert call_kwargs["badge"] == 5
-    #     assert call_kwargs["mutable_content"] is True
-    #
-    # @patch("whimo.contrib.tasks.notifications.APNSDevice")
-    # @patch("whimo.contrib.tasks.notifications.NotificationSettings")
-    # @patch("whimo.contrib.tasks.notifications.Notification")
-    # def test_send_apns_push_badge_filters_by_user_and_pending_status(
-    #     self, mock_notification: MagicMock, mock_settings: MagicMock, mock_apns_device: MagicMock
-    # ) -> None:
-    #     user = UserFactory.create()
-    #     notification_data: dict[str, Any] = {
-    #         "id": str(uuid4()),
-    #         "created_at": timezone.now().isoformat(),
-    #         "type": NotificationType.GEODATA_MISSING.value,
-    #         "status": NotificationStatus.PENDING.value,
-    #         "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
-    #         "created_by": None,
-    #         "data": {},
-    #     }
-    #     mock_settings.objects.filter.return_value.exists.return_value = True
-    #     mock_notification.objects.filter.return_value.count.return_value = 3
-    #     mock_device = MagicMock()
-    #     mock_apns_device.objects.filter.return_value = [mock_device]
-    #
-    #     send_apns_push(notification_data)
-    #
-    #     mock_notification.objects.filter.assert_called_once_with(
-    #         received_by_id=user.id, status=NotificationStatus.PENDING
-    #     )
-    #     mock_device.send_message.assert_called_once()
-    #     call_kwargs = mock_device.send_message.call_args[1]
-    #     assert call_kwargs["badge"] == 3
+    @patch("whimo.contrib.tasks.notifications.firebase_admin")
+    @patch("whimo.contrib.tasks.notifications.GCMDevice")
+    @patch("whimo.contrib.tasks.notifications.NotificationSettings")
+    def test_send_gcm_push_initializes_firebase_once(
+        self,
+        mock_settings: MagicMock,
+        mock_gcm_device: MagicMock,
+        mock_firebase_admin: MagicMock,
+        settings: SettingsWrapper,
+    ) -> None:
+        # Arrange
+        settings.PUSH_NOTIFICATIONS_FCM_ENABLED = True
+        get_firebase_app.cache_clear()
+        user = UserFactory.create()
+        notification_data: dict[str, Any] = {
+            "id": str(uuid4()),
+            "created_at": timezone.now().isoformat(),
+            "type": NotificationType.GEODATA_MISSING.value,
+            "status": NotificationStatus.PENDING.value,
+            "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
+            "created_by": None,
+            "data": {},
+        }
+        mock_settings.objects.filter.return_value.exists.return_value = True
+        mock_device = MagicMock()
+        mock_gcm_device.objects.filter.return_value = [mock_device]
+        mock_firebase_admin.get_app.side_effect = ValueError
+
+        # Act
+        send_gcm_push(notification_data)
+        send_gcm_push(notification_data)
+
+        # Assert
+        mock_firebase_admin.initialize_app.assert_called_once()
+        assert mock_device.send_message.call_count == 2  # noqa: PLR2004 Magic value used in comparison
+        get_firebase_app.cache_clear()
+
+    @patch("whimo.contrib.tasks.notifications.firebase_admin")
+    @patch("whimo.contrib.tasks.notifications.GCMDevice")
+    @patch("whimo.contrib.tasks.notifications.NotificationSettings")
+    def test_send_gcm_push_without_devices_skips_firebase(
+        self,
+        mock_settings: MagicMock,
+        mock_gcm_device: MagicMock,
+        mock_firebase_admin: MagicMock,
+        settings: SettingsWrapper,
+    ) -> None:
+        # Arrange
+        settings.PUSH_NOTIFICATIONS_FCM_ENABLED = True
+        get_firebase_app.cache_clear()
+        user = UserFactory.create()
+        notification_data: dict[str, Any] = {
+            "id": str(uuid4()),
+            "created_at": timezone.now().isoformat(),
+            "type": NotificationType.GEODATA_MISSING.value,
+            "status": NotificationStatus.PENDING.value,
+            "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
+            "created_by": None,
+            "data": {},
+        }
+        mock_settings.objects.filter.return_value.exists.return_value = True
+        mock_gcm_device.objects.filter.return_value = []
+
+        # Act
+        send_gcm_push(notification_data)
+
+        # Assert
+        mock_firebase_admin.get_app.assert_not_called()
+        mock_firebase_admin.initialize_app.assert_not_called()
+
+    @patch("whimo.contrib.tasks.notifications.firebase_admin")
+    @patch("whimo.contrib.tasks.notifications.GCMDevice")
+    @patch("whimo.contrib.tasks.notifications.NotificationSettings")
+    def test_send_gcm_push_fcm_disabled_skips_firebase(
+        self,
+        mock_settings: MagicMock,
+        mock_gcm_device: MagicMock,
+        mock_firebase_admin: MagicMock,
+        settings: SettingsWrapper,
+    ) -> None:
+        # Arrange
+        settings.PUSH_NOTIFICATIONS_FCM_ENABLED = False
+        get_firebase_app.cache_clear()
+        user = UserFactory.create()
+        notification_data: dict[str, Any] = {
+            "id": str(uuid4()),
+            "created_at": timezone.now().isoformat(),
+            "type": NotificationType.GEODATA_MISSING.value,
+            "status": NotificationStatus.PENDING.value,
+            "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
+            "created_by": None,
+            "data": {},
+        }
+        mock_settings.objects.filter.return_value.exists.return_value = True
+        mock_device = MagicMock()
+        mock_gcm_device.objects.filter.return_value = [mock_device]
+
+        # Act
+        send_gcm_push(notification_data)
+
+        # Assert
+        mock_firebase_admin.get_app.assert_not_called()
+        mock_firebase_admin.initialize_app.assert_not_called()
+        mock_device.send_message.assert_called_once()
+
+    @patch("whimo.contrib.tasks.notifications.APNSDevice")
+    @patch("whimo.contrib.tasks.notifications.NotificationSettings")
+    def test_send_apns_push_with_badge_count(self, mock_settings: MagicMock, mock_apns_device: MagicMock) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create_batch(size=3, received_by=user, status=NotificationStatus.PENDING)
+        NotificationFactory.create(received_by=user, status=NotificationStatus.READ)
+        NotificationFactory.create(status=NotificationStatus.PENDING)
+
+        notification_data: dict[str, Any] = {
+            "id": str(uuid4()),
+            "created_at": timezone.now().isoformat(),
+            "type": NotificationType.GEODATA_MISSING.value,
+            "status": NotificationStatus.PENDING.value,
+            "received_by": {"id": str(user.id), "username": user.username, "gadgets": []},
+            "created_by": None,
+            "data": {},
+        }
+        mock_settings.objects.filter.return_value.exists.return_value = True
+        mock_device = MagicMock()
+        mock_apns_device.objects.filter.return_value = [mock_device]
+
+        # Act
+        send_apns_push(notification_data)
+        with CaptureQueriesContext(connection) as queries:
+            send_apns_push(notification_data)
+
+        # Assert
+        assert mock_device.send_message.call_count == 2  # noqa: PLR2004 Magic value used in comparison
+        call_kwargs = mock_device.send_message.call_args[1]
+        assert call_kwargs["badge"] == 3  # noqa: PLR2004 Magic value used in comparison
+        assert call_kwargs["mutable_content"] is True
+
+        # Counters are loaded once, then read from Redis
+        assert len(queries) == 0, queries_to_str(queries)
@@ -0,0 +1,89 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from freezegun.api import FrozenDateTimeFactory
+
+from tests.factories.transactions import TransactionFactory
+from tests.helpers.constants import DEFAULT_DATETIME
+from whimo.contrib.tasks.partitions import PARTITIONS_MONTHS_AHEAD, create_partitions
+from whimo.db.models import Transaction
+from whimo.db.partitioning import (
+    PARTITIONED_TABLES,
+    add_months,
+    create_partition,
+    get_month_start,
+    get_partitions,
+    is_partitioned,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+TRANSACTIONS, _, NOTIFICATIONS, _ = PARTITIONED_TABLES
+
+
+class TestPartitionsTasks:
+    @staticmethod
+    def _get_table_of(transaction: Transaction) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT tableoid::regclass::text FROM transactions WHERE id = %s", [transaction.id])
+            return str(cursor.fetchone()[0])
+
+    def test_tables_partitioned(self) -> None:
+        # Act & Assert
+        assert all(is_partitioned(connection, table) for table in PARTITIONED_TABLES)
+
+    def test_create_partitions_task(self, freezer: FrozenDateTimeFactory) -> None:
+        # Arrange
+        freezer.move_to(DEFAULT_DATETIME)
+        current_month = get_month_start(timezone.localdate())
+
+        transaction = TransactionFactory.create()
+        assert self._get_table_of(transaction) == TRANSACTIONS.default_partition
+
+        # Act
+        create_partitions()
+        create_partitions()
+
+        # Assert
+        for table in PARTITIONED_TABLES:
+            assert set(get_partitions(connection, table)) == {
+                add_months(current_month, offset) for offset in range(PARTITIONS_MONTHS_AHEAD + 1)
+            }
+
+        # Rows of the new partitions are moved out of the default one
+        assert self._get_table_of(transaction) == TRANSACTIONS.get_partition_name(current_month)
+        assert Transaction.objects.get(pk=transaction.pk) == transaction
+
+        # New rows are inserted into the partition of their month
+        new_transaction = TransactionFactory.create()
+        assert self._get_table_of(new_transaction) == TRANSACTIONS.get_partition_name(current_month)
+
+    def test_manage_partitions_detaches_old_partitions(self, freezer: FrozenDateTimeFactory) -> None:
+        # Arrange
+        freezer.move_to(DEFAULT_DATETIME)
+        current_month = get_month_start(timezone.localdate())
+        old_month = add_months(current_month, -13)
+        kept_month = add_months(current_month, -12)
+
+        for table in (TRANSACTIONS, NOTIFICATIONS):
+            create_partition(connection, table, old_month)
+            create_partition(connection, table, kept_month)
+
+        # Act
+        call_command("manage_partitions", months_ahead=0, retention_months=12, stdout=StringIO())
+
+        # Assert
+        partitions = get_partitions(connection, NOTIFICATIONS)
+        assert old_month not in partitions
+        assert {kept_month, current_month} <= set(partitions)
+
+        # Detached partitions are kept as standalone tables
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [NOTIFICATIONS.get_partition_name(old_month)])
+            assert cursor.fetchone()[0]
+
+        # Transactions are never detached, chains are built from all of them
+        assert {old_month, kept_month, current_month} <= set(get_partitions(connection, TRANSACTIONS))
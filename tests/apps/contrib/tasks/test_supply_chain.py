@@ -0,0 +1,131 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from whimo.contrib.supply_chain import generate_supply_chain
+from whimo.db.enums import TransactionStatus, TransactionType
+from whimo.db.models import Gadget, Transaction, User
+from whimo.db.storages import ChainsStorage
+
+pytestmark = [pytest.mark.django_db]
+
+
+class TestSupplyChain:
+    def test_generate_supply_chain(self) -> None:
+        # Act
+        supply_chain = generate_supply_chain(depth=2, fan_in=2, users=7, conversions=1, seed=1)
+
+        # Assert
+        assert [len(tier) for tier in supply_chain.tiers] == [4, 2, 1]
+        assert len(supply_chain.harvests) == 4  # noqa: PLR2004
+        assert {item.status for item in supply_chain.transactions} == {TransactionStatus.ACCEPTED}
+        assert Gadget.objects.filter(user__in=supply_chain.users, is_verified=True).count() == 7  # noqa: PLR2004
+
+        conversions = [item for item in supply_chain.transactions if item.type == TransactionType.CONVERSION]
+        assert len(conversions) == 2  # noqa: PLR2004
+
+        tip = supply_chain.tips[0]
+        assert tip.buyer_id == supply_chain.tiers[-1][0].pk
+
+        # Tiers are dated after the previous ones
+        created_at = dict(Transaction.objects.values_list("id", "created_at"))
+        assert max(created_at[item.pk] for item in supply_chain.harvests) <= min(
+            created_at[item.pk] for item in supply_chain.tips
+        )
+
+        summary = ChainsStorage.load_summary(tip.pk)
+        assert set(summary.first_transaction_ids) & {item.pk for item in supply_chain.harvests}
+
+    def test_generate_supply_chain_seed(self) -> None:
+        # Act
+        first = generate_supply_chain(depth=2, fan_in=2, users=7, seed=1)
+        second = generate_supply_chain(depth=2, fan_in=2, users=7, seed=1)
+
+        # Assert
+        assert [item.volume for item in first.transactions] == [item.volume for item in second.transactions]
+
+
+class TestSeedSupplyChain:
+    def test_seed(self) -> None:
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command("seed_supply_chain", "--depth=2", "--fan-in=2", "--users=7", "--conversions=0", stdout=stdout)
+
+        # Assert
+        assert User.objects.count() == 7  # noqa: PLR2004
+        assert Transaction.objects.filter(type=TransactionType.PRODUCER).count() == 4  # noqa: PLR2004
+        assert "Seeded 7 users in tiers of [4, 2, 1]" in stdout.getvalue()
+        assert "Deepest chain" in stdout.getvalue()
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            ["--depth=0"],
+            ["--fan-in=0"],
+            ["--depth=4", "--users=4"],
+        ],
+    )
+    def test_invalid_options(self, arguments: list[str]) -> None:
+        # Act & Assert
+        with pytest.raises(CommandError):
+            call_command("seed_supply_chain", *arguments)
+
+        assert not User.objects.exists()
+
+
+class TestBenchmarkHotPaths:
+    SCENARIOS = ("transactions list", "traceability counts", "downstream", "accept")
+
+    def test_benchmark(self, tmp_path: Path) -> None:
+        # Arrange
+        output = tmp_path / "results.json"
+        stdout = StringIO()
+
+        # Act
+        call_command(
+            "benchmark_hot_paths",
+            "--depth=2",
+            "--fan-in=2",
+            "--users=7",
+            "--repeat=2",
+            "--only",
+            *self.SCENARIOS,
+            f"--output={output}",
+            stdout=stdout,
+        )
+
+        # Assert
+        results = json.loads(output.read_text())["results"]
+        assert set(results) == set(self.SCENARIOS)
+        assert all(result["runs"] == 2 and result["queries"] > 0 for result in results.values())  # noqa: PLR2004
+
+        # The seeded supply chain is rolled back
+        assert not User.objects.exists()
+        assert not Transaction.objects.exists()
+
+    def test_max_regression(self, tmp_path: Path) -> None:
+        # Arrange
+        baseline = tmp_path / "baseline.json"
+        result = {"median_ms": 0.001, "p95_ms": 0.001, "best_ms": 0.001, "queries": 0, "storage_calls": 0}
+        baseline.write_text(json.dumps({"results": {"downstream": result}}))
+        stdout = StringIO()
+
+        # Act & Assert
+        with pytest.raises(CommandError, match="Slower by more than 0.0%: downstream"):
+            call_command(
+                "benchmark_hot_paths",
+                "--depth=1",
+                "--users=2",
+                "--repeat=1",
+                "--only=downstream",
+                f"--compare={baseline}",
+                "--max-regression=0",
+                stdout=stdout,
+            )
+
+        assert "vs 0.00 ms" in stdout.getvalue()
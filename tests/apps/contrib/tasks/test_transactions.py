@@ -8,8 +8,8 @@ from pytest_mock import MockerFixture
 from tests.factories.transactions import TransactionFactory
 from tests.factories.users import UserFactory
 from tests.helpers.constants import DEFAULT_DATETIME
-from whimo.contrib.tasks.transactions import expire_transactions
-from whimo.db.enums import TransactionStatus
+from whimo.contrib.tasks.transactions import expire_transactions, notify_downstream_buyers
+from whimo.db.enums import GadgetType, TransactionStatus, TransactionType
 from whimo.db.models import Notification, Transaction
 
 pytestmark = [pytest.mark.django_db]
@@ -112,3 +112,29 @@ class TestTransactionsTasks:
         assert Notification.objects.count() == 0
 
         mock_send_push.assert_not_called()
+
+    def test_notify_downstream_buyers_task(self, mocker: MockerFixture) -> None:
+        # Arrange
+        # harvest -> farmer -> trader -> buyer
+        farmer, trader, buyer = UserFactory.create_batch(size=3)
+
+        harvest = TransactionFactory.create(producer=True, buyer=farmer)
+        TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM, seller=farmer, buyer=trader, status=TransactionStatus.ACCEPTED
+        )
+        TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM, seller=trader, buyer=buyer, status=TransactionStatus.ACCEPTED
+        )
+
+        mock_send_email = mocker.patch("whimo.transactions.services.send_email.delay")
+        mock_send_sms = mocker.patch("whimo.transactions.services.send_sms.delay")
+
+        # Act
+        notify_downstream_buyers(transaction_ids=[str(harvest.pk)])
+
+        # Assert
+        buyers = [farmer, trader, buyer]
+        assert sorted(call.kwargs["recipients"][0] for call in mock_send_email.call_args_list) == sorted(
+            gadget.identifier for user in buyers for gadget in user.gadgets.filter(type=GadgetType.EMAIL)
+        )
+        assert mock_send_sms.call_count == len(buyers)
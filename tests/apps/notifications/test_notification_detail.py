@@ -55,12 +55,11 @@ class TestNotificationDetail:
         assert data_response.data.created_by.id == notification.created_by_id
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select notification
-        # 4. select received_by gadgets
-        # 5. select created_by gadgets
-        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select notification
+        # 3. select received_by gadgets
+        # 4. select created_by gadgets
+        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_with_different_notification_types(
         self,
@@ -0,0 +1,90 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from freezegun.api import FrozenDateTimeFactory
+from pytest_django.fixtures import SettingsWrapper
+
+from tests.factories.notifications import NotificationFactory
+from tests.factories.users import UserFactory
+from tests.helpers.clients import APIClient
+from tests.helpers.constants import DEFAULT_DATETIME, MEDIUM_BATCH_SIZE, SMALL_BATCH_SIZE
+from tests.helpers.utils import queries_to_str
+from whimo.common.schemas.base import PaginatedDataResponse
+from whimo.db.enums.notifications import NotificationStatus
+from whimo.notifications.schemas.dto import NotificationDTO
+from whimo.notifications.services.notifications import NotificationsService
+
+pytestmark = [pytest.mark.django_db]
+
+
+class TestNotificationsArchiveList:
+    URL = reverse("notifications_archive_list")
+
+    def test_success(self, client: APIClient, freezer: FrozenDateTimeFactory, settings: SettingsWrapper) -> None:
+        # Arrange
+        freezer.move_to(DEFAULT_DATETIME)
+
+        user = UserFactory.create()
+        notifications = NotificationFactory.create_batch(
+            size=SMALL_BATCH_SIZE, received_by=user, status=NotificationStatus.READ
+        )
+        NotificationFactory.create_batch(size=SMALL_BATCH_SIZE, status=NotificationStatus.READ)
+
+        freezer.move_to(DEFAULT_DATETIME + timedelta(days=settings.NOTIFICATIONS_READ_RETENTION_DAYS + 1))
+        NotificationsService.archive_notifications(batch_size=MEDIUM_BATCH_SIZE)
+
+        client.login(user)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[NotificationDTO]](**response_json)
+        assert {notification.id for notification in data_response.data} == {
+            notification.id for notification in notifications
+        }
+        assert all(notification.created_at == DEFAULT_DATETIME for notification in data_response.data)
+
+        # Queries:
+        # 1. select user auth state
+        # 2. select count
+        # 3. select entities
+        # 4. prefetch received_by gadgets
+        # 5. prefetch created_by gadgets
+        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+
+    def test_archived_not_listed(
+        self, client: APIClient, freezer: FrozenDateTimeFactory, settings: SettingsWrapper
+    ) -> None:
+        # Arrange
+        freezer.move_to(DEFAULT_DATETIME)
+
+        user = UserFactory.create()
+        NotificationFactory.create(received_by=user, status=NotificationStatus.READ)
+        pending_notification = NotificationFactory.create(received_by=user, status=NotificationStatus.PENDING)
+
+        client.login(user)
+        etag = client.get(path=reverse("notifications_list")).headers["ETag"]
+
+        freezer.move_to(DEFAULT_DATETIME + timedelta(days=settings.NOTIFICATIONS_READ_RETENTION_DAYS + 1))
+        NotificationsService.archive_notifications(batch_size=MEDIUM_BATCH_SIZE)
+        # The token issued before expired meanwhile
+        client.login(user)
+
+        # Act
+        response = client.get(path=reverse("notifications_list"), headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[NotificationDTO]](**response_json)
+        assert [notification.id for notification in data_response.data] == [pending_notification.id]
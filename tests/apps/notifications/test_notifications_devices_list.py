@@ -43,11 +43,10 @@ class TestNotificationDevicesList:
         assert devices_ids == response_ids
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select gcm devices
-        # 4. select apns devices
-        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select gcm devices
+        # 3. select apns devices
+        assert len(queries) == 3, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_unauthorized(self, client: APIClient, snapshot: SnapshotAssertion) -> None:
         # Act
@@ -13,15 +13,20 @@ from freezegun.api import FrozenDateTimeFactory
 from pytest_mock import MockerFixture
 from syrupy import SnapshotAssertion
 
+from tests.factories.commodities import CommodityFactory
 from tests.factories.notifications import NotificationFactory
+from tests.factories.transactions import TransactionFactory
 from tests.factories.users import UserFactory
 from tests.helpers.clients import APIClient
 from tests.helpers.constants import DEFAULT_DATETIME, MEDIUM_BATCH_SIZE, SMALL_BATCH_SIZE
 from tests.helpers.utils import queries_to_str
 from whimo.common.schemas.base import PaginatedDataResponse
+from whimo.db.enums import TransactionAction
 from whimo.db.enums.notifications import NotificationStatus, NotificationType
-from whimo.notifications.schemas.dto import NotificationDTO
+from whimo.notifications.schemas.dto import NotificationDTO, NotificationTransactionDTO
+from whimo.notifications.services.notifications import NotificationsService
 from whimo.notifications.services.notifications_push import NotificationsPushService
+from whimo.transactions.schemas.dto import TransactionDTO
 
 pytestmark = [pytest.mark.django_db]
 
@@ -56,13 +61,12 @@ class TestNotificationsList:
         assert response_notification_ids == notification_ids
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select count
-        # 4. select entities
-        # 5. prefetch received_by gadgets
-        # 6. prefetch created_by gadgets
-        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select count
+        # 3. select entities
+        # 4. prefetch received_by gadgets
+        # 5. prefetch created_by gadgets
+        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_search_by_type(
         self,
@@ -93,6 +97,40 @@ class TestNotificationsList:
         assert len(data_response.data) == 1
         assert data_response.data[0].id == notification.id
 
+    def test_search_by_transaction(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        seller = UserFactory.create(username="cacao-trader")
+        commodity = CommodityFactory.create(name="Arabica Coffee")
+
+        seller_transaction, commodity_transaction, other_transaction = [
+            TransactionFactory.create(buyer=user, seller=seller),
+            TransactionFactory.create(buyer=user, commodity=commodity),
+            TransactionFactory.create(buyer=user),
+        ]
+        notifications = [
+            NotificationsService.create_from_transaction(
+                notification_type=NotificationType.TRANSACTION_PENDING,
+                transaction=transaction,
+                received_by_id=user.id,
+            )
+            for transaction in (seller_transaction, commodity_transaction, other_transaction)
+        ]
+
+        client.login(user)
+
+        # Act
+        responses = [client.get(path=self.URL, data={"search": search}) for search in ("CACAO-TRADER", "arabica")]
+
+        # Assert
+        found_ids = []
+        for response in responses:
+            response_json = response.json()
+            assert response.status_code == HTTPStatus.OK, response_json
+            found_ids.append([item.id for item in PaginatedDataResponse[list[NotificationDTO]](**response_json).data])
+
+        assert found_ids == [[notifications[0].id], [notifications[1].id]]
+
     def test_search_by_data(
         self,
         client: APIClient,
@@ -343,6 +381,51 @@ class TestNotificationsList:
         expected_items_count = min(page_size, remaining_items)
         assert len(data_response.data) == expected_items_count
 
+    def test_transaction_data_expanded(self, client: APIClient, freezer: FrozenDateTimeFactory) -> None:
+        # Arrange
+        freezer.move_to(DEFAULT_DATETIME)
+
+        user = UserFactory.create()
+        transactions = TransactionFactory.create_batch(size=SMALL_BATCH_SIZE, buyer=user)
+        notifications = [
+            NotificationsService.create_from_transaction(
+                notification_type=NotificationType.TRANSACTION_PENDING,
+                transaction=transaction,
+                received_by_id=user.id,
+                created_by_id=user.id,
+            )
+            for transaction in transactions
+        ]
+
+        client.login(user)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        # Only the compact transaction is stored
+        for notification in notifications:
+            assert notification.data
+            assert set(notification.data["transaction"]) == set(NotificationTransactionDTO.model_fields)
+
+        data_response = PaginatedDataResponse[list[NotificationDTO]](**response_json)
+        response_transactions = [TransactionDTO(**item.data["transaction"]) for item in data_response.data if item.data]
+        assert {item.id for item in response_transactions} == {transaction.id for transaction in transactions}
+        assert all(transaction.action == TransactionAction.BUYING for transaction in response_transactions)
+
+        # Queries:
+        # 1. select user auth state
+        # 2. select count
+        # 3. select entities
+        # 4. prefetch received_by gadgets
+        # 5. prefetch created_by gadgets
+        # 6. select transactions
+        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+
     def test_empty_result(self, client: APIClient, freezer: FrozenDateTimeFactory, snapshot: SnapshotAssertion) -> None:
         # Arrange
         freezer.move_to(DEFAULT_DATETIME)
@@ -397,6 +480,45 @@ class TestNotificationsList:
         assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
         assert response_json == snapshot
 
+    def test_not_modified(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create_batch(size=SMALL_BATCH_SIZE, received_by=user)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+
+        # No queries: the auth state is cached by the first request
+        assert not queries, queries_to_str(queries)
+
+    def test_modified_after_notification_created(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create_batch(size=SMALL_BATCH_SIZE, received_by=user)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        NotificationFactory.create(received_by=user)
+
+        # Act
+        response = client.get(path=self.URL, headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[NotificationDTO]](**response_json)
+        assert len(data_response.data) == SMALL_BATCH_SIZE + 1
+
 
 class TestNotificationsPushService:
     def test_send_push_empty_notifications(self) -> None:
@@ -6,7 +6,7 @@ from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from syrupy import SnapshotAssertion
 
-from tests.factories.users import UserFactory
+from tests.factories.users import GadgetFactory, UserFactory
 from tests.helpers.clients import APIClient
 from tests.helpers.utils import queries_to_str
 from whimo.common.schemas.base import DataResponse
@@ -40,10 +40,9 @@ class TestNotificationSettingsList:
         assert response_types == notification_types
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select settings
-        assert len(queries) == 3, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select settings
+        assert len(queries) == 2, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_unauthorized(self, client: APIClient, snapshot: SnapshotAssertion) -> None:
         # Act
@@ -79,3 +78,21 @@ class TestNotificationSettingsList:
         # Assert
         assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
         assert response_json == snapshot
+
+    def test_forbidden_after_gadget_unverified(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create(with_gadgets=False)
+        gadget = GadgetFactory.create(user=user, email=True, is_verified=True)
+
+        client.login(user)
+        client.get(path=self.URL)
+
+        gadget.is_verified = False
+        gadget.save()
+
+        # Act
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.FORBIDDEN, response_json
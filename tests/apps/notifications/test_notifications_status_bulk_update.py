@@ -0,0 +1,179 @@
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Callable, ContextManager
+
+import pytest
+from django.urls import reverse
+from freezegun.api import FrozenDateTimeFactory
+
+from tests.factories.notifications import NotificationFactory
+from tests.factories.users import UserFactory
+from tests.helpers.clients import APIClient
+from tests.helpers.constants import DEFAULT_DATETIME, SMALL_BATCH_SIZE
+from whimo.common.schemas.base import DataResponse
+from whimo.db.enums.notifications import NotificationStatus, NotificationType
+from whimo.db.models import Notification
+from whimo.notifications.schemas.dto import NotificationSummaryDTO
+
+pytestmark = [pytest.mark.django_db]
+
+CaptureOnCommitCallbacks = Callable[..., ContextManager[list[Callable[[], None]]]]
+
+
+class TestNotificationsStatusBulkUpdate:
+    URL = reverse("notifications_status_bulk_update")
+
+    def test_mark_all_as_read(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        notifications = NotificationFactory.create_batch(
+            size=SMALL_BATCH_SIZE, received_by=user, status=NotificationStatus.PENDING
+        )
+        other_notification = NotificationFactory.create(status=NotificationStatus.PENDING)
+
+        client.login(user)
+
+        # Act
+        response = client.patch(path=self.URL, data={"status": NotificationStatus.READ})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        for notification in notifications:
+            notification.refresh_from_db()
+            assert notification.status == NotificationStatus.READ
+            history = notification.history.order_by("history_date").values_list(
+                "history_type", "status", "history_user_id"
+            )
+            assert list(history) == [
+                ("+", NotificationStatus.PENDING, None),
+                ("~", NotificationStatus.READ, user.id),
+            ]
+
+        other_notification.refresh_from_db()
+        assert other_notification.status == NotificationStatus.PENDING
+
+    def test_counters_and_etag_updated(
+        self, client: APIClient, django_capture_on_commit_callbacks: CaptureOnCommitCallbacks
+    ) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create(
+            received_by=user, type=NotificationType.GEODATA_MISSING, status=NotificationStatus.PENDING
+        )
+        NotificationFactory.create(
+            received_by=user, type=NotificationType.TRANSACTION_PENDING, status=NotificationStatus.PENDING
+        )
+
+        client.login(user)
+        etag = client.get(path=reverse("notifications_list")).headers["ETag"]
+        client.get(path=reverse("notifications_summary"))
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.patch(
+                path=self.URL,
+                data={"status": NotificationStatus.READ, "types": [NotificationType.GEODATA_MISSING]},
+                format="json",
+            )
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        response = client.get(path=reverse("notifications_summary"))
+        summary = DataResponse[NotificationSummaryDTO](**response.json()).data
+        assert summary.pending == 1
+        assert summary.pending_by_type[NotificationType.GEODATA_MISSING] == 0
+        assert summary.pending_by_type[NotificationType.TRANSACTION_PENDING] == 1
+
+        response = client.get(path=reverse("notifications_list"), headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.OK, response.json()
+        assert response.headers["ETag"] != etag
+
+    def test_by_ids(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        notification, kept_notification = NotificationFactory.create_batch(
+            size=2, received_by=user, status=NotificationStatus.PENDING
+        )
+        other_notification = NotificationFactory.create(status=NotificationStatus.PENDING)
+
+        client.login(user)
+
+        # Act
+        response = client.patch(
+            path=self.URL,
+            data={"status": NotificationStatus.READ, "ids": [str(notification.id), str(other_notification.id)]},
+            format="json",
+        )
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        statuses = dict(Notification.objects.values_list("id", "status"))
+        assert statuses == {
+            notification.id: NotificationStatus.READ,
+            kept_notification.id: NotificationStatus.PENDING,
+            other_notification.id: NotificationStatus.PENDING,
+        }
+
+    def test_by_filter(self, client: APIClient, freezer: FrozenDateTimeFactory) -> None:
+        # Arrange
+        user = UserFactory.create()
+
+        freezer.move_to(DEFAULT_DATETIME - timedelta(days=2))
+        old_notification = NotificationFactory.create(
+            received_by=user, type=NotificationType.GEODATA_MISSING, status=NotificationStatus.PENDING
+        )
+
+        freezer.move_to(DEFAULT_DATETIME)
+        notification = NotificationFactory.create(
+            received_by=user, type=NotificationType.GEODATA_MISSING, status=NotificationStatus.PENDING
+        )
+        other_type_notification = NotificationFactory.create(
+            received_by=user, type=NotificationType.TRANSACTION_PENDING, status=NotificationStatus.PENDING
+        )
+
+        client.login(user)
+
+        # Act
+        response = client.patch(
+            path=self.URL,
+            data={
+                "status": NotificationStatus.READ,
+                "types": [NotificationType.GEODATA_MISSING],
+                "created_at_from": (DEFAULT_DATETIME - timedelta(days=1)).isoformat(),
+            },
+            format="json",
+        )
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        statuses = dict(Notification.objects.values_list("id", "status"))
+        assert statuses == {
+            old_notification.id: NotificationStatus.PENDING,
+            notification.id: NotificationStatus.READ,
+            other_type_notification.id: NotificationStatus.PENDING,
+        }
+
+    def test_set_pending(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        notification = NotificationFactory.create(received_by=user, status=NotificationStatus.READ)
+
+        client.login(user)
+
+        # Act
+        response = client.patch(path=self.URL, data={"status": NotificationStatus.PENDING})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.BAD_REQUEST, response_json
+
+        notification.refresh_from_db()
+        assert notification.status == NotificationStatus.READ
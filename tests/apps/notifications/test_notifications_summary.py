@@ -0,0 +1,102 @@
+from http import HTTPStatus
+from typing import Callable, ContextManager
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tests.factories.notifications import NotificationFactory
+from tests.factories.transactions import TransactionFactory
+from tests.factories.users import UserFactory
+from tests.helpers.clients import APIClient
+from tests.helpers.constants import SMALL_BATCH_SIZE
+from tests.helpers.utils import queries_to_str
+from whimo.common.schemas.base import DataResponse
+from whimo.db.enums.notifications import NotificationStatus, NotificationType
+from whimo.notifications.schemas.dto import NotificationSummaryDTO
+from whimo.notifications.schemas.requests import NotificationStatusUpdateRequest
+from whimo.notifications.services.notifications import NotificationsService
+
+pytestmark = [pytest.mark.django_db]
+
+CaptureOnCommitCallbacks = Callable[..., ContextManager[list[Callable[[], None]]]]
+
+
+class TestNotificationsSummary:
+    URL = reverse("notifications_summary")
+
+    def test_success(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        NotificationFactory.create_batch(
+            size=SMALL_BATCH_SIZE,
+            received_by=user,
+            type=NotificationType.TRANSACTION_PENDING,
+            status=NotificationStatus.PENDING,
+        )
+        NotificationFactory.create(
+            received_by=user, type=NotificationType.GEODATA_MISSING, status=NotificationStatus.PENDING
+        )
+        NotificationFactory.create(
+            received_by=user, type=NotificationType.GEODATA_MISSING, status=NotificationStatus.READ
+        )
+        NotificationFactory.create(status=NotificationStatus.PENDING)
+
+        client.login(user)
+
+        # Act
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        summary = DataResponse[NotificationSummaryDTO](**response_json).data
+        assert summary.pending == SMALL_BATCH_SIZE + 1
+        assert summary.pending_by_type == {
+            **dict.fromkeys(NotificationType, 0),
+            NotificationType.TRANSACTION_PENDING: SMALL_BATCH_SIZE,
+            NotificationType.GEODATA_MISSING: 1,
+        }
+
+    def test_counters_maintained(
+        self, client: APIClient, django_capture_on_commit_callbacks: CaptureOnCommitCallbacks
+    ) -> None:
+        # Arrange
+        user = UserFactory.create()
+        read_notification = NotificationFactory.create(
+            received_by=user, type=NotificationType.GEODATA_MISSING, status=NotificationStatus.PENDING
+        )
+        transaction = TransactionFactory.create(buyer=user)
+
+        client.login(user)
+        client.get(path=self.URL)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            NotificationsService.create_from_transaction(
+                notification_type=NotificationType.TRANSACTION_PENDING,
+                transaction=transaction,
+                received_by_id=user.id,
+            )
+            NotificationsService.update_status(
+                user_id=user.id,
+                notification_id=read_notification.id,
+                request=NotificationStatusUpdateRequest(status=NotificationStatus.READ),
+            )
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        summary = DataResponse[NotificationSummaryDTO](**response_json).data
+        assert summary.pending == 1
+        assert summary.pending_by_type[NotificationType.TRANSACTION_PENDING] == 1
+        assert summary.pending_by_type[NotificationType.GEODATA_MISSING] == 0
+
+        # Counters are adjusted in Redis and the auth state is cached by the first request
+        assert len(queries) == 0, queries_to_str(queries)
@@ -45,12 +45,12 @@ class TestConversionRecipesList:
         assert len(data_response.data) == SMALL_BATCH_SIZE
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select count
-        # 4. select entities
-        # 5. prefetch inputs with commodity and group
-        # 6. prefetch outputs with commodity and group
+        # 1. select user auth state
+        # 2. select recipes catalog
+        # 3. prefetch inputs with commodity and group
+        # 4. prefetch outputs with commodity and group
+        # 5. select commodity groups catalog
+        # 6. select commodities catalog
         assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_search_by_name(
@@ -198,3 +198,48 @@ class TestConversionRecipesList:
 
         assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
         assert response_json == snapshot
+
+    def test_catalog_cached(self, client: APIClient) -> None:
+        user = UserFactory.create()
+        recipes = ConversionRecipeFactory.create_batch(size=SMALL_BATCH_SIZE)
+        for recipe in recipes:
+            ConversionInputFactory.create(recipe=recipe)
+            ConversionOutputFactory.create(recipe=recipe)
+
+        client.login(user)
+        client.get(path=self.URL)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL)
+        response_json = response.json()
+
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[ConversionRecipeDTO]](**response_json)
+        assert len(data_response.data) == SMALL_BATCH_SIZE
+
+        # No queries: the auth state is cached by the first request
+        assert not queries, queries_to_str(queries)
+
+    def test_catalog_invalidated_on_recipe_change(self, client: APIClient) -> None:
+        user = UserFactory.create()
+        recipe = ConversionRecipeFactory.create(name="Cocoa Processing Recipe")
+        ConversionInputFactory.create(recipe=recipe)
+        ConversionOutputFactory.create(recipe=recipe)
+
+        client.login(user)
+        client.get(path=self.URL)
+
+        recipe.name = "Coffee Processing Recipe"
+        recipe.save()
+        new_recipe = ConversionRecipeFactory.create()
+        ConversionInputFactory.create(recipe=new_recipe)
+
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[ConversionRecipeDTO]](**response_json)
+        assert {item.id for item in data_response.data} == {recipe.id, new_recipe.id}
+        assert {item.name for item in data_response.data} >= {"Coffee Processing Recipe"}
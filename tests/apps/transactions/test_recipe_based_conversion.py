@@ -380,6 +380,40 @@ class TestRecipeBasedConversion:
         for transaction in transactions:
             assert transaction.traceability == TransactionTraceability.FULL
 
+    def test_traceability_shares(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        beans = CommodityFactory.create(name="Cacao Beans")
+        sugar = CommodityFactory.create(name="Sugar")
+        chocolate = CommodityFactory.create(name="Chocolate")
+
+        # Shares of the sugar were not tracked, so its origin is unknown
+        BalanceFactory.create(user=user, commodity=beans, volume=Decimal("100.0"), traceability_shares={"full": 1.0})
+        BalanceFactory.create(user=user, commodity=sugar, volume=Decimal("100.0"))
+
+        recipe = ConversionRecipeFactory.create(name="Beans + Sugar to Chocolate")
+        ConversionInputFactory.create(recipe=recipe, commodity=beans, quantity=Decimal("30.0"))
+        ConversionInputFactory.create(recipe=recipe, commodity=sugar, quantity=Decimal("10.0"))
+        ConversionOutputFactory.create(recipe=recipe, commodity=chocolate, quantity=Decimal("20.0"))
+
+        client.login(user)
+
+        # Act
+        response = client.post(path=self.URL, data={"recipe_id": str(recipe.id)}, format="json")
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+
+        shares = dict(
+            Transaction.objects.filter(created_by_id=user.id, type=TransactionType.CONVERSION).values_list(
+                "commodity_id", "traceability_shares"
+            )
+        )
+        output_shares = {"full": 0.75, "incomplete": 0.25}
+
+        assert shares == {beans.id: {"full": 1.0}, sugar.id: {"incomplete": 1.0}, chocolate.id: output_shares}
+        assert Balance.objects.get(user=user, commodity=chocolate).traceability_shares == output_shares
+
     def test_group_id_is_set_for_conversion_transactions(
         self,
         client: APIClient,
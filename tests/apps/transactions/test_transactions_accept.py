@@ -201,6 +201,53 @@ class TestTransactionsAccept:
         assert transaction.status == TransactionStatus.ACCEPTED
         assert transaction.traceability == TransactionTraceability.INCOMPLETE
 
+    def test_traceability_shares(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        seller = UserFactory.create()
+
+        transaction = TransactionFactory.create(
+            buyer=user,
+            seller=seller,
+            created_by=seller,
+            volume=Decimal("100.0"),
+            type=TransactionType.DOWNSTREAM,
+            status=TransactionStatus.PENDING,
+        )
+
+        seller_shares = {"full": 0.25, "partial": 0.75}
+        seller_balance = BalanceFactory.create(
+            user=seller,
+            commodity=transaction.commodity,
+            volume=Decimal("200.0"),
+            traceability_shares=seller_shares,
+        )
+        buyer_balance = BalanceFactory.create(
+            user=user,
+            commodity=transaction.commodity,
+            volume=Decimal("100.0"),
+            traceability_shares={"incomplete": 1.0},
+        )
+
+        url = reverse(self.URL, args=(transaction.id,))
+
+        client.login(user)
+
+        # Act
+        response = client.patch(path=url, data={"status": TransactionStatus.ACCEPTED})
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+
+        transaction.refresh_from_db()
+        seller_balance.refresh_from_db()
+        buyer_balance.refresh_from_db()
+
+        # The sold volume is a sample of the seller's balance, the buyer's balance is half old stock
+        assert transaction.traceability_shares == seller_shares
+        assert seller_balance.traceability_shares == seller_shares
+        assert buyer_balance.traceability_shares == {"full": 0.125, "incomplete": 0.5, "partial": 0.375}
+
     def test_negative_volume(
         self,
         client: APIClient,
@@ -0,0 +1,178 @@
+import gzip
+import json
+from decimal import Decimal
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from django.http.response import HttpResponseBase
+from django.urls import reverse
+from freezegun.api import FrozenDateTimeFactory
+
+from tests.factories.balances import BalanceFactory
+from tests.factories.commodities import CommodityFactory
+from tests.factories.conversions import ConversionInputFactory, ConversionOutputFactory, ConversionRecipeFactory
+from tests.factories.transactions import TransactionFactory
+from tests.factories.users import UserFactory
+from tests.helpers.clients import APIClient
+from tests.helpers.constants import DEFAULT_DATETIME
+from whimo.db.enums import TransactionStatus, TransactionType
+from whimo.db.models import Transaction
+from whimo.transactions.export.graph import EDGE_COLUMNS, GRAPH_FORMAT, NODE_COLUMNS
+
+pytestmark = [pytest.mark.django_db]
+
+
+def read_graph(response: HttpResponseBase) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    header, *rows = gzip.decompress(response.getvalue()).decode().splitlines()
+
+    tables: dict[str, list[dict[str, Any]]] = {"nodes": [], "edges": []}
+    columns = {"nodes": [column.name for column in NODE_COLUMNS], "edges": [column.name for column in EDGE_COLUMNS]}
+    for row in rows:
+        table, *values = json.loads(row)
+        tables[table].append(dict(zip(columns[table], values, strict=True)))
+
+    return json.loads(header), tables["nodes"], tables["edges"]
+
+
+class TestTransactionsChainGraphDownload:
+    URL = "transactions_chain_graph_download"
+
+    def test_success(self, client: APIClient, freezer: FrozenDateTimeFactory) -> None:
+        # Arrange
+        freezer.move_to(DEFAULT_DATETIME)
+
+        user = UserFactory.create()
+        seller = UserFactory.create()
+
+        producer_transaction = TransactionFactory.create(
+            type=TransactionType.PRODUCER,
+            buyer=seller,
+            seller=None,
+            created_by=seller,
+            volume=Decimal("100.50"),
+            status=TransactionStatus.ACCEPTED,
+        )
+        downstream_transaction = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            buyer=user,
+            seller=seller,
+            commodity=producer_transaction.commodity,
+            volume=Decimal("50.25"),
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        url = reverse(self.URL, args=(downstream_transaction.id,))
+        client.login(user)
+
+        # Act
+        response = client.get(path=url)
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/gzip"
+        assert (
+            response["Content-Disposition"]
+            == f'attachment; filename="transaction_{downstream_transaction.id}_chain.ndjson.gz"'
+        )
+
+        header, nodes, edges = read_graph(response)
+
+        assert header["format"] == GRAPH_FORMAT
+        assert [column["name"] for column in header["tables"]["edges"]] == [column.name for column in EDGE_COLUMNS]
+
+        assert {node["id"]: node["username"] for node in nodes} == {
+            str(user.id): user.username,
+            str(seller.id): seller.username,
+        }
+
+        edges_by_id = {edge["id"]: edge for edge in edges}
+        assert edges_by_id.keys() == {str(producer_transaction.id), str(downstream_transaction.id)}
+
+        producer_edge = edges_by_id[str(producer_transaction.id)]
+        assert producer_edge["source"] is None
+        assert producer_edge["target"] == str(seller.id)
+        assert producer_edge["volume"] == "100.50"
+
+        downstream_edge = edges_by_id[str(downstream_transaction.id)]
+        assert downstream_edge["source"] == str(seller.id)
+        assert downstream_edge["target"] == str(user.id)
+        assert downstream_edge["commodity_code"] == producer_transaction.commodity.code
+        assert downstream_edge["type"] == TransactionType.DOWNSTREAM
+
+    def test_conversion_chain(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        beans = CommodityFactory.create(name="Cacao Beans")
+        oil = CommodityFactory.create(name="Cacao Oil")
+
+        producer_transaction = TransactionFactory.create(
+            type=TransactionType.PRODUCER,
+            buyer=user,
+            seller=None,
+            commodity=beans,
+            volume=Decimal("100.0"),
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        BalanceFactory.create(user=user, commodity=beans, volume=Decimal("100.0"))
+
+        recipe = ConversionRecipeFactory.create(name="Beans to Oil")
+        ConversionInputFactory.create(recipe=recipe, commodity=beans, quantity=Decimal("50.0"))
+        ConversionOutputFactory.create(recipe=recipe, commodity=oil, quantity=Decimal("25.0"))
+
+        client.login(user)
+        response = client.post(
+            path=reverse("transactions_conversion"),
+            data={"recipe_id": str(recipe.id)},
+            format="json",
+        )
+        assert response.status_code == HTTPStatus.OK
+
+        input_transaction = Transaction.objects.get(type=TransactionType.CONVERSION, seller_id=user.id)
+        output_transaction = Transaction.objects.get(type=TransactionType.CONVERSION, buyer_id=user.id)
+
+        url = reverse(self.URL, args=(output_transaction.id,))
+
+        # Act
+        response = client.get(path=url)
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK
+
+        _, nodes, edges = read_graph(response)
+
+        assert [node["id"] for node in nodes] == [str(user.id)]
+
+        edges_by_id = {edge["id"]: edge for edge in edges}
+        assert edges_by_id.keys() == {
+            str(producer_transaction.id),
+            str(input_transaction.id),
+            str(output_transaction.id),
+        }
+        assert edges_by_id[str(input_transaction.id)]["target"] is None
+        assert edges_by_id[str(output_transaction.id)]["source"] is None
+        assert edges_by_id[str(input_transaction.id)]["group_id"] == str(output_transaction.group_id)
+
+    def test_transaction_does_not_exist(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+
+        url = reverse(self.URL, args=("00000000-0000-0000-0000-000000000000",))
+        client.login(user)
+
+        # Act
+        response = client.get(path=url)
+
+        # Assert
+        assert response.status_code == HTTPStatus.NOT_FOUND, response.json()
+
+    def test_unauthorized(self, client: APIClient) -> None:
+        # Arrange
+        url = reverse(self.URL, args=("00000000-0000-0000-0000-000000000000",))
+
+        # Act
+        response = client.get(path=url)
+
+        # Assert
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, response.json()
@@ -61,11 +61,12 @@ class TestTransactionsDetail:
         assert data_response.data.seller is None
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select buyer gadgets
-        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select transaction
+        # 3. select buyer gadgets
+        # 4. select commodity groups catalog
+        # 5. select commodities catalog
+        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_downstream(self, client: APIClient, freezer: FrozenDateTimeFactory, snapshot: SnapshotAssertion) -> None:
         # Arrange
@@ -106,12 +107,13 @@ class TestTransactionsDetail:
         assert data_response.data.seller.id == transaction.seller_id
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select buyer gadgets
-        # 5. select seller gadgets
-        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select transaction
+        # 3. select buyer gadgets
+        # 4. select seller gadgets
+        # 5. select commodity groups catalog
+        # 6. select commodities catalog
+        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_downstream_with_traceability(
         self,
@@ -8,10 +8,11 @@ from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from freezegun.api import FrozenDateTimeFactory
+from rest_framework.renderers import JSONRenderer
 from syrupy import SnapshotAssertion
 
 from tests.factories.transactions import TransactionFactory
-from tests.factories.users import UserFactory
+from tests.factories.users import GadgetFactory, UserFactory
 from tests.helpers.clients import APIClient
 from tests.helpers.constants import DEFAULT_DATETIME, MEDIUM_BATCH_SIZE, SMALL_BATCH_SIZE
 from tests.helpers.utils import queries_to_str
@@ -52,13 +53,14 @@ class TestTransactionsList:
         assert response_ids == request_ids
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select count
-        # 4. select entities
-        # 5. select buyers gadgets
-        # 6. select sellers gadgets
-        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select count
+        # 3. select entities
+        # 4. select buyers gadgets
+        # 5. select sellers gadgets
+        # 6. select commodity groups catalog
+        # 7. select commodities catalog
+        assert len(queries) == 7, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_search_by_commodity_name(
         self,
@@ -688,3 +690,111 @@ class TestTransactionsList:
         # Assert
         assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
         assert response_json == snapshot
+
+    def test_search_by_commodity_name_variant(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        transaction = TransactionFactory.create(buyer=user, commodity__name_variants=["Café vert"])
+        TransactionFactory.create_batch(size=SMALL_BATCH_SIZE, buyer=user)
+
+        client.login(user)
+
+        # Act
+        response = client.get(path=f"{self.URL}?search=CAFE")
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = PaginatedDataResponse[list[TransactionDTO]](**response_json)
+        assert len(data_response.data) == 1
+        assert data_response.data[0].id == transaction.id
+
+    def test_not_modified(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        TransactionFactory.create_batch(size=SMALL_BATCH_SIZE, buyer=user)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=self.URL, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert not response.content
+
+        # No queries: the auth state is cached by the first request
+        assert not queries, queries_to_str(queries)
+
+    def test_modified_after_transaction_change(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        transaction = TransactionFactory.create(buyer=user)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        transaction.volume += 1
+        transaction.save()
+
+        # Act
+        response = client.get(path=self.URL, headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+        assert response.headers["ETag"] != etag
+
+    def test_modified_after_counterparty_gadget_change(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        seller = UserFactory.create()
+        TransactionFactory.create(buyer=user, seller=seller)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        GadgetFactory.create(user=seller, email=True, is_verified=True)
+
+        # Act
+        response = client.get(path=self.URL, headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+        assert response.headers["ETag"] != etag
+
+    def test_etag_depends_on_query(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        TransactionFactory.create_batch(size=SMALL_BATCH_SIZE, buyer=user)
+
+        client.login(user)
+        etag = client.get(path=self.URL).headers["ETag"]
+
+        # Act
+        response = client.get(path=f"{self.URL}?page_size=1", headers={"If-None-Match": etag})
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+        assert response.headers["ETag"] != etag
+
+    def test_rendered_like_drf_encoder(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        TransactionFactory.create_batch(size=SMALL_BATCH_SIZE, buyer=user)
+
+        client.login(user)
+
+        # Act
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+        assert response.content == JSONRenderer().render(response.data)
@@ -1,5 +1,7 @@
 from decimal import Decimal
 from http import HTTPStatus
+from unittest.mock import patch
+from uuid import UUID
 
 import pytest
 from django.db import connection
@@ -20,6 +22,7 @@ from whimo.common.schemas.base import DataResponse
 from whimo.db.enums import TransactionStatus, TransactionType
 from whimo.db.enums.transactions import TransactionTraceability
 from whimo.db.models import Transaction
+from whimo.db.storages import ChainsStorage, ChainSummary
 from whimo.transactions.schemas.dto import TraceabilityCountsDTO
 
 pytestmark = [pytest.mark.django_db]
@@ -60,13 +63,10 @@ class TestTransactionsTraceabilityCounts:
         assert data_response.data.counts[traceability] == 1
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select transactions level 1 traceability counts
-        # 5. select transactions level 2 ids
-        # 6. select conversion outputs
-        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select transaction
+        # 3. select chain transaction
+        assert len(queries) == 3, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_downstream(self, client: APIClient, freezer: FrozenDateTimeFactory, snapshot: SnapshotAssertion) -> None:
         # Arrange
@@ -162,17 +162,13 @@ class TestTransactionsTraceabilityCounts:
         assert data_response.data.counts[TransactionTraceability.INCOMPLETE] == 1
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select transactions level 1
-        # 5. select conversion outputs level 1
-        # 6. select transactions level 2
-        # 7. select conversion outputs level 2
-        # 8. select transactions level 3
-        # 9. select conversion outputs level 3
-        # 10. select traceability counts
-        assert len(queries) == 10, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select user auth state
+        # 2. select transaction
+        # 3. select chain transaction
+        # 4. select chain transactions level 1
+        # 5. select chain transactions level 2
+        # 6. select chain transactions level 3
+        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_simple_conversion(
         self,
@@ -238,18 +234,11 @@ class TestTransactionsTraceabilityCounts:
         assert data_response.data.counts[TransactionTraceability.INCOMPLETE] == 0
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select transactions level 1
-        # 5. select conversion outputs level 1
-        # 6. select conversion inputs level 1
-        # 7. select transactions level 2
-        # 8. select conversion outputs level 2
-        # 9. select transactions level 3
-        # 10. select conversion outputs level 3
-        # 11. select traceability counts
-        assert len(queries) == 11, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select transaction
+        # 2. select chain transaction
+        # 3. select conversion inputs level 1
+        # 4. select chain transactions level 2
+        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_multilevel_conversion(
         self,
@@ -327,23 +316,13 @@ class TestTransactionsTraceabilityCounts:
         assert data_response.data.counts[TransactionTraceability.INCOMPLETE] == 0
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select transactions level 1
-        # 5. select conversion outputs level 1
-        # 6. select conversion inputs level 1
-        # 7. select transactions level 2
-        # 8. select conversion outputs level 2
-        # 9. select transactions level 3
-        # 10. select conversion outputs level 3
-        # 11. select conversion inputs level 3
-        # 12. select transactions level 4
-        # 13. select conversion outputs level 4
-        # 14. select transactions level 5
-        # 15. select conversion outputs level 5
-        # 16. select traceability counts
-        assert len(queries) == 16, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select transaction
+        # 2. select chain transaction
+        # 3. select conversion inputs level 1
+        # 4. select chain transactions level 2
+        # 5. select conversion inputs level 2
+        # 6. select chain transactions level 3
+        assert len(queries) == 6, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_conversion_multiple_inputs(
         self,
@@ -421,18 +400,130 @@ class TestTransactionsTraceabilityCounts:
         assert data_response.data.counts[TransactionTraceability.INCOMPLETE] == 0
 
         # Queries:
-        # 1. select user
-        # 2. select gadgets
-        # 3. select transaction
-        # 4. select transactions level 1
-        # 5. select conversion outputs level 1
-        # 6. select conversion inputs level 1
-        # 7. select transactions level 2
-        # 8. select conversion outputs level 2
-        # 9. select transactions level 3
-        # 10. select conversion outputs level 3
-        # 11. select traceability counts
-        assert len(queries) == 11, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 1. select transaction
+        # 2. select chain transaction
+        # 3. select conversion inputs level 1
+        # 4. select chain transactions level 2
+        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+
+    def test_cached_chain(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        seller = UserFactory.create()
+        TransactionFactory.create(producer=True, buyer=seller, traceability=TransactionTraceability.FULL)
+        transaction = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=seller,
+            buyer=user,
+            traceability=TransactionTraceability.FULL,
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        url = reverse(self.URL, args=(transaction.id,))
+
+        client.login(user)
+        # The first traversal only tells the users of the chain, the second one is cached
+        client.get(path=url)
+        client.get(path=url)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path=url)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = DataResponse[TraceabilityCountsDTO](**response_json)
+
+        assert data_response.data.counts[TransactionTraceability.FULL] == 2  # noqa: PLR2004 Magic value used in comparison
+
+        # Queries:
+        # 1. select transaction
+        assert len(queries) == 1, queries_to_str(queries)
+
+        # Transactions of other users keep the summary
+        TransactionFactory.create(producer=True, traceability=TransactionTraceability.PARTIAL)
+        with CaptureQueriesContext(connection) as queries:
+            client.get(path=url)
+        assert len(queries) == 1, queries_to_str(queries)
+
+        # A new transaction in the chain invalidates the summary
+        TransactionFactory.create(producer=True, buyer=seller, traceability=TransactionTraceability.PARTIAL)
+        response = client.get(path=url)
+
+        data_response = DataResponse[TraceabilityCountsDTO](**response.json())
+
+        assert data_response.data.counts[TransactionTraceability.PARTIAL] == 1
+
+    def test_chain_changed_while_loading(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        seller = UserFactory.create()
+        transaction = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=seller,
+            buyer=user,
+            traceability=TransactionTraceability.FULL,
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        url = reverse(self.URL, args=(transaction.id,))
+        load_summary = ChainsStorage.load_summary
+
+        def load_and_write(transaction_id: UUID) -> ChainSummary:
+            summary = load_summary(transaction_id)
+            # Committed after the traversal read the chain, before the summary is cached
+            TransactionFactory.create(producer=True, buyer=seller, traceability=TransactionTraceability.PARTIAL)
+            return summary
+
+        client.login(user)
+        client.get(path=url)
+        with patch.object(ChainsStorage, "load_summary", side_effect=load_and_write):
+            client.get(path=url)
+
+        # Act
+        response = client.get(path=url)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response_json
+
+        data_response = DataResponse[TraceabilityCountsDTO](**response_json)
+
+        assert data_response.data.counts[TransactionTraceability.PARTIAL] == 1
+
+    def test_unrelated_write_while_loading(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        transaction = TransactionFactory.create(
+            type=TransactionType.DOWNSTREAM,
+            seller=UserFactory.create(),
+            buyer=user,
+            traceability=TransactionTraceability.FULL,
+            status=TransactionStatus.ACCEPTED,
+        )
+
+        url = reverse(self.URL, args=(transaction.id,))
+        load_summary = ChainsStorage.load_summary
+
+        def load_and_write(transaction_id: UUID) -> ChainSummary:
+            summary = load_summary(transaction_id)
+            TransactionFactory.create(producer=True, buyer=UserFactory.create())
+            return summary
+
+        client.login(user)
+        client.get(path=url)
+        with patch.object(ChainsStorage, "load_summary", side_effect=load_and_write):
+            client.get(path=url)
+
+        # Act
+        with patch.object(ChainsStorage, "load_summary", side_effect=load_summary) as mock_load_summary:
+            response = client.get(path=url)
+
+        # Assert
+        assert response.status_code == HTTPStatus.OK, response.json()
+        mock_load_summary.assert_not_called()
 
     def test_transaction_does_not_exist(
         self,
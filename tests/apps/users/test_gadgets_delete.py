@@ -42,7 +42,8 @@ class TestGadgetsDelete:
         # 2. get gadget for deletion
         # 3. delete gadget
         # 4. update gadget history
-        assert len(queries) == 4, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
+        # 5. select counterparties to invalidate their cached lists
+        assert len(queries) == 5, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
 
     def test_success_delete_verified_gadget_with_other_verified(
         self, client: APIClient, snapshot: SnapshotAssertion
@@ -44,7 +44,7 @@ class TestUsersProfile:
         assert data_response.data.username == user.username
 
         # Queries:
-        # 1. select user
+        # 1. select user auth state
         # 2. select user
         # 3. select gadgets
         assert len(queries) == 3, queries_to_str(queries)  # noqa: PLR2004 Magic value used in comparison
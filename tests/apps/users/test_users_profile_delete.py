@@ -49,6 +49,20 @@ class TestUsersProfileDelete:
         assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
         assert response_json == snapshot
 
+    def test_token_rejected_after_delete(self, client: APIClient) -> None:
+        # Arrange
+        user = UserFactory.create()
+        client.login(user)
+        client.get(path=self.URL)
+        client.delete(path=self.URL)
+
+        # Act
+        response = client.get(path=self.URL)
+        response_json = response.json()
+
+        # Assert
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, response_json
+
 
 class TestProfileDeleteView:
     def test_delete_method_direct(self) -> None:
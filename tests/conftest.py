@@ -5,13 +5,18 @@ from django.core.cache import cache
 from faker import Faker
 from pytest_mock import MockerFixture
 
+from whimo.auth.social.clients import openid_documents
+from whimo.auth.social.service import OAuthService
 from whimo.db.models import Commodity, CommodityGroup
+from whimo.db.storages.auth import auth_states
 
 pytest_plugins = [
     # helpers
+    "tests.helpers.budgets",
     "tests.helpers.clients",
     # factories
     "tests.factories.commodities",
+    "tests.factories.conversions",
     "tests.factories.notifications",
     "tests.factories.transactions",
     "tests.factories.users",
@@ -32,6 +37,10 @@ def reset_faker() -> None:
 @pytest.fixture(autouse=True)
 def reset_cache() -> None:
     cache.clear()
+    auth_states.clear()
+    openid_documents.clear()
+    OAuthService._get_google_oauth.cache_clear()
+    OAuthService._get_apple_oauth.cache_clear()
 
 
 @pytest.fixture(autouse=True)
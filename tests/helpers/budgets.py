@@ -0,0 +1,32 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import pytest
+
+from whimo.common.metrics import Metrics, metrics_recorded
+
+
+@contextmanager
+def check_query_budgets() -> Iterator[None]:
+    """Fail when requests in the block ran more queries than the `query_budget` of their view."""
+    exceeded = []
+
+    def check_budget(kind: str, name: str, metrics: Metrics, budget: int | None, **_: Any) -> None:
+        if budget is not None and metrics.queries > budget:
+            exceeded.append(f"{kind} {name}: {metrics.queries} queries, budget {budget}")
+
+    metrics_recorded.connect(check_budget, dispatch_uid="check_query_budgets")
+    try:
+        yield
+    finally:
+        metrics_recorded.disconnect(dispatch_uid="check_query_budgets")
+
+    if exceeded:
+        pytest.fail("Query budgets exceeded:\n" + "\n".join(exceeded))
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets() -> Iterator[None]:
+    """Fail tests making requests to views that run more queries than their `query_budget`."""
+    with check_query_budgets():
+        yield
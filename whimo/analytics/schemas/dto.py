@@ -1,9 +1,9 @@
 from datetime import date
-from decimal import Decimal
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from whimo.common.schemas.dto import FloatDecimal
 from whimo.db.enums.transactions import TransactionTraceability
 
 
@@ -17,7 +17,7 @@ class BalanceSummaryItemDTO(BaseModel):
     commodity_code: str
     commodity_name: str
     commodity_unit: str
-    total_volume: Decimal
+    total_volume: FloatDecimal
 
 
 class TraceabilityStatusDTO(BaseModel):
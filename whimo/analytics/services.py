@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from typing import Any, cast
 from uuid import UUID
 
@@ -25,6 +25,7 @@ from whimo.analytics.schemas.dto import (
 from whimo.common.utils import get_user_model
 from whimo.db.enums.transactions import TransactionTraceability
 from whimo.db.models import Balance, Season, Transaction
+from whimo.db.routers import using_replica
 from whimo.transactions.constants import LOCATION_S3_PREFIX
 
 User = get_user_model()
@@ -33,6 +34,7 @@ User = get_user_model()
 @dataclass(slots=True)
 class AnalyticsService:
     @staticmethod
+    @using_replica()
     def get_analytics_data() -> AnalyticsDataDTO:
         active_traders = AnalyticsService._get_active_traders_kpi()
         balance_summary = AnalyticsService._get_balance_summary()
@@ -148,8 +150,19 @@ class AnalyticsService:
 
     @staticmethod
     def _get_season_transactions_daily(current_seasons_queryset: QuerySet[Season]) -> list[SeasonTransactionsDailyDTO]:
+        # Transactions are matched to seasons by creation date, bounding it lets PostgreSQL skip older partitions
+        seasons_start = min(
+            (season.start_date for season in current_seasons_queryset if season.start_date is not None),
+            default=None,
+        )
+        if seasons_start is None:
+            return []
+
         daily_transactions = (
-            Transaction.objects.filter(season__in=current_seasons_queryset)
+            Transaction.objects.filter(
+                season__in=current_seasons_queryset,
+                created_at__gte=datetime.combine(seasons_start, time.min, tzinfo=timezone.get_current_timezone()),
+            )
             .select_related("season")
             .annotate(transaction_date=TruncDate("created_at"))
             .values("transaction_date", "season_id", "season__name")
@@ -186,10 +199,11 @@ class AnalyticsService:
         if cached_data is not None:
             return UserMetricsDTO.model_validate(cached_data)
 
-        total_transactions = AnalyticsService._get_user_transactions_count(user_id)
-        total_suppliers = AnalyticsService._get_user_suppliers_count(user_id)
-        initial_plots = AnalyticsService._get_user_plots_count(user_id)
-        files_uploaded = AnalyticsService._get_user_files_count(user_id)
+        with using_replica(user_id=user_id):
+            total_transactions = AnalyticsService._get_user_transactions_count(user_id)
+            total_suppliers = AnalyticsService._get_user_suppliers_count(user_id)
+            initial_plots = AnalyticsService._get_user_plots_count(user_id)
+            files_uploaded = AnalyticsService._get_user_files_count(user_id)
 
         analytics_data = UserMetricsDTO(
             total_transactions=total_transactions,
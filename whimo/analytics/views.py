@@ -6,6 +6,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from whimo.analytics.services import AnalyticsService
+from whimo.common.conditional import build_etag, get_not_modified_response
 from whimo.common.schemas.base import DataResponse
 
 
@@ -20,4 +21,10 @@ class UserAnalyticsView(views.APIView):
 
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         user_analytics = AnalyticsService.get_user_analytics_data(user_id=request.user.id)
-        return DataResponse(data=user_analytics).as_response()
+
+        # Metrics are served from cache and include uploaded files, so the ETag is derived from the values
+        etag = build_etag(request.get_full_path(), user_analytics.model_dump_json())
+        if not_modified := get_not_modified_response(request, etag):
+            return not_modified
+
+        return DataResponse(data=user_analytics).as_response(etag=etag)
@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from authlib.integrations.django_client import DjangoOAuth2App, OAuth
+
+logger = logging.getLogger(__name__)
+
+OPENID_DOCUMENT_CACHE_TIMEOUT = 60 * 60
+OPENID_DOCUMENT_STALE_TIMEOUT = 60 * 60 * 24
+OPENID_DOCUMENT_RETRY_INTERVAL = 60
+OPENID_JWKS_REFRESH_INTERVAL = 60
+
+
+@dataclass(slots=True)
+class OpenIDDocument:
+    content: dict
+    fetched_at: float
+    retry_at: float = 0
+
+
+class OpenIDDocumentCache:
+    """Per-process cache of OpenID discovery documents and JWKS with stale-if-error.
+
+    A document is fetched again once `timeout` has passed. If the provider is unreachable at that moment,
+    the previous document is served for up to `stale_timeout` more seconds, retrying every `retry_interval`.
+    """
+
+    def __init__(self, timeout: float, stale_timeout: float, retry_interval: float) -> None:
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self.retry_interval = retry_interval
+        self._entries: dict[str, OpenIDDocument] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, fetch: Callable[[str], dict], max_age: float | None = None) -> dict:
+        if (entry := self._get_valid_entry(url, max_age)) is not None:
+            return entry.content
+
+        with self._lock:
+            # Another thread may have fetched the document while this one was waiting
+            if (entry := self._get_valid_entry(url, max_age)) is not None:
+                return entry.content
+
+            entry = self._entries.get(url)
+            try:
+                content = fetch(url)
+            except Exception:
+                now = time.monotonic()
+                if entry is None or now - entry.fetched_at >= self.timeout + self.stale_timeout:
+                    raise
+
+                logger.warning("Failed to refresh OpenID document %s, serving the cached one", url, exc_info=True)
+                entry.retry_at = now + self.retry_interval
+                return entry.content
+
+            self._entries[url] = OpenIDDocument(content=content, fetched_at=time.monotonic())
+            return content
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_valid_entry(self, url: str, max_age: float | None) -> OpenIDDocument | None:
+        if (entry := self._entries.get(url)) is None:
+            return None
+
+        now = time.monotonic()
+        max_age = self.timeout if max_age is None else max_age
+        return entry if now - entry.fetched_at < max_age or now < entry.retry_at else None
+
+
+openid_documents = OpenIDDocumentCache(
+    timeout=OPENID_DOCUMENT_CACHE_TIMEOUT,
+    stale_timeout=OPENID_DOCUMENT_STALE_TIMEOUT,
+    retry_interval=OPENID_DOCUMENT_RETRY_INTERVAL,
+)
+
+
+class CachedOAuth2App(DjangoOAuth2App):
+    """OAuth client reading the discovery document and JWKS through `openid_documents`."""
+
+    def load_server_metadata(self) -> dict:
+        if self._server_metadata_url:
+            self.server_metadata.update(openid_documents.get(self._server_metadata_url, self._fetch_document))
+        return self.server_metadata
+
+    def fetch_jwk_set(self, force: bool = False) -> dict:
+        if not (uri := self.load_server_metadata().get("jwks_uri")):
+            raise RuntimeError('Missing "jwks_uri" in metadata')
+
+        # Unknown key ids force a refresh to pick up rotated keys, rate limited so forged tokens can't trigger
+        # a request to the provider every time
+        max_age = OPENID_JWKS_REFRESH_INTERVAL if force else None
+        return openid_documents.get(uri, self._fetch_document, max_age=max_age)
+
+    def _fetch_document(self, url: str) -> Any:
+        with self.client_cls(**self.client_kwargs) as session:
+            response = session.request("GET", url, withhold_token=True)
+            response.raise_for_status()
+            return response.json()
+
+
+class CachedOAuth(OAuth):
+    oauth2_client_cls = CachedOAuth2App
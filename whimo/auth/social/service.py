@@ -1,13 +1,14 @@
 from dataclasses import dataclass
+from functools import cache
 
 from authlib.common.errors import AuthlibBaseError
-from authlib.integrations.django_client import OAuth
 from django.conf import settings
 from django.db import transaction
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from whimo.auth.jwt.mappers import AccessRefreshTokenMapper
 from whimo.auth.jwt.schemas.dto import AccessRefreshTokenDTO
+from whimo.auth.social.clients import CachedOAuth
 from whimo.auth.social.schemas.dto import OAuthProvider, OAuthUserInfo
 from whimo.auth.social.schemas.errors import OAuthError
 from whimo.auth.social.schemas.requests import OAuthCodeRequest, OAuthIdTokenRequest
@@ -96,8 +97,10 @@ class OAuthService:
         return oauth.apple.parse_id_token(token=token, nonce=request.nonce, claims_options=claims_options)
 
     @staticmethod
-    def _get_google_oauth(with_client_claims: bool) -> OAuth:
-        oauth = OAuth()
+    @cache
+    def _get_google_oauth(with_client_claims: bool) -> CachedOAuth:
+        """Process-wide client, created on the first login so discovery documents and JWKS are reused."""
+        oauth = CachedOAuth()
 
         params = {}
         if with_client_claims:
@@ -115,8 +118,9 @@ class OAuthService:
         return oauth
 
     @staticmethod
-    def _get_apple_oauth(with_client_claims: bool) -> OAuth:
-        oauth = OAuth()
+    @cache
+    def _get_apple_oauth(with_client_claims: bool) -> CachedOAuth:
+        oauth = CachedOAuth()
 
         params = {}
         if with_client_claims:
@@ -126,8 +130,8 @@ class OAuthService:
             }
 
         oauth.register(
-            name="google",
-            server_metadata_url="https://account.apple.com/.well-known/openid-configuration",
+            name="apple",
+            server_metadata_url="https://appleid.apple.com/.well-known/openid-configuration",
             client_kwargs={"scope": "openid email"},
             **params,
         )
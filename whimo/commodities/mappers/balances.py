@@ -3,20 +3,22 @@ from dataclasses import dataclass
 from whimo.commodities.mappers.commodities import CommoditiesMapper
 from whimo.commodities.schemas.dto import BalanceDTO
 from whimo.db.models import Balance
+from whimo.db.storages import CommoditiesStorage
 
 
 @dataclass(slots=True)
 class BalancesMapper:
     @staticmethod
     def to_dto(entity: Balance) -> BalanceDTO:
-        commodity = CommoditiesMapper.to_dto_with_group(entity.commodity)
-        has_recipe = getattr(entity, "commodity_has_recipe", False)
+        commodity = CommoditiesMapper.to_dto_with_group(
+            CommoditiesStorage.get_commodity(entity.commodity_id) or entity.commodity
+        )
 
         return BalanceDTO(
             id=entity.id,
             volume=entity.volume,
             commodity=commodity,
-            has_recipe=has_recipe,
+            has_recipe=commodity.has_recipe,
         )
 
     @staticmethod
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
-
-from django.utils.translation import gettext as _
+from decimal import Decimal
+from uuid import UUID
 
 from whimo.commodities.schemas.dto import (
     CommodityGroupDTO,
     CommodityGroupWithCommoditiesBalancesDTO,
 )
 from whimo.db.models import CommodityGroup
+from whimo.db.storages import CommoditiesStorage
 
 
 @dataclass(slots=True)
@@ -15,23 +16,27 @@ class CommoditiesGroupsMapper:
     def to_dto(commodity_group: CommodityGroup) -> CommodityGroupDTO:
         return CommodityGroupDTO(
             id=commodity_group.id,
-            name=_(commodity_group.name),
+            name=CommoditiesStorage.get_group_name(commodity_group),
         )
 
     @staticmethod
-    def to_dto_with_commodities_balances(commodity_group: CommodityGroup) -> CommodityGroupWithCommoditiesBalancesDTO:
+    def to_dto_with_commodities_balances(
+        commodity_group: CommodityGroup,
+        balances: dict[UUID, Decimal],
+    ) -> CommodityGroupWithCommoditiesBalancesDTO:
         from whimo.commodities.mappers.commodities import CommoditiesMapper
 
-        commodities = CommoditiesMapper.to_dto_list_with_balance(list(commodity_group.commodities.all()))
+        commodities = CommoditiesStorage.get_catalog().commodities_by_group.get(commodity_group.id, [])
 
         return CommodityGroupWithCommoditiesBalancesDTO(
             id=commodity_group.id,
-            name=_(commodity_group.name),
-            commodities=commodities,
+            name=CommoditiesStorage.get_group_name(commodity_group),
+            commodities=CommoditiesMapper.to_dto_list_with_balance(commodities, balances),
         )
 
     @staticmethod
     def to_dto_list_with_commodities_balances(
         entities: list[CommodityGroup],
+        balances: dict[UUID, Decimal],
     ) -> list[CommodityGroupWithCommoditiesBalancesDTO]:
-        return [CommoditiesGroupsMapper.to_dto_with_commodities_balances(entity) for entity in entities]
+        return [CommoditiesGroupsMapper.to_dto_with_commodities_balances(entity, balances) for entity in entities]
@@ -1,6 +1,4 @@
-from decimal import Decimal
-
-from whimo.common.schemas.dto import BaseModelDTO
+from whimo.common.schemas.dto import BaseModelDTO, FloatDecimal
 
 
 class CommodityGroupDTO(BaseModelDTO):
@@ -19,7 +17,7 @@ class CommodityWithGroupDTO(CommodityDTO):
 
 
 class CommodityWithBalanceDTO(CommodityWithGroupDTO):
-    balance: Decimal | None
+    balance: FloatDecimal | None
 
 
 class CommodityGroupWithCommoditiesBalancesDTO(BaseModelDTO):
@@ -28,6 +26,6 @@ class CommodityGroupWithCommoditiesBalancesDTO(BaseModelDTO):
 
 
 class BalanceDTO(BaseModelDTO):
-    volume: Decimal
+    volume: FloatDecimal
     commodity: CommodityWithGroupDTO
     has_recipe: bool
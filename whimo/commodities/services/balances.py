@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from typing import cast
 from uuid import UUID
 
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 
 from whimo.commodities.schemas.requests import BalanceListRequest
+from whimo.commodities.services.commodities import CommoditiesService
 from whimo.common.schemas.base import Pagination
 from whimo.common.utils import get_user_model, paginate_queryset
 from whimo.db.models import Balance
@@ -21,26 +22,15 @@ class BalancesService:
 
     @staticmethod
     def _filter_balances(user_id: UUID, request: BalanceListRequest) -> QuerySet[Balance]:
-        from django.db.models import Exists, OuterRef
-
-        from whimo.db.models import ConversionInput
-
-        has_recipe_subquery = Exists(ConversionInput.objects.filter(commodity=OuterRef("commodity")))
-        queryset = (
-            Balance.objects.select_related("commodity__group", "commodity")
-            .annotate(commodity_has_recipe=has_recipe_subquery)
-            .filter(user_id=user_id)
-        )
-
-        if search := request.search:
-            queryset = queryset.filter(
-                Q(commodity__name__icontains=search)
-                | Q(commodity__code__icontains=search)
-                | Q(commodity__name_variants__icontains=search)
-            )
+        queryset = Balance.objects.filter(user_id=user_id)
 
-        if commodity_group_id := request.commodity_group_id:
-            queryset = queryset.filter(commodity__group_id=commodity_group_id)
+        if request.search or request.commodity_group_id:
+            # Commodities are matched against the in-memory registry, so no join is needed for filtering
+            commodities = CommoditiesService.filter_commodities(
+                search=request.search,
+                group_id=request.commodity_group_id,
+            )
+            queryset = queryset.filter(commodity_id__in=[commodity.id for commodity in commodities])
 
         if commodity_id := request.commodity_id:
             queryset = queryset.filter(commodity_id=commodity_id)
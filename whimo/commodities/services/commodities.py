@@ -1,47 +1,52 @@
 from dataclasses import dataclass
-from typing import cast
+from decimal import Decimal
 from uuid import UUID
 
-from django.db.models import Prefetch, Q, QuerySet
-
 from whimo.commodities.schemas.requests import CommodityGroupListRequest, CommodityListRequest
 from whimo.common.schemas.base import Pagination
-from whimo.common.utils import paginate_queryset
-from whimo.db.models import Commodity, CommodityGroup
+from whimo.common.utils import paginate_list
+from whimo.db.models import Balance, Commodity, CommodityGroup
+from whimo.db.storages import CommoditiesStorage
 
 
 @dataclass(slots=True)
 class CommoditiesService:
     @staticmethod
     def list_commodities(request: CommodityListRequest) -> tuple[list[Commodity], Pagination]:
-        queryset = CommoditiesService._filter_commodities(request)
-        return paginate_queryset(queryset=queryset, request=request)
+        commodities = CommoditiesService.filter_commodities(search=request.search, group_id=request.group_id)
+        return paginate_list(items=commodities, request=request)
 
     @staticmethod
-    def list_groups(user_id: UUID, request: CommodityGroupListRequest) -> tuple[list[CommodityGroup], Pagination]:
-        queryset = CommoditiesService._filter_commodities_groups(user_id, request)
-        return paginate_queryset(queryset=queryset, request=request)
+    def list_groups(request: CommodityGroupListRequest) -> tuple[list[CommodityGroup], Pagination]:
+        groups = CommoditiesService._filter_commodities_groups(request)
+        return paginate_list(items=groups, request=request)
 
     @staticmethod
-    def _filter_commodities(params: CommodityListRequest) -> QuerySet[Commodity]:
-        queryset = Commodity.objects.annotate_has_recipe().select_related("group")
+    def get_groups_balances(user_id: UUID, groups: list[CommodityGroup]) -> dict[UUID, Decimal]:
+        commodities_by_group = CommoditiesStorage.get_catalog().commodities_by_group
+        commodity_ids = [commodity.id for group in groups for commodity in commodities_by_group.get(group.id, [])]
+        if not commodity_ids:
+            return {}
 
-        if search := params.search:
-            queryset = queryset.filter(
-                Q(name__icontains=search) | Q(code__icontains=search) | Q(name_variants__icontains=search)
-            )
+        balances = Balance.objects.filter(user_id=user_id, commodity_id__in=commodity_ids)
+        return dict(balances.values_list("commodity_id", "volume"))
+
+    @staticmethod
+    def filter_commodities(search: str | None = None, group_id: UUID | None = None) -> list[Commodity]:
+        catalog = CommoditiesStorage.get_catalog()
+        commodities = catalog.commodities
 
-        if group_id := params.group_id:
-            queryset = queryset.filter(group_id=group_id)
+        if group_id:
+            commodities = catalog.commodities_by_group.get(group_id, [])
 
-        return cast(QuerySet[Commodity], queryset)
+        if search:
+            commodities = CommoditiesStorage.search_commodities(search, commodities)
 
-    @staticmethod
-    def _filter_commodities_groups(user_id: UUID, params: CommodityGroupListRequest) -> QuerySet[CommodityGroup]:
-        commodities_with_balances = Commodity.objects.annotate_balances(user_id)
-        queryset = CommodityGroup.objects.prefetch_related(Prefetch("commodities", queryset=commodities_with_balances))
+        return commodities
 
+    @staticmethod
+    def _filter_commodities_groups(params: CommodityGroupListRequest) -> list[CommodityGroup]:
         if search := params.search:
-            queryset = queryset.filter(Q(name__icontains=search) | Q(name_variants__icontains=search))
+            return CommoditiesStorage.search_groups(search)
 
-        return cast(QuerySet[CommodityGroup], queryset)
+        return CommoditiesStorage.get_catalog().groups
@@ -10,10 +10,13 @@ from whimo.commodities.mappers.commodities_groups import CommoditiesGroupsMapper
 from whimo.commodities.schemas.requests import BalanceListRequest, CommodityGroupListRequest, CommodityListRequest
 from whimo.commodities.services.balances import BalancesService
 from whimo.commodities.services.commodities import CommoditiesService
+from whimo.common.conditional import build_user_etag, get_not_modified_response
 from whimo.common.schemas.base import PaginatedDataResponse
 
 
 class CommoditiesListView(views.APIView):
+    query_budget = 3
+
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         payload = CommodityListRequest.parse(request, from_query_params=True)
         items, pagination = CommoditiesService.list_commodities(request=payload)
@@ -23,15 +26,25 @@ class CommoditiesListView(views.APIView):
 
 
 class CommoditiesGroupsListView(views.APIView):
+    query_budget = 4
+
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         payload = CommodityGroupListRequest.parse(request, from_query_params=True)
-        items, pagination = CommoditiesService.list_groups(user_id=request.user.id, request=payload)
 
-        response = CommoditiesGroupsMapper.to_dto_list_with_commodities_balances(items)
-        return PaginatedDataResponse(data=response, pagination=pagination).as_response()
+        etag = build_user_etag(request)
+        if not_modified := get_not_modified_response(request, etag):
+            return not_modified
+
+        items, pagination = CommoditiesService.list_groups(request=payload)
+        balances = CommoditiesService.get_groups_balances(user_id=request.user.id, groups=items)
+
+        response = CommoditiesGroupsMapper.to_dto_list_with_commodities_balances(items, balances)
+        return PaginatedDataResponse(data=response, pagination=pagination).as_response(etag=etag)
 
 
 class CommoditiesBalancesListView(views.APIView):
+    query_budget = 5
+
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         payload = BalanceListRequest.parse(request, from_query_params=True)
         items, pagination = BalancesService.list_balances(user_id=request.user.id, request=payload)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "whimo.common"
+
+    def ready(self) -> None:
+        from whimo.common import metrics, profiling  # noqa: F401 Imported for Celery signal receivers registration
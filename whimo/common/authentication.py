@@ -1,15 +1,23 @@
+import hmac
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
+from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
+from django.db import DEFAULT_DB_ALIAS
 from django.http import HttpRequest
+from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from rest_framework import permissions
 from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import JWTAuthentication as DRFJWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import Token
 
 from whimo.common.utils import get_user_model
 from whimo.db.models import Gadget
+from whimo.db.storages import AuthStateStorage
 
 if TYPE_CHECKING:  # pragma: no cover
     from rest_framework.views import APIView
@@ -28,6 +36,26 @@ class JWTAuthentication(DRFJWTAuthentication):
 
         return user, validated_token
 
+    def get_user(self, validated_token: Token) -> User:  # type: ignore
+        """Build the user from the cached auth state instead of loading the row on every request.
+
+        Only the auth state fields are set, the others are deferred and loaded on first access.
+        """
+        try:
+            user_id = UUID(str(validated_token[api_settings.USER_ID_CLAIM]))
+        except (KeyError, ValueError) as err:
+            raise InvalidToken(gettext("Token contained no recognizable user identification")) from err
+
+        if not (state := AuthStateStorage.get_state(user_id)):
+            raise AuthenticationFailed(gettext("User not found"), code="user_not_found")
+
+        if not state.is_active:
+            raise AuthenticationFailed(gettext("User is inactive"), code="user_inactive")
+
+        values = {"id": user_id, "is_active": state.is_active, "is_deleted": state.is_deleted}
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in values]  # type: ignore
+        return User.from_db(DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names])
+
 
 class GadgetsModelBackend(ModelBackend):
     def authenticate(  # type: ignore
@@ -56,4 +84,12 @@ class HasVerifiedGadgetPermission(permissions.IsAuthenticated):
         if not super().has_permission(request, view):
             return False
 
-        return request.user.gadgets.filter(is_verified=True).exists()  # type: ignore
+        state = AuthStateStorage.get_state(request.user.id)  # type: ignore
+        return bool(state and state.has_verified_gadget)
+
+
+class HasMetricsTokenPermission(permissions.BasePermission):
+    def has_permission(self, request: Request, _: "APIView") -> bool:
+        token = settings.METRICS_TOKEN
+        authorization = request.headers.get("Authorization", "")
+        return bool(token) and hmac.compare_digest(authorization, f"Bearer {token}")
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Generic, Hashable, Iterable, Iterator, TypeVar
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+
+T = TypeVar("T")
+
+VERSIONED_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Versions of the versioned caches already read inside `pin_versioned_caches`, by cache name
+pinned_versions: ContextVar[dict[str, str] | None] = ContextVar("pinned_versions", default=None)
+
+
+class CacheVersion:
+    """Random version token stored in Redis and replaced on every change of the data it describes."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def get(self) -> str:
+        if version := cache.get(self.key):
+            return str(version)
+
+        version = uuid4().hex
+        if not cache.add(self.key, version, timeout=None):
+            version = cache.get(self.key) or version
+        return str(version)
+
+    def bump(self) -> None:
+        CacheVersion.bump_many([self.key])
+
+    @staticmethod
+    def bump_many(keys: Iterable[str]) -> None:
+        keys = set(keys)
+        if not keys:
+            return
+
+        def set_new_versions() -> None:
+            cache.set_many({key: uuid4().hex for key in keys}, timeout=None)
+
+        # Bump right away for readers inside the same transaction and once more after commit,
+        # so a value derived by another worker from not yet committed state is discarded.
+        set_new_versions()
+        transaction.on_commit(set_new_versions)
+
+
+class VersionedCache(Generic[T]):
+    """Per-process snapshot of rarely changing data, shared between workers through Redis.
+
+    The current snapshot is identified by a random version token stored in Redis. A read compares
+    the token with the one of the local snapshot, then falls back to the Redis copy and finally to
+    `loader`. `invalidate` replaces the token, so every worker reloads the data on its next read.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], T], timeout: int = VERSIONED_CACHE_TIMEOUT) -> None:
+        self.name = name
+        self.loader = loader
+        self.timeout = timeout
+        self.version = CacheVersion(key=f"{name}:version")
+        self._snapshot: tuple[str, T] | None = None
+
+    def get_data_key(self, version: str) -> str:
+        return f"{self.name}:data:{version}"
+
+    def get_version(self) -> str:
+        if (pinned := pinned_versions.get()) is None:
+            return self.version.get()
+
+        if self.name not in pinned:
+            pinned[self.name] = self.version.get()
+        return pinned[self.name]
+
+    def get(self) -> T:
+        version = self.get_version()
+        if self._snapshot and self._snapshot[0] == version:
+            return self._snapshot[1]
+
+        data_key = self.get_data_key(version)
+        value = cache.get(data_key)
+        if value is None:
+            value = self.loader()
+            cache.set(data_key, value, timeout=self.timeout)
+
+        self._snapshot = (version, value)
+        return value
+
+    def invalidate(self) -> None:
+        self.version.bump()
+        if (pinned := pinned_versions.get()) is not None:
+            pinned.pop(self.name, None)
+
+
+@contextmanager
+def pin_versioned_caches() -> Iterator[None]:
+    """Check the version of every versioned cache once inside the block, e.g. a request mapping a page of items.
+
+    Invalidations inside the block are seen right away, the ones of other workers only by the next block.
+    """
+    token = pinned_versions.set({})
+    try:
+        yield
+    finally:
+        pinned_versions.reset(token)
+
+
+class PinVersionedCachesMiddleware:
+    """Reads versioned caches once per request instead of once per mapped item, see `pin_versioned_caches`."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with pin_versioned_caches():
+            return self.get_response(request)
+
+
+class LocalCache(Generic[T]):
+    """Per-process LRU with expiring entries, used in front of Redis for values read on every request.
+
+    Entries are not shared between workers, so `timeout` bounds how long other workers may serve
+    a value after it was deleted.
+    """
+
+    def __init__(self, maxsize: int, timeout: float) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> T | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
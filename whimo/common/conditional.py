@@ -0,0 +1,38 @@
+import hashlib
+
+from django.utils import translation
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from whimo.db.storages import CommoditiesStorage, UserChangesStorage
+
+
+def build_etag(*parts: object) -> str:
+    digest = hashlib.blake2b("\n".join(str(part) for part in parts).encode(), digest_size=16).hexdigest()
+    return quote_etag(digest)
+
+
+def build_user_etag(request: Request) -> str:
+    """ETag of a user scoped read endpoint, derived without touching the database.
+
+    It changes with the query, the language, the commodity registry and the user changes version,
+    which is bumped whenever transactions, balances, notifications or counterparties of the user change.
+    """
+    return build_etag(
+        request.get_full_path(),
+        translation.get_language(),
+        CommoditiesStorage.get_version(),
+        UserChangesStorage.get_version(request.user.id),
+    )
+
+
+def get_not_modified_response(request: Request, etag: str) -> Response | None:
+    if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+    if "*" not in if_none_match and etag not in {item.removeprefix("W/") for item in if_none_match}:
+        return None
+
+    response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    response["ETag"] = etag
+    return response
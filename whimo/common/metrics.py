@@ -0,0 +1,238 @@
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Callable, Iterable, Iterator
+
+from celery import Task
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.db import connections
+from django.dispatch import Signal
+from django.http import HttpRequest, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+REQUEST_METRICS, TASK_METRICS = "request", "task"
+METRICS_KEY = "metrics:{kind}"
+METRICS_FIELD_SEPARATOR = "|"
+
+# Prometheus name and help of every `Metrics` field, `{kind}` is `request` or `task`
+METRICS_EXPORT = {
+    "count": ("whimo_{kind}s_total", "Number of handled {kind}s"),
+    "duration": ("whimo_{kind}_duration_seconds_total", "Time spent handling {kind}s"),
+    "queries": ("whimo_{kind}_db_queries_total", "SQL queries run by {kind}s"),
+    "db_time": ("whimo_{kind}_db_duration_seconds_total", "Time spent in SQL queries by {kind}s"),
+    "storage_calls": ("whimo_{kind}_storage_calls_total", "Storage API calls made by {kind}s"),
+    "storage_time": ("whimo_{kind}_storage_duration_seconds_total", "Time spent in storage API calls by {kind}s"),
+    "serialization_time": (
+        "whimo_{kind}_serialization_duration_seconds_total",
+        "Time spent rendering response bodies by {kind}s",
+    ),
+}
+
+# Sent with `kind`, `name`, `metrics` and `budget` after every tracked request or task
+metrics_recorded = Signal()
+
+
+@dataclass(slots=True)
+class Metrics:
+    count: int = 1
+    duration: float = 0.0
+    queries: int = 0
+    db_time: float = 0.0
+    storage_calls: int = 0
+    storage_time: float = 0.0
+    serialization_time: float = 0.0
+
+    def add(self, other: "Metrics") -> None:
+        for field in fields(self):
+            if field.name != "count":
+                setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+    def to_server_timing(self) -> str:
+        return ", ".join(
+            (
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+                f'storage;dur={self.storage_time * 1000:.1f};desc="{self.storage_calls} calls"',
+                f"serialization;dur={self.serialization_time * 1000:.1f}",
+                f"total;dur={self.duration * 1000:.1f}",
+            )
+        )
+
+
+current_metrics: ContextVar[Metrics | None] = ContextVar("current_metrics", default=None)
+
+
+@contextmanager
+def track_metrics() -> Iterator[Metrics]:
+    """Count queries and storage calls made in the block, and the time spent in them."""
+    metrics = Metrics()
+
+    def record_query(execute: Callable[..., Any], sql: str, params: Any, many: bool, context: dict) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.queries += 1
+            metrics.db_time += time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    token = current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+            yield metrics
+    finally:
+        current_metrics.reset(token)
+        metrics.duration = time.perf_counter() - started_at
+
+
+@contextmanager
+def measure(metric: str) -> Iterator[None]:
+    """Add the time spent in the block to `metric` of the metrics being tracked, if any."""
+    if (metrics := current_metrics.get()) is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(metrics, metric, getattr(metrics, metric) + time.perf_counter() - started_at)
+
+
+def before_storage_call(context: dict, **_: Any) -> None:
+    context["metrics_started_at"] = time.perf_counter()
+
+
+def after_storage_call(context: dict, **_: Any) -> None:
+    if (metrics := current_metrics.get()) is None or (started_at := context.get("metrics_started_at")) is None:
+        return
+
+    metrics.storage_calls += 1
+    metrics.storage_time += time.perf_counter() - started_at
+
+
+def record_metrics(kind: str, name: str, metrics: Metrics, budget: int | None = None) -> None:
+    if budget is not None and metrics.queries > budget:
+        logger.warning("%s %s ran %d queries, over its budget of %d", kind, name, metrics.queries, budget)
+
+    if settings.METRICS_ENABLED:
+        try:
+            MetricsStorage.add(kind, name, metrics)
+        except RedisError:
+            logger.warning("Failed to record metrics of %s %s", kind, name, exc_info=True)
+
+    metrics_recorded.send(sender=Metrics, kind=kind, name=name, metrics=metrics, budget=budget)
+
+
+@dataclass(slots=True)
+class MetricsStorage:
+    """Metrics totals of all web and Celery workers, summed in Redis hashes by view or task name."""
+
+    @staticmethod
+    def add(kind: str, name: str, metrics: Metrics) -> None:
+        pipeline = get_redis_connection().pipeline(transaction=False)
+        for metric, value in asdict(metrics).items():
+            if value:
+                pipeline.hincrbyfloat(METRICS_KEY.format(kind=kind), f"{name}{METRICS_FIELD_SEPARATOR}{metric}", value)
+        pipeline.execute()
+
+    @staticmethod
+    def get(kind: str) -> dict[str, dict[str, float]]:
+        values = get_redis_connection().hgetall(METRICS_KEY.format(kind=kind))
+
+        totals: dict[str, dict[str, float]] = {}
+        for field, value in values.items():
+            name, metric = field.decode().rsplit(METRICS_FIELD_SEPARATOR, 1)
+            totals.setdefault(metric, {})[name] = float(value)
+        return totals
+
+    @staticmethod
+    def export() -> str:
+        """Totals in the Prometheus text exposition format."""
+        lines = []
+        for kind, label in ((REQUEST_METRICS, "view"), (TASK_METRICS, "task")):
+            totals = MetricsStorage.get(kind)
+            for metric, (name_template, help_template) in METRICS_EXPORT.items():
+                name = name_template.format(kind=kind)
+                lines.append(f"# HELP {name} {help_template.format(kind=kind)}")
+                lines.append(f"# TYPE {name} counter")
+                for label_value, value in sorted(totals.get(metric, {}).items()):
+                    escaped = label_value.replace("\\", "\\\\").replace('"', '\\"')
+                    lines.append(f'{name}{{{label}="{escaped}"}} {int(value) if value.is_integer() else value}')
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Tracks queries, storage calls and rendering of every request.
+
+    Totals are reported in the `Server-Timing` header and summed by view name for the metrics endpoint.
+    Views may declare a `query_budget`, requests running more queries are logged.
+
+    Bodies of synchronous streaming responses are produced after the view returns, their queries are added and the
+    totals recorded once the stream ends. The `Server-Timing` header is sent before, it only covers the view.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        with track_metrics() as metrics:
+            response = self.get_response(request)
+
+        response["Server-Timing"] = metrics.to_server_timing()
+
+        resolver_match = request.resolver_match
+        name = (resolver_match.view_name or resolver_match.route) if resolver_match else "unresolved"
+        view_class = getattr(resolver_match.func, "view_class", None) if resolver_match else None
+        budget = getattr(view_class, "query_budget", None)
+
+        if isinstance(response, StreamingHttpResponse) and not response.is_async:
+            response.streaming_content = self.track_stream(iter(response), name, metrics, budget)
+        else:
+            record_metrics(REQUEST_METRICS, name, metrics, budget=budget)
+
+        return response
+
+    @staticmethod
+    def track_stream(content: Iterable[bytes], name: str, metrics: Metrics, budget: int | None) -> Iterator[bytes]:
+        # Every chunk is tracked on its own, the stream may be resumed in another context between chunks
+        try:
+            iterator = iter(content)
+            while True:
+                with track_metrics() as chunk_metrics:
+                    chunk = next(iterator, None)
+                metrics.add(chunk_metrics)
+
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            record_metrics(REQUEST_METRICS, name, metrics, budget=budget)
+
+
+task_metrics: dict[str, tuple[ExitStack, Metrics]] = {}
+
+
+@task_prerun.connect
+def start_task_metrics(task_id: str, **_: Any) -> None:
+    stack = ExitStack()
+    task_metrics[task_id] = (stack, stack.enter_context(track_metrics()))
+
+
+@task_postrun.connect
+def finish_task_metrics(task_id: str, task: Task, **_: Any) -> None:
+    if (entry := task_metrics.pop(task_id, None)) is None:
+        return
+
+    stack, metrics = entry
+    stack.close()
+    record_metrics(TASK_METRICS, str(task.name), metrics)
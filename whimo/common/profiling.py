@@ -0,0 +1,153 @@
+import cProfile
+import hmac
+import logging
+import marshal
+import re
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+from uuid import uuid4
+
+from celery import Task
+from celery.signals import task_postrun, task_prerun
+from constance.signals import config_updated
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from whimo.common.cache import LocalCache
+
+logger = logging.getLogger(__name__)
+
+REQUEST_PROFILE, TASK_PROFILE = "request", "task"
+PROFILE_HEADER = "X-Profile"
+PROFILE_PATH_HEADER = "X-Profile-Path"
+PROFILES_S3_PREFIX = "profiles"
+
+PROFILED_TARGETS_SETTING = "PROFILED_TARGETS"
+PROFILED_TARGETS_CACHE_KEY = "profiling:targets"
+PROFILED_TARGETS_CACHE_TIMEOUT = 10
+
+profiled_targets = LocalCache[tuple[str, ...]](maxsize=1, timeout=PROFILED_TARGETS_CACHE_TIMEOUT)
+
+
+def get_profiled_targets() -> tuple[str, ...]:
+    """URL path prefixes and Celery task names set in the admin, cached per process for a few seconds."""
+    if (targets := profiled_targets.get(PROFILED_TARGETS_CACHE_KEY)) is None:
+        targets = tuple(cache.get(PROFILED_TARGETS_CACHE_KEY) or ())
+        profiled_targets.set(PROFILED_TARGETS_CACHE_KEY, targets)
+    return targets
+
+
+def set_profiled_targets(value: str) -> None:
+    targets = tuple(item.strip() for item in value.split(",") if item.strip())
+    cache.set(PROFILED_TARGETS_CACHE_KEY, targets, timeout=None)
+    profiled_targets.delete(PROFILED_TARGETS_CACHE_KEY)
+
+
+@receiver(config_updated)
+def update_profiled_targets(key: str, new_value: Any, **_: Any) -> None:
+    # Mirrored to Redis, so checking requests and tasks does not query the constance table
+    if key == PROFILED_TARGETS_SETTING:
+        set_profiled_targets(str(new_value or ""))
+
+
+def is_profiled_target(name: str) -> bool:
+    return any(name.startswith(target) for target in get_profiled_targets())
+
+
+def save_profile(kind: str, name: str, profiler: cProfile.Profile) -> str | None:
+    """Store the profile in the `pstats` format, e.g. for `snakeviz` or `flameprof`. Returns its storage path."""
+    slug = re.sub(r"[^\w.-]+", "-", name).strip("-") or kind
+    path = f"{PROFILES_S3_PREFIX}/{kind}/{timezone.now():%Y/%m/%d/%H%M%S}-{slug}-{uuid4().hex[:8]}.prof"
+
+    try:
+        profiler.create_stats()
+        return default_storage.save(path, ContentFile(marshal.dumps(profiler.stats)))
+    except Exception:
+        logger.warning("Failed to save profile of %s %s", kind, name, exc_info=True)
+        return None
+
+
+@contextmanager
+def profile(kind: str, name: str) -> Iterator[list[str]]:
+    """Profile the block with cProfile, the storage path of the saved profile is appended to the yielded list.
+
+    Only one profiler can be active per process, a block started while another one runs, e.g. a concurrent
+    request of a threaded worker, is not profiled.
+    """
+    paths: list[str] = []
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        logger.info("Skipped profile of %s %s, another profiler is active", kind, name)
+        yield paths
+        return
+
+    try:
+        yield paths
+    finally:
+        profiler.disable()
+        if path := save_profile(kind, name, profiler):
+            paths.append(path)
+
+
+class ProfilingMiddleware:
+    """Profiles requests on demand, other requests only look up the targets cached in the process.
+
+    A request is profiled when it sends the `PROFILING_TOKEN` in the `X-Profile` header, or when its path
+    starts with one of the targets set in the admin. The storage path of the profile is returned in the
+    `X-Profile-Path` header.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not self.is_profiled(request):
+            return self.get_response(request)
+
+        with profile(REQUEST_PROFILE, f"{request.method} {request.path}") as paths:
+            response = self.get_response(request)
+
+        if paths:
+            response[PROFILE_PATH_HEADER] = paths[0]
+        return response
+
+    @staticmethod
+    def is_profiled(request: HttpRequest) -> bool:
+        token = settings.PROFILING_TOKEN
+        if token and (header := request.headers.get(PROFILE_HEADER)):
+            return hmac.compare_digest(header, token)
+
+        return is_profiled_target(request.path)
+
+
+task_profilers: dict[str, cProfile.Profile] = {}
+
+
+@task_prerun.connect
+def start_task_profile(task_id: str, task: Task, **_: Any) -> None:
+    if not is_profiled_target(str(task.name)):
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Tasks run eagerly by a profiled request are part of its profile
+        return
+    task_profilers[task_id] = profiler
+
+
+@task_postrun.connect
+def finish_task_profile(task_id: str, task: Task, **_: Any) -> None:
+    if (profiler := task_profilers.pop(task_id, None)) is None:
+        return
+
+    profiler.disable()
+    save_profile(TASK_PROFILE, str(task.name), profiler)
@@ -0,0 +1,32 @@
+from typing import Any, Callable
+
+
+def get_sampled_name(sampling_context: dict[str, Any]) -> str:
+    """URL path of a request or name of a Celery task being traced."""
+    if environ := sampling_context.get("wsgi_environ"):
+        return str(environ.get("PATH_INFO", ""))
+
+    if scope := sampling_context.get("asgi_scope"):
+        return str(scope.get("path", ""))
+
+    if job := sampling_context.get("celery_job"):
+        return str(job.get("task", ""))
+
+    return str(sampling_context.get("transaction_context", {}).get("name", ""))
+
+
+def build_traces_sampler(default_rate: float, rates: dict[str, float]) -> Callable[[dict[str, Any]], float]:
+    """Sentry `traces_sampler` using the rate of the longest URL path prefix or task name prefix matching a trace.
+
+    Traces continued from an upstream service keep its sampling decision.
+    """
+    prefixes = sorted(rates, key=len, reverse=True)
+
+    def traces_sampler(sampling_context: dict[str, Any]) -> float:
+        if (parent_sampled := sampling_context.get("parent_sampled")) is not None:
+            return float(parent_sampled)
+
+        name = get_sampled_name(sampling_context)
+        return next((rates[prefix] for prefix in prefixes if name.startswith(prefix)), default_rate)
+
+    return traces_sampler
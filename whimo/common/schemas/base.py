@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from typing import Any, Generic, Type, TypeVar, get_args, get_origin
 
+from django.utils.cache import patch_cache_control
 from django.utils.translation import gettext_lazy as _
 from django_stubs_ext import StrPromise
 from pydantic import BaseModel, ConfigDict, ValidationError
@@ -12,6 +13,7 @@ from rest_framework.exceptions import APIException
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from whimo.common.responses import ModelResponse
 from whimo.common.schemas.errors import ApiError
 
 T = TypeVar("T")
@@ -96,10 +98,28 @@ class BaseResponse(BaseModel):
             exclude_fields.add("message")
         return exclude_fields
 
-    def as_response(self, status_code: int | None = None, by_alias: bool = False, **kwargs: Any) -> Response:
-        data = self.model_dump(exclude=self.exclude_fields, by_alias=by_alias)
+    def as_response(
+        self,
+        status_code: int | None = None,
+        by_alias: bool = False,
+        etag: str | None = None,
+        **kwargs: Any,
+    ) -> Response:
         response_status = status_code if status_code is not None else self.status
-        return Response(data=data, status=response_status, **kwargs)  # type: ignore
+        response = ModelResponse(
+            model=self,
+            exclude=self.exclude_fields,
+            by_alias=by_alias,
+            status=response_status,
+            **kwargs,
+        )
+
+        if etag:
+            # Clients may store the response, but have to revalidate it with `If-None-Match` before reuse
+            response["ETag"] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+
+        return response
 
 
 class DataResponse(BaseResponse, Generic[T]):
@@ -1,9 +1,19 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PlainSerializer, field_validator
+from rest_framework.utils.encoders import JSONEncoder
 
 from whimo.common.validators.auth import normalize_email, normalize_phone
 
+drf_json_encoder = JSONEncoder()
+
+# JSON representations matching the DRF encoder, so responses rendered by pydantic stay unchanged
+FloatDecimal = Annotated[Decimal, PlainSerializer(lambda x: float(x), return_type=float, when_used="json")]
+IsoDatetime = Annotated[datetime, PlainSerializer(drf_json_encoder.default, return_type=str, when_used="json")]
+
 
 class BaseModelDTO(BaseModel):
     id: UUID
@@ -0,0 +1,20 @@
+from typing import Any
+
+from storages.backends.s3 import S3Storage
+
+from whimo.common.metrics import after_storage_call, before_storage_call
+
+
+class InstrumentedS3Storage(S3Storage):
+    """S3 storage reporting the number of its API calls and the time spent in them to the tracked metrics."""
+
+    @property
+    def connection(self) -> Any:
+        connection = super().connection
+
+        # Registrations with the same `unique_id` are ignored, so the handlers are added once per client
+        events = connection.meta.client.meta.events
+        events.register("before-call.s3", before_storage_call, unique_id="whimo-metrics-before-call")
+        events.register("after-call.s3", after_storage_call, unique_id="whimo-metrics-after-call")
+        events.register("after-call-error.s3", after_storage_call, unique_id="whimo-metrics-after-call-error")
+        return connection
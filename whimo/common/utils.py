@@ -1,5 +1,6 @@
 import math
-from typing import Type, TypeVar
+import unicodedata
+from typing import Sequence, Type, TypeVar
 
 from django.contrib.auth import get_user_model as get_untyped_user_model
 from django.db.models import Model, QuerySet
@@ -8,6 +9,7 @@ from whimo.common.schemas.base import Pagination, PaginationRequest
 from whimo.db.models import User
 
 T = TypeVar("T", bound=Model)
+ItemT = TypeVar("ItemT")
 
 
 def get_user_model() -> Type[User]:
@@ -19,6 +21,30 @@ def paginate_queryset(
     request: PaginationRequest,
     default_page_size: int = 20,
 ) -> tuple[list[T], Pagination]:
+    pagination = get_pagination(total_items=queryset.count(), request=request, default_page_size=default_page_size)
+
+    # Get paginated items
+    offset = (pagination.page - 1) * pagination.page_size
+    paginated_items = list(queryset[offset : offset + pagination.page_size])
+
+    return paginated_items, pagination
+
+
+def paginate_list(
+    items: Sequence[ItemT],
+    request: PaginationRequest,
+    default_page_size: int = 20,
+) -> tuple[list[ItemT], Pagination]:
+    pagination = get_pagination(total_items=len(items), request=request, default_page_size=default_page_size)
+
+    # Get paginated items
+    offset = (pagination.page - 1) * pagination.page_size
+    paginated_items = list(items[offset : offset + pagination.page_size])
+
+    return paginated_items, pagination
+
+
+def get_pagination(total_items: int, request: PaginationRequest, default_page_size: int = 20) -> Pagination:
     # Parse pagination parameters
     page = request.page
     page_size = request.page_size or default_page_size
@@ -28,20 +54,13 @@ def paginate_queryset(
     page_size = min(max(1, page_size), 100)  # Limit maximum page size to 100
 
     # Calculate pagination values
-    total_items = queryset.count()
     total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
 
     # Adjust page if it exceeds total pages
     page = min(page, total_pages)
 
-    # Calculate offset and limit
-    offset = (page - 1) * page_size
-
-    # Get paginated items
-    paginated_items = list(queryset[offset : offset + page_size])
-
     # Create pagination metadata
-    pagination = Pagination(
+    return Pagination(
         count=total_items,
         page=page,
         page_size=page_size,
@@ -50,4 +69,8 @@ def paginate_queryset(
         previous_page=page - 1 if page > 1 else None,
     )
 
-    return paginated_items, pagination
+
+def normalize_search_text(value: str) -> str:
+    # Case and accent insensitive form used for in-memory substring search
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
@@ -2,7 +2,7 @@ from uuid import UUID
 
 from django.contrib import admin, messages
 from django.db.models import QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
 from import_export.admin import ExportActionMixin
@@ -12,12 +12,16 @@ from unfold.contrib.filters.admin import AllValuesCheckboxFilter, AutocompleteSe
 from unfold.contrib.import_export.forms import ExportForm
 from unfold.decorators import action, display
 
+from whimo.contrib.tasks.transactions import notify_downstream_buyers as notify_downstream_buyers_task
 from whimo.contrib.utils import ReadOnlyAdminMixin, change_link_with_icon, colored_text, text_with_icon
 from whimo.db.enums import TransactionStatus, TransactionType
 from whimo.db.enums.transactions import TransactionTraceability
 from whimo.db.models import Transaction
+from whimo.db.routers import get_read_database, using_replica
 from whimo.db.storages import TransactionsStorage
+from whimo.transactions.export.graph import stream_graph
 from whimo.transactions.export.resources import TransactionAdminResource
+from whimo.transactions.export.streaming import stream_csv
 from whimo.transactions.services import TransactionsService
 
 
@@ -25,7 +29,8 @@ from whimo.transactions.services import TransactionsService
 class TransactionAdmin(ReadOnlyAdminMixin, ModelAdmin, ExportActionMixin, SimpleHistoryAdmin):
     resource_classes = [TransactionAdminResource]
     export_form_class = ExportForm  # type: ignore
-    actions_detail = ("download_chain", "download_geojson")  # type: ignore
+    actions = ("download_downstream", "notify_downstream_buyers")  # type: ignore
+    actions_detail = ("download_chain", "download_chain_graph", "download_geojson")  # type: ignore
 
     list_display = (
         "short_id",
@@ -69,23 +74,40 @@ class TransactionAdmin(ReadOnlyAdminMixin, ModelAdmin, ExportActionMixin, Simple
             .get_export_queryset(request)
             .select_related("commodity", "commodity__group", "seller", "buyer", "created_by")
             .prefetch_related("seller__gadgets", "buyer__gadgets")
+            .using(get_read_database(request.user.id))
         )
 
     @action(description="Download chain")
     def download_chain(self, request: HttpRequest, object_id: str) -> HttpResponse:
         transaction = Transaction.objects.get(pk=object_id)
-        chain_transactions = (
-            TransactionsStorage.get_chain_transactions(transaction.id)
-            .select_related("commodity", "commodity__group", "seller", "buyer", "created_by")
-            .prefetch_related("seller__gadgets", "buyer__gadgets")
+        with using_replica(user_id=request.user.id):
+            chain_transactions = (
+                TransactionsStorage.get_chain_transactions(transaction.id)
+                .select_related("commodity", "commodity__group", "seller", "buyer", "created_by")
+                .prefetch_related("seller__gadgets", "buyer__gadgets")
+            )
+            return self.export_admin_action(request=request, queryset=chain_transactions)
+
+    @action(description="Download chain graph")
+    def download_chain_graph(self, request: HttpRequest, object_id: str) -> StreamingHttpResponse:
+        transaction = Transaction.objects.get(pk=object_id)
+        database = get_read_database(request.user.id)
+        with using_replica(user_id=request.user.id):
+            nodes, edges = TransactionsService.get_chain_graph_export(transaction.id)
+
+        response = StreamingHttpResponse(
+            stream_graph(nodes.using(database), edges.using(database)),
+            content_type="application/gzip",
         )
-        return self.export_admin_action(request=request, queryset=chain_transactions)
+        response["Content-Disposition"] = f'attachment; filename="transaction_{transaction.short_id}_chain.ndjson.gz"'
+        return response
 
     @action(description="Download GeoJSON")
     def download_geojson(self, request: HttpRequest, object_id: UUID) -> HttpResponse:
         transaction = Transaction.objects.get(pk=object_id)
 
-        data = TransactionsService.get_chain_feature_collection(transaction_id=object_id)
+        with using_replica(user_id=request.user.id):
+            data = TransactionsService.get_chain_feature_collection(transaction_id=object_id)
         feature_collection, succeed_transactions, failed_transactions = data
 
         if succeed_transactions:
@@ -108,6 +130,29 @@ class TransactionAdmin(ReadOnlyAdminMixin, ModelAdmin, ExportActionMixin, Simple
         response["Content-Disposition"] = f'attachment; filename="transaction_{transaction.short_id}_farms.json"'
         return response
 
+    @action(description="Download downstream")
+    def download_downstream(self, request: HttpRequest, queryset: QuerySet[Transaction]) -> StreamingHttpResponse:
+        transaction_ids = list(queryset.values_list("pk", flat=True))
+        database = get_read_database(request.user.id)
+        with using_replica(user_id=request.user.id):
+            downstream_transactions = TransactionsService.get_downstream_csv_export(transaction_ids).using(database)
+
+        # Downstream of a producer can reach most of the graph, rows are written while they are fetched
+        response = StreamingHttpResponse(
+            stream_csv(TransactionAdminResource(), downstream_transactions),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = 'attachment; filename="transactions_downstream.csv"'
+        return response
+
+    @action(description="Notify downstream buyers")
+    def notify_downstream_buyers(self, request: HttpRequest, queryset: QuerySet[Transaction]) -> None:
+        # Downstream of a producer can reach most of the graph, it is walked and buyers are notified by a task
+        transaction_ids = [str(pk) for pk in queryset.values_list("pk", flat=True)]
+        notify_downstream_buyers_task.delay(transaction_ids=transaction_ids)
+
+        messages.success(request, f"Notifying buyers downstream of {len(transaction_ids)} transactions")
+
     @display(description="ID", ordering="id")
     def short_id(self, obj: Transaction) -> SafeString | None:
         return colored_text(obj.short_id)
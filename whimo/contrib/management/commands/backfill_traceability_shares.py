@@ -0,0 +1,87 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+
+from whimo.db.enums import TransactionStatus, TransactionType
+from whimo.db.models import Balance, Transaction
+from whimo.transactions.mass_balance import UNKNOWN_SHARES, Shares, add_to_balance, get_own_shares, mix_shares
+
+TRANSACTION_FIELDS = ("id", "type", "group_id", "traceability", "commodity_id", "volume", "seller_id", "buyer_id")
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill traceability shares of transactions and balances by replaying accepted transactions in creation order. "
+        "Writes to transactions and balances wait until the replay is done, run it in a maintenance window."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=5_000)
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        # Accepts and conversions during the replay would be overwritten by the replayed balances
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                tables = ", ".join(connection.ops.quote_name(model._meta.db_table) for model in (Transaction, Balance))
+                cursor.execute(f"LOCK TABLE {tables} IN EXCLUSIVE MODE")
+
+            replayed = self.replay(batch_size=options["batch_size"])
+
+        self.stdout.write(f"Replayed {replayed} balances")
+
+    @staticmethod
+    def replay(batch_size: int) -> int:
+        pools: dict[tuple[UUID, UUID], tuple[Decimal, Shares | None]] = {}
+        group_inputs: dict[UUID, list[tuple[Decimal, Shares]]] = defaultdict(list)
+
+        def add(user_id: UUID, commodity_id: UUID, volume: Decimal, shares: Shares) -> None:
+            pool_volume, pool_shares = pools.get((user_id, commodity_id), (Decimal(0), None))
+            pool_shares = add_to_balance(pool_volume, pool_shares, volume, shares)
+            pools[user_id, commodity_id] = (pool_volume + volume, pool_shares)
+
+        def take(user_id: UUID, commodity_id: UUID, volume: Decimal) -> Shares:
+            pool_volume, pool_shares = pools.get((user_id, commodity_id), (Decimal(0), None))
+            pools[user_id, commodity_id] = (pool_volume - volume, pool_shares)
+            return pool_shares or UNKNOWN_SHARES
+
+        # Conversion inputs have negative volumes, so they come before the outputs created at the same time
+        rows = (
+            Transaction.objects.filter(status=TransactionStatus.ACCEPTED)
+            .order_by("created_at", "volume")
+            .values_list(*TRANSACTION_FIELDS)
+            .iterator(chunk_size=batch_size)
+        )
+
+        updated: list[Transaction] = []
+        for transaction_id, type_, group_id, traceability, commodity_id, volume, seller_id, buyer_id in rows:
+            if type_ == TransactionType.CONVERSION and buyer_id is None:
+                shares = take(seller_id, commodity_id, -volume)
+                group_inputs[group_id].append((volume, shares))
+            elif type_ == TransactionType.CONVERSION:
+                shares = mix_shares(group_inputs[group_id]) or get_own_shares(traceability)
+            elif seller_id:
+                shares = take(seller_id, commodity_id, volume)
+            else:
+                shares = get_own_shares(traceability)
+
+            if buyer_id:
+                add(buyer_id, commodity_id, volume, shares)
+
+            updated.append(Transaction(id=transaction_id, traceability_shares=shares))
+            if len(updated) >= batch_size:
+                Transaction.objects.bulk_update(updated, ["traceability_shares"])
+                updated.clear()
+
+        Transaction.objects.bulk_update(updated, ["traceability_shares"], batch_size=batch_size)
+
+        balances = [
+            Balance(id=balance_id, traceability_shares=pools.get((user_id, commodity_id), (None, None))[1])
+            for balance_id, user_id, commodity_id in Balance.objects.values_list("id", "user_id", "commodity_id")
+        ]
+        Balance.objects.bulk_update(balances, ["traceability_shares"], batch_size=batch_size)
+
+        return len(pools)
@@ -0,0 +1,65 @@
+import statistics
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from whimo.common.utils import get_user_model
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare request latency and connection churn with and without persistent database connections"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--conn-max-age", type=int, nargs="+", default=[0, 60])
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        connection = connections[options["database"]]
+        initial_max_age = connection.settings_dict["CONN_MAX_AGE"]
+
+        self.stdout.write(f"{connection.settings_dict['HOST']}, {options['requests']} requests per setting:")
+        try:
+            for max_age in options["conn_max_age"]:
+                self._run(options["database"], max_age=max_age, total=options["requests"])
+        finally:
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = initial_max_age
+
+    def _run(self, database: str, max_age: int, total: int) -> None:
+        connection = connections[database]
+        connection.close()
+        connection.settings_dict["CONN_MAX_AGE"] = max_age
+
+        created = 0
+
+        def count_connection(**kwargs: Any) -> None:
+            nonlocal created
+            if kwargs["connection"].alias == database:
+                created += 1
+
+        connection_created.connect(count_connection)
+        try:
+            timings = []
+            for _ in range(total):
+                # The request signals open and close connections the same way the WSGI handler and celery tasks do
+                started_at = time.perf_counter()
+                request_started.send(sender=self.__class__)
+                User.objects.using(database).filter(is_active=True).exists()
+                request_finished.send(sender=self.__class__)
+                timings.append((time.perf_counter() - started_at) * 1000)
+        finally:
+            connection_created.disconnect(count_connection)
+
+        quantiles = statistics.quantiles(timings, n=100) if len(timings) > 1 else timings * 99
+        label = "per request" if max_age == 0 else f"CONN_MAX_AGE={max_age}"
+        self.stdout.write(
+            f"  {label}: p50 {quantiles[49]:.2f} ms, p95 {quantiles[94]:.2f} ms, p99 {quantiles[98]:.2f} ms, "
+            f"connections opened {created}"
+        )
@@ -0,0 +1,311 @@
+import json
+import statistics
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable
+from uuid import UUID
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import views
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from whimo.analytics.constants import USER_ANALYTICS_CACHE_KEY
+from whimo.analytics.views import AnalyticsView, UserAnalyticsView
+from whimo.common.metrics import track_metrics
+from whimo.contrib.management.commands.seed_supply_chain import (
+    add_supply_chain_arguments,
+    get_supply_chain_options,
+)
+from whimo.contrib.supply_chain import SupplyChain, generate_supply_chain
+from whimo.contrib.tasks import expire_transactions
+from whimo.contrib.tasks.season_distribution import distribute_transactions_over_seasons
+from whimo.db.enums import TransactionStatus, TransactionType
+from whimo.db.models import Transaction, User
+from whimo.db.storages import AuthStateStorage, ChainsStorage, CommoditiesStorage, ConversionRecipesStorage
+from whimo.db.storages.chains import CHAIN_SUMMARY_CACHE_KEY
+from whimo.transactions.export.resources import TransactionAdminResource
+from whimo.transactions.export.streaming import stream_csv
+from whimo.transactions.services import TransactionsService
+from whimo.transactions.views import (
+    ChainCsvDownloadView,
+    ChainFeatureCollectionDownloadView,
+    ChainLocationBundleDownloadView,
+    ConversionView,
+    TransactionListView,
+    TransactionStatusUpdateView,
+    TransactionTraceabilityCountsView,
+)
+
+SCENARIOS = (
+    "transactions list",
+    "traceability counts",
+    "chain csv",
+    "chain geojson",
+    "chain bundle",
+    "downstream",
+    "downstream csv",
+    "accept",
+    "conversion",
+    "analytics",
+    "user analytics",
+    "expire task",
+    "season distribution",
+)
+EXPIRED_TRANSACTIONS = 50
+
+
+@dataclass(slots=True)
+class Scenario:
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+
+
+class Command(BaseCommand):
+    help = "Seed a supply chain inside a rolled back transaction, time the hot paths and save the results as JSON"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        add_supply_chain_arguments(parser)
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument("--only", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+        parser.add_argument("--output", type=Path, help="File to save the results to")
+        parser.add_argument("--compare", type=Path, help="Results of a previous run to compare with")
+        parser.add_argument("--max-regression", type=float, help="Fail when a median is slower by more percents")
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1")
+
+        supply_chain_options = get_supply_chain_options(options)
+        baseline = json.loads(options["compare"].read_text())["results"] if options["compare"] else {}
+
+        with transaction.atomic():
+            supply_chain = generate_supply_chain(**supply_chain_options)
+            # Seeded rows are not committed, so the catalogs have to be reloaded inside this transaction
+            CommoditiesStorage.invalidate_catalog()
+            ConversionRecipesStorage.invalidate_catalog()
+
+            scenarios = [item for item in self._get_scenarios(supply_chain) if item.name in options["only"]]
+            results = {item.name: self._measure(item, options["repeat"]) for item in scenarios}
+            transaction.set_rollback(True)
+
+        # Catalogs and states built from the seeded rows must not outlive the rollback
+        CommoditiesStorage.invalidate_catalog()
+        ConversionRecipesStorage.invalidate_catalog()
+        for user in supply_chain.tiers[-1]:
+            AuthStateStorage.invalidate(user.pk)
+            cache.delete(USER_ANALYTICS_CACHE_KEY.format(user_id=user.pk))
+        cache.delete_many([CHAIN_SUMMARY_CACHE_KEY.format(transaction_id=item.pk) for item in supply_chain.tips])
+
+        self._report(results, baseline)
+
+        if options["output"]:
+            report = {
+                "recorded_at": timezone.now().isoformat(),
+                "options": {**supply_chain_options, "repeat": options["repeat"]},
+                "results": results,
+            }
+            options["output"].write_text(json.dumps(report, indent=2) + "\n")
+            self.stdout.write(f"Results saved to {options['output']}")
+
+        if (max_regression := options["max_regression"]) is not None:
+            regressions = [
+                name
+                for name, result in results.items()
+                if name in baseline and self._get_change(result, baseline[name]) > max_regression
+            ]
+            if regressions:
+                raise CommandError(f"Slower by more than {max_regression}%: {', '.join(regressions)}")
+
+    def _get_scenarios(self, supply_chain: SupplyChain) -> list[Scenario]:
+        tip = supply_chain.tips[0]
+        buyer = next(user for user in supply_chain.tiers[-1] if user.pk == tip.buyer_id)
+        chain_kwargs: dict[str, Any] = {"transaction_id": tip.pk}
+        harvest_ids = [supply_chain.harvests[0].pk]
+
+        def create_pending() -> UUID:
+            pending = Transaction.objects.create(
+                type=TransactionType.DOWNSTREAM,
+                status=TransactionStatus.PENDING,
+                commodity_id=tip.commodity_id,
+                volume=tip.volume,
+                seller_id=tip.seller_id,
+                buyer_id=tip.buyer_id,
+                created_by_id=tip.created_by_id,
+            )
+            return pending.pk
+
+        def create_expired() -> None:
+            Transaction.objects.bulk_create(
+                Transaction(
+                    type=TransactionType.DOWNSTREAM,
+                    commodity_id=tip.commodity_id,
+                    volume=tip.volume,
+                    seller_id=tip.seller_id,
+                    buyer_id=tip.buyer_id,
+                    created_by_id=tip.created_by_id,
+                    expires_at=timezone.now() - timedelta(minutes=1),
+                )
+                for _ in range(EXPIRED_TRANSACTIONS)
+            )
+
+        def clear_chain_summary() -> None:
+            # Measure the traversal rather than the cached summary
+            cache.delete(CHAIN_SUMMARY_CACHE_KEY.format(transaction_id=tip.pk))
+
+        def reset_seasons() -> None:
+            Transaction.objects.filter(pk__in=[item.pk for item in supply_chain.transactions]).update(season=None)
+
+        return [
+            Scenario(
+                "transactions list",
+                lambda _: self._request(TransactionListView, buyer, "get", reverse("transactions_list")),
+            ),
+            Scenario(
+                "traceability counts",
+                lambda _: self._request(
+                    TransactionTraceabilityCountsView,
+                    buyer,
+                    "get",
+                    reverse("transactions_traceability_counts", kwargs=chain_kwargs),
+                    **chain_kwargs,
+                ),
+                setup=clear_chain_summary,
+            ),
+            Scenario(
+                "chain csv",
+                lambda _: self._request(
+                    ChainCsvDownloadView,
+                    buyer,
+                    "get",
+                    reverse("transactions_chain_csv_download", kwargs=chain_kwargs),
+                    **chain_kwargs,
+                ),
+                setup=clear_chain_summary,
+            ),
+            Scenario(
+                "chain geojson",
+                lambda _: self._request(
+                    ChainFeatureCollectionDownloadView,
+                    buyer,
+                    "get",
+                    reverse("transactions_chain_download", kwargs=chain_kwargs),
+                    **chain_kwargs,
+                ),
+                setup=clear_chain_summary,
+            ),
+            Scenario(
+                "chain bundle",
+                lambda _: self._request(
+                    ChainLocationBundleDownloadView,
+                    buyer,
+                    "get",
+                    reverse("transactions_chain_bundle_download", kwargs=chain_kwargs),
+                    **chain_kwargs,
+                ),
+                setup=clear_chain_summary,
+            ),
+            Scenario("downstream", lambda _: ChainsStorage.get_downstream_transactions(harvest_ids)),
+            Scenario(
+                "downstream csv",
+                lambda _: list(
+                    stream_csv(TransactionAdminResource(), TransactionsService.get_downstream_csv_export(harvest_ids))
+                ),
+            ),
+            Scenario(
+                "accept",
+                lambda transaction_id: self._request(
+                    TransactionStatusUpdateView,
+                    buyer,
+                    "patch",
+                    reverse("transactions_status_update", kwargs={"transaction_id": transaction_id}),
+                    data={"status": TransactionStatus.ACCEPTED},
+                    transaction_id=transaction_id,
+                ),
+                setup=create_pending,
+            ),
+            Scenario(
+                "conversion",
+                lambda _: self._request(
+                    ConversionView,
+                    buyer,
+                    "post",
+                    reverse("transactions_conversion"),
+                    data={"recipe_id": str(supply_chain.recipe.pk)},
+                ),
+            ),
+            Scenario("analytics", lambda _: self._request(AnalyticsView, buyer, "get", reverse("analytics"))),
+            Scenario(
+                "user analytics",
+                lambda _: self._request(UserAnalyticsView, buyer, "get", reverse("user_analytics")),
+                # Measure the computation rather than the cached response
+                setup=lambda: cache.delete(USER_ANALYTICS_CACHE_KEY.format(user_id=buyer.pk)),
+            ),
+            Scenario("expire task", lambda _: expire_transactions(), setup=create_expired),
+            Scenario("season distribution", lambda _: distribute_transactions_over_seasons(), setup=reset_seasons),
+        ]
+
+    @staticmethod
+    def _request(
+        view_class: type[views.APIView],
+        user: User,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        factory = APIRequestFactory()
+        request = getattr(factory, method)(path, data, format="json") if data else getattr(factory, method)(path)
+        force_authenticate(request, user=user)
+
+        # Throttling would reject repeated runs
+        response = view_class.as_view(throttle_classes=())(request, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+
+        if response.status_code >= 400:  # noqa: PLR2004 Magic value used in comparison
+            raise CommandError(f"{method.upper()} {path} failed with {response.status_code}: {response.content!r}")
+
+    @staticmethod
+    def _measure(scenario: Scenario, repeat: int) -> dict[str, Any]:
+        timings, queries, storage_calls = [], [], []
+        for _ in range(repeat):
+            argument = scenario.setup()
+            with track_metrics() as metrics:
+                scenario.run(argument)
+
+            timings.append(metrics.duration * 1000)
+            queries.append(metrics.queries)
+            storage_calls.append(metrics.storage_calls)
+
+        p95 = statistics.quantiles(timings, n=20, method="inclusive")[-1] if len(timings) > 1 else timings[0]
+        return {
+            "runs": repeat,
+            "median_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(p95, 3),
+            "best_ms": round(min(timings), 3),
+            "queries": max(queries),
+            "storage_calls": max(storage_calls),
+        }
+
+    @staticmethod
+    def _get_change(result: dict[str, Any], previous: dict[str, Any]) -> float:
+        return (result["median_ms"] - previous["median_ms"]) / previous["median_ms"] * 100
+
+    def _report(self, results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]]) -> None:
+        for name, result in results.items():
+            line = (
+                f"{name}: median {result['median_ms']:.2f} ms, p95 {result['p95_ms']:.2f} ms, "
+                f"best {result['best_ms']:.2f} ms, {result['queries']} queries, {result['storage_calls']} storage calls"
+            )
+            if previous := baseline.get(name):
+                line += (
+                    f" ({self._get_change(result, previous):+.1f}% vs {previous['median_ms']:.2f} ms, "
+                    f"{result['queries'] - previous['queries']:+d} queries)"
+                )
+            self.stdout.write(line)
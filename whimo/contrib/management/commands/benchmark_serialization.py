@@ -0,0 +1,144 @@
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+from pydantic import BaseModel
+from rest_framework.renderers import JSONRenderer
+
+from whimo.commodities.schemas.dto import (
+    BalanceDTO,
+    CommodityGroupDTO,
+    CommodityGroupWithCommoditiesBalancesDTO,
+    CommodityWithBalanceDTO,
+    CommodityWithGroupDTO,
+)
+from whimo.common.responses import ModelResponse
+from whimo.common.schemas.base import BaseResponse, PaginatedDataResponse, Pagination
+from whimo.db.enums import GadgetType, TransactionAction, TransactionLocation, TransactionStatus, TransactionType
+from whimo.db.enums.notifications import NotificationStatus, NotificationType
+from whimo.db.enums.transactions import TransactionTraceability
+from whimo.notifications.schemas.dto import NotificationDTO
+from whimo.transactions.schemas.dto import TransactionDTO
+from whimo.users.schemas.dto import GadgetDTO, UserDTO
+
+
+class Command(BaseCommand):
+    help = "Compare rendering list responses through dumped dicts and the DRF encoder with pydantic JSON rendering"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        page_size, repeat = options["page_size"], options["repeat"]
+        payloads: dict[str, list[BaseModel]] = {
+            "transactions": [self._transaction() for _ in range(page_size)],
+            "notifications": [self._notification() for _ in range(page_size)],
+            "balances": [self._balance() for _ in range(page_size)],
+            "commodities groups": [self._group() for _ in range(page_size)],
+        }
+
+        for endpoint, items in payloads.items():
+            pagination = Pagination(count=len(items), page=1, page_size=page_size, total_pages=1)
+            response = PaginatedDataResponse(data=items, pagination=pagination)
+
+            drf_content = self._render_with_drf(response)
+            pydantic_content = self._render_with_pydantic(response)
+            if drf_content != pydantic_content:
+                self.stderr.write(f"{endpoint}: rendered content differs")
+
+            self.stdout.write(f"{endpoint} ({len(drf_content)} bytes):")
+            for name, render in (
+                ("dict + DRF encoder", self._render_with_drf),
+                ("pydantic", self._render_with_pydantic),
+            ):
+                timings = self._measure(render, response, repeat)
+                self.stdout.write(
+                    f"  {name}: median {statistics.median(timings):.2f} ms, best {min(timings):.2f} ms, runs {repeat}"
+                )
+
+    @staticmethod
+    def _render_with_drf(response: BaseResponse) -> bytes:
+        return JSONRenderer().render(response.model_dump(exclude=response.exclude_fields))
+
+    @staticmethod
+    def _render_with_pydantic(response: BaseResponse) -> bytes:
+        return ModelResponse(model=response, exclude=response.exclude_fields).render_json()
+
+    @staticmethod
+    def _measure(render: Callable[[BaseResponse], bytes], response: BaseResponse, repeat: int) -> list[float]:
+        timings = []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            render(response)
+            timings.append((time.perf_counter() - started_at) * 1000)
+        return timings
+
+    @staticmethod
+    def _now() -> datetime:
+        return timezone.now() - timedelta(microseconds=uuid4().int % 10**9)
+
+    @staticmethod
+    def _user() -> UserDTO:
+        gadgets = [
+            GadgetDTO(id=uuid4(), type=GadgetType.EMAIL, identifier="trader@example.com", is_verified=True),
+            GadgetDTO(id=uuid4(), type=GadgetType.PHONE, identifier="+10000000000", is_verified=True),
+        ]
+        return UserDTO(id=uuid4(), username="trader", gadgets=gadgets)
+
+    @staticmethod
+    def _commodity() -> CommodityWithGroupDTO:
+        group = CommodityGroupDTO(id=uuid4(), name="Cocoa")
+        return CommodityWithGroupDTO(
+            id=uuid4(), code="CC001", name="Cocoa beans", unit="kg", has_recipe=True, group=group
+        )
+
+    def _transaction(self) -> TransactionDTO:
+        buyer, seller = self._user(), self._user()
+        return TransactionDTO(
+            id=uuid4(),
+            created_at=self._now(),
+            type=TransactionType.DOWNSTREAM,
+            status=TransactionStatus.ACCEPTED,
+            action=TransactionAction.BUYING,
+            traceability=TransactionTraceability.FULL,
+            location=TransactionLocation.GPS,
+            transaction_latitude=Decimal("5.603717"),
+            transaction_longitude=Decimal("-0.186964"),
+            farm_latitude=Decimal("6.688480"),
+            farm_longitude=Decimal("-1.624430"),
+            commodity=self._commodity(),
+            volume=Decimal("1250.75"),
+            is_buying_from_farmer=False,
+            is_automatic=False,
+            expires_at=None,
+            updated_at=self._now(),
+            seller=seller,
+            buyer=buyer,
+            created_by_id=buyer.id,
+        )
+
+    def _notification(self) -> NotificationDTO:
+        return NotificationDTO(
+            id=uuid4(),
+            created_at=self._now(),
+            data={"transaction": {"id": str(uuid4()), "volume": 1250.75, "status": "pending"}},
+            type=NotificationType.TRANSACTION_PENDING,
+            status=NotificationStatus.PENDING,
+            received_by=self._user(),
+            created_by=self._user(),
+        )
+
+    def _balance(self) -> BalanceDTO:
+        return BalanceDTO(id=uuid4(), volume=Decimal("987.65"), commodity=self._commodity(), has_recipe=True)
+
+    def _group(self) -> CommodityGroupWithCommoditiesBalancesDTO:
+        commodities = [
+            CommodityWithBalanceDTO(**self._commodity().model_dump(), balance=Decimal("42.5")) for _ in range(5)
+        ]
+        return CommodityGroupWithCommoditiesBalancesDTO(id=uuid4(), name="Cocoa", commodities=commodities)
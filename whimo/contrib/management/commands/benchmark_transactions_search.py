@@ -0,0 +1,114 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+
+from whimo.common.utils import get_user_model
+from whimo.db.enums import TransactionStatus, TransactionType
+from whimo.db.models import Commodity, CommodityGroup, Transaction
+from whimo.db.storages import CommoditiesStorage, TransactionsStorage
+from whimo.transactions.schemas.requests import TransactionListRequest
+
+User = get_user_model()
+
+PAGE_SIZE = 20
+
+
+class Command(BaseCommand):
+    help = "Seed transactions inside a rolled back transaction and compare transaction search query plans"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--transactions", type=int, default=1_000_000)
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--commodities", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument("--search", default="cocoa")
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        with transaction.atomic():
+            user = self._seed(options)
+            self._run(user, search=options["search"], repeat=options["repeat"])
+            transaction.set_rollback(True)
+
+        # The registry snapshot built from the seeded rows must not outlive the rollback
+        CommoditiesStorage.invalidate_catalog()
+
+    def _seed(self, options: dict[str, Any]) -> Any:
+        groups = CommodityGroup.objects.bulk_create(
+            CommodityGroup(name=f"benchmark group {index}") for index in range(10)
+        )
+        commodities = Commodity.objects.bulk_create(
+            Commodity(
+                code=f"BM{index:05d}",
+                name=f"{options['search']} {index}" if index % 20 == 0 else f"benchmark commodity {index}",
+                name_variants=[f"variant {index}"],
+                unit="kg",
+                group=groups[index % len(groups)],
+            )
+            for index in range(options["commodities"])
+        )
+        users = User.objects.bulk_create(
+            User(username=f"benchmark-{index}-{random.getrandbits(32):08x}") for index in range(options["users"])
+        )
+
+        created = 0
+        while created < options["transactions"]:
+            size = min(options["batch_size"], options["transactions"] - created)
+            Transaction.objects.bulk_create(
+                Transaction(
+                    type=TransactionType.DOWNSTREAM,
+                    status=TransactionStatus.ACCEPTED,
+                    commodity=random.choice(commodities),
+                    volume=Decimal(random.randint(1, 1000)),
+                    seller=random.choice(users),
+                    buyer=(buyer := random.choice(users)),
+                    created_by=buyer,
+                )
+                for _ in range(size)
+            )
+            created += size
+            self.stdout.write(f"Seeded {created} transactions")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Transaction._meta.db_table}")
+
+        # Seeded rows are not committed, so the registry has to be reloaded inside this transaction
+        CommoditiesStorage.invalidate_catalog()
+        CommoditiesStorage.get_catalog()
+        return users[0]
+
+    def _run(self, user: Any, search: str, repeat: int) -> None:
+        def join_search() -> QuerySet[Transaction]:
+            return Transaction.objects.filter(
+                Q(buyer_id=user.pk) | Q(seller_id=user.pk),
+                Q(commodity__name__icontains=search)
+                | Q(commodity__code__icontains=search)
+                | Q(commodity__name_variants__icontains=search),
+            )
+
+        def registry_search() -> QuerySet[Transaction]:
+            queryset = TransactionsStorage.filter_transactions(user.pk, TransactionListRequest(search=search))
+            return queryset.select_related(None).prefetch_related(None)
+
+        for name, build_queryset in (("join icontains", join_search), ("registry commodity ids", registry_search)):
+            timings = self._measure(build_queryset, repeat)
+            self.stdout.write(
+                f"{name}: median {statistics.median(timings):.2f} ms, best {min(timings):.2f} ms, runs {repeat}"
+            )
+
+    @staticmethod
+    def _measure(build_queryset: Callable[[], QuerySet[Transaction]], repeat: int) -> list[float]:
+        timings = []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            queryset = build_queryset()
+            queryset.count()
+            list(queryset.order_by("-created_at")[:PAGE_SIZE])
+            timings.append((time.perf_counter() - started_at) * 1000)
+        return timings
@@ -0,0 +1,78 @@
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from rest_framework_simplejwt.tokens import AccessToken
+
+from whimo.common.utils import get_user_model
+
+User = get_user_model()
+
+DOWNLOAD_PATHS = {
+    "geojson": "/api/v1/transactions/{transaction_id}/download/geojson/",
+    "csv": "/api/v1/transactions/{transaction_id}/download/csv/",
+    "bundle": "/api/v1/transactions/{transaction_id}/download/bundle/",
+    "analytics": "/api/v1/analytics/",
+}
+
+
+class Command(BaseCommand):
+    help = "Send concurrent download and analytics requests to a running server and report throughput and latency"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--username", required=True)
+        parser.add_argument("--transaction-id", type=UUID)
+        parser.add_argument("--endpoint", choices=DOWNLOAD_PATHS, default="geojson")
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--timeout", type=float, default=60)
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        if options["endpoint"] != "analytics" and options["transaction_id"] is None:
+            raise CommandError("--transaction-id is required for download endpoints")
+
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"User {options['username']} does not exist")
+
+        path = DOWNLOAD_PATHS[options["endpoint"]].format(transaction_id=options["transaction_id"])
+        url = options["base_url"].rstrip("/") + path
+        # Download endpoints are throttled per user, the target server should run with throttling relaxed
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+        self.stdout.write(f"{url}, {options['requests']} requests per level:")
+        for concurrency in options["concurrency"]:
+            self._run(url, headers, concurrency=concurrency, total=options["requests"], timeout=options["timeout"])
+
+    def _run(self, url: str, headers: dict[str, str], concurrency: int, total: int, timeout: float) -> None:
+        def send(_: int) -> tuple[float, int]:
+            request = urllib.request.Request(url, headers=headers)
+            started_at = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    response.read()
+                    status = response.status
+            except urllib.error.HTTPError as exc:
+                status = exc.code
+            except OSError:
+                status = 0
+            return (time.perf_counter() - started_at) * 1000, status
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(send, range(total)))
+        elapsed = time.perf_counter() - started_at
+
+        timings = sorted(timing for timing, _ in results)
+        errors = sum(1 for _, status in results if status != 200)  # noqa: PLR2004 Magic value used in comparison
+        quantiles = statistics.quantiles(timings, n=100) if len(timings) > 1 else timings * 99
+        self.stdout.write(
+            f"  concurrency {concurrency}: {total / elapsed:.1f} req/s, "
+            f"p50 {quantiles[49]:.1f} ms, p95 {quantiles[94]:.1f} ms, p99 {quantiles[98]:.1f} ms, errors {errors}"
+        )
@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from whimo.db.partitioning import PARTITIONED_TABLES, create_future_partitions, detach_old_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = "Create monthly partitions for the coming months and detach the ones older than the retention period"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument("--months-ahead", type=int, default=3)
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=None,
+            help=(
+                "Detach partitions of notifications and history tables of months before the last N ones, "
+                "none are detached by default, transactions are never detached"
+            ),
+        )
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        connection = connections[options["database"]]
+
+        for table in PARTITIONED_TABLES:
+            if not is_partitioned(connection, table):
+                raise CommandError(f"Table {table.name} is not partitioned")
+
+        for name in create_future_partitions(connection, months_ahead=options["months_ahead"]):
+            self.stdout.write(f"Created {name}")
+
+        if (retention_months := options["retention_months"]) is not None:
+            for name in detach_old_partitions(connection, retention_months=retention_months):
+                self.stdout.write(f"Detached {name}")
@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+# Runs in a fresh interpreter, so imports done by this command don't hide the cost of a worker boot.
+# Settings time initializers are wrapped before the settings module calls them.
+BOOT_SCRIPT = """
+import json
+import sys
+import time
+
+import firebase_admin
+import sentry_sdk
+
+initializers = {}
+
+
+def timed(name, func):
+    def wrapper(*args, **kwargs):
+        started_at = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            initializers[name] = initializers.get(name, 0) + (time.perf_counter() - started_at) * 1000
+
+    return wrapper
+
+
+sentry_sdk.init = timed("sentry_sdk.init", sentry_sdk.init)
+firebase_admin.initialize_app = timed("firebase_admin.initialize_app", firebase_admin.initialize_app)
+firebase_admin.credentials.Certificate = timed(
+    "firebase_admin.credentials.Certificate", firebase_admin.credentials.Certificate
+)
+
+phases = {}
+started_at = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+
+application = get_wsgi_application()
+phases["django setup"] = (time.perf_counter() - started_at) * 1000
+
+started_at = time.perf_counter()
+from django.urls import get_resolver
+
+get_resolver().url_patterns
+phases["url patterns"] = (time.perf_counter() - started_at) * 1000
+
+print(json.dumps({"phases": phases, "initializers": initializers}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Boot the WSGI application in a fresh interpreter and report import time per app and settings initializers"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--limit", type=int, default=20)
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "whimo.settings")},
+            check=False,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr[-2000:])
+
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        self.stdout.write("Boot phases:")
+        for name, duration in report["phases"].items():
+            self.stdout.write(f"  {name}: {duration:.1f} ms")
+
+        self.stdout.write("Settings initializers:")
+        for name, duration in sorted(report["initializers"].items(), key=lambda item: -item[1]):
+            self.stdout.write(f"  {name}: {duration:.1f} ms")
+
+        groups = self._group_import_times(result.stderr)
+        self.stdout.write(f"Import time by package, {sum(groups.values()) / 1000:.1f} ms total:")
+        for name, duration in sorted(groups.items(), key=lambda item: -item[1])[: options["limit"]]:
+            self.stdout.write(f"  {name}: {duration / 1000:.1f} ms")
+
+    @staticmethod
+    def _group_import_times(output: str) -> dict[str, int]:
+        """Sum own import time (in microseconds) per top level package, whimo modules are grouped per app."""
+        groups: dict[str, int] = defaultdict(int)
+        for line in output.splitlines():
+            if not line.startswith("import time:") or "imported package" in line:
+                continue
+
+            self_time, _, module = line.removeprefix("import time:").split("|")
+            parts = module.strip().split(".")
+            name = ".".join(parts[:2]) if parts[0] == "whimo" else parts[0]
+            groups[name] += int(self_time)
+
+        return groups
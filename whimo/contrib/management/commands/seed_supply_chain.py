@@ -0,0 +1,54 @@
+from collections import Counter
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from whimo.contrib.supply_chain import generate_supply_chain
+from whimo.db.storages import CommoditiesStorage, ConversionRecipesStorage
+
+
+def add_supply_chain_arguments(parser: CommandParser) -> None:
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--conversions", type=int, default=50)
+    parser.add_argument("--commodities", type=int, default=5)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--seed", type=int)
+
+
+def get_supply_chain_options(options: dict[str, Any]) -> dict[str, Any]:
+    if options["depth"] < 1 or options["fan_in"] < 1:
+        raise CommandError("--depth and --fan-in must be positive")
+
+    if options["users"] < options["depth"] + 1:
+        raise CommandError("--users must allow at least one user per tier")
+
+    names = ("depth", "fan_in", "users", "conversions", "commodities", "days", "batch_size", "seed")
+    return {name: options[name] for name in names}
+
+
+class Command(BaseCommand):
+    help = "Seed a supply chain graph of users and accepted transactions, e.g. for load tests or profiling"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        add_supply_chain_arguments(parser)
+
+    def handle(self, *_: Any, **options: Any) -> None:
+        with transaction.atomic():
+            supply_chain = generate_supply_chain(**get_supply_chain_options(options))
+
+        CommoditiesStorage.invalidate_catalog()
+        ConversionRecipesStorage.invalidate_catalog()
+
+        types = Counter(item.type for item in supply_chain.transactions)
+        self.stdout.write(
+            f"Seeded {len(supply_chain.users)} users in tiers of {[len(tier) for tier in supply_chain.tiers]}, "
+            f"{len(supply_chain.transactions)} transactions ({', '.join(f'{k} {v}' for k, v in types.items())})"
+        )
+
+        tip = supply_chain.tips[0]
+        buyer = next(user for user in supply_chain.tiers[-1] if user.pk == tip.buyer_id)
+        self.stdout.write(f"Deepest chain: transaction {tip.pk} bought by {buyer.username}")
@@ -0,0 +1,219 @@
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from decimal import Decimal
+from itertools import chain
+from secrets import token_hex
+from uuid import UUID, uuid4
+
+from django.db import connection
+from django.utils import timezone
+
+from whimo.db.enums import GadgetType, TransactionLocation, TransactionStatus, TransactionType
+from whimo.db.enums.transactions import TransactionTraceability
+from whimo.db.models import (
+    Balance,
+    Commodity,
+    CommodityGroup,
+    ConversionInput,
+    ConversionOutput,
+    ConversionRecipe,
+    Gadget,
+    Season,
+    SeasonCommodity,
+    Transaction,
+    User,
+)
+
+SUPPLY_CHAIN_BALANCE = Decimal(1_000_000)
+
+# `created_at` is always set on insert, so the dates of a tier are spread afterwards
+SPREAD_CREATED_AT_SQL = f"""
+    UPDATE {Transaction._meta.db_table}
+    SET created_at = %s - random() * %s * interval '1 second'
+    WHERE id = ANY(%s::uuid[])
+"""
+
+
+@dataclass(slots=True)
+class SupplyChain:
+    """Seeded users by tier, producers first, and the transactions linking each tier to the previous one."""
+
+    tiers: list[list[User]]
+    commodities: list[Commodity]
+    recipe: ConversionRecipe
+    transactions: list[Transaction]
+
+    @property
+    def users(self) -> list[User]:
+        return list(chain.from_iterable(self.tiers))
+
+    @property
+    def harvests(self) -> list[Transaction]:
+        """Producer transactions of the first tier, the transactions with the deepest downstream."""
+        return [transaction for transaction in self.transactions if transaction.type == TransactionType.PRODUCER]
+
+    @property
+    def tips(self) -> list[Transaction]:
+        """Purchases of the last tier, the transactions with the deepest chains."""
+        last_tier = {user.pk for user in self.tiers[-1]}
+        return [
+            transaction
+            for transaction in self.transactions
+            if transaction.type == TransactionType.DOWNSTREAM and transaction.buyer_id in last_tier
+        ]
+
+
+def generate_supply_chain(  # noqa: PLR0913 Too many arguments
+    depth: int,
+    fan_in: int,
+    users: int,
+    conversions: int = 0,
+    commodities: int = 5,
+    days: int = 365,
+    batch_size: int = 5_000,
+    seed: int | None = None,
+) -> SupplyChain:
+    """Seed a supply chain graph of accepted transactions.
+
+    Users are split into `depth + 1` tiers shrinking by `fan_in`, like many farmers selling to fewer traders,
+    and have a verified email gadget. Producers record a harvest, every user of the next tiers buys from `fan_in`
+    users of the previous one, and `conversions` random traders convert their raw commodity into a processed one.
+    Transactions of a tier are dated after the ones of the previous tier, spread over the last `days`.
+    """
+    rng = random.Random(seed)
+
+    group = CommodityGroup.objects.create(name=f"supply chain {token_hex(4)}")
+    raw_commodities = Commodity.objects.bulk_create(
+        Commodity(code=f"SC{token_hex(6)}", name=f"supply chain raw {index}", unit="kg", group=group)
+        for index in range(commodities)
+    )
+    processed = Commodity.objects.create(
+        code=f"SC{token_hex(6)}", name="supply chain processed", unit="kg", group=group
+    )
+
+    recipe = ConversionRecipe.objects.create(name=f"supply chain recipe {token_hex(4)}")
+    ConversionInput.objects.create(recipe=recipe, commodity=raw_commodities[0], quantity=Decimal(1))
+    ConversionOutput.objects.create(recipe=recipe, commodity=processed, quantity=Decimal("0.8"))
+
+    today = timezone.localdate()
+    season = Season.objects.create(
+        name=f"supply chain season {token_hex(4)}",
+        start_date=today - timedelta(days=days),
+        end_date=today + timedelta(days=30),
+    )
+    SeasonCommodity.objects.bulk_create(
+        SeasonCommodity(season=season, commodity=commodity) for commodity in [*raw_commodities, processed]
+    )
+
+    weights = [fan_in ** (depth - tier) for tier in range(depth + 1)]
+    sizes = [max(1, round(users * weight / sum(weights))) for weight in weights]
+    created_users = User.objects.bulk_create(
+        (User(username=User.objects.create_username(suffix_bytes=8)) for _ in range(sum(sizes))),
+        batch_size=batch_size,
+    )
+    Gadget.objects.bulk_create(
+        (
+            Gadget(type=GadgetType.EMAIL, identifier=f"{user.username}@supply-chain.test", is_verified=True, user=user)
+            for user in created_users
+        ),
+        batch_size=batch_size,
+    )
+    tiers = [created_users[sum(sizes[:tier]) : sum(sizes[: tier + 1])] for tier in range(depth + 1)]
+
+    user_commodities: dict[UUID, Commodity] = {}
+    tier_transactions: list[list[Transaction]] = [[] for _ in tiers]
+    for user in tiers[0]:
+        user_commodities[user.pk] = rng.choice(raw_commodities)
+        tier_transactions[0].append(_producer_transaction(rng, user, user_commodities[user.pk]))
+
+    for tier in range(1, depth + 1):
+        for buyer in tiers[tier]:
+            suppliers = rng.sample(tiers[tier - 1], min(fan_in, len(tiers[tier - 1])))
+            user_commodities[buyer.pk] = user_commodities[rng.choice(suppliers).pk]
+            tier_transactions[tier].extend(
+                _downstream_transaction(rng, supplier, buyer, user_commodities[supplier.pk]) for supplier in suppliers
+            )
+
+    traders = list(chain.from_iterable(tiers[1:]))
+    for _ in range(conversions):
+        trader = rng.choice(traders)
+        tier_transactions[-1].extend(_conversion_transactions(rng, trader, user_commodities[trader.pk], processed))
+
+    balances = [
+        Balance(user=user, commodity=commodity, volume=SUPPLY_CHAIN_BALANCE)
+        for user in created_users
+        for commodity in {user_commodities[user.pk], raw_commodities[0]}
+    ]
+    Balance.objects.bulk_create(balances, batch_size=batch_size)
+
+    transactions = []
+    now = timezone.now()
+    tier_days = timedelta(days=days / len(tiers))
+    for tier, items in enumerate(tier_transactions):
+        transactions += Transaction.objects.bulk_create(items, batch_size=batch_size)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                SPREAD_CREATED_AT_SQL,
+                [now - tier_days * (len(tiers) - tier - 1), tier_days.total_seconds(), [item.pk for item in items]],
+            )
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Transaction._meta.db_table}")
+
+    return SupplyChain(tiers=tiers, commodities=[*raw_commodities, processed], recipe=recipe, transactions=transactions)
+
+
+def _producer_transaction(rng: random.Random, user: User, commodity: Commodity) -> Transaction:
+    return Transaction(
+        type=TransactionType.PRODUCER,
+        status=TransactionStatus.ACCEPTED,
+        traceability=rng.choice(list(TransactionTraceability)),
+        location=rng.choice(list(TransactionLocation)),
+        farm_latitude=Decimal(f"{rng.uniform(-20, 20):.6f}"),
+        farm_longitude=Decimal(f"{rng.uniform(-80, 120):.6f}"),
+        commodity=commodity,
+        volume=Decimal(rng.randint(100, 1000)),
+        buyer=user,
+        created_by=user,
+        is_buying_from_farmer=rng.random() < 0.5,  # noqa: PLR2004 Magic value used in comparison
+    )
+
+
+def _downstream_transaction(rng: random.Random, seller: User, buyer: User, commodity: Commodity) -> Transaction:
+    return Transaction(
+        type=TransactionType.DOWNSTREAM,
+        status=TransactionStatus.ACCEPTED,
+        traceability=rng.choice(list(TransactionTraceability)),
+        commodity=commodity,
+        volume=Decimal(rng.randint(10, 100)),
+        seller=seller,
+        buyer=buyer,
+        created_by=seller,
+    )
+
+
+def _conversion_transactions(
+    rng: random.Random, user: User, commodity: Commodity, processed: Commodity
+) -> list[Transaction]:
+    group_id, volume = uuid4(), Decimal(rng.randint(10, 100))
+    return [
+        Transaction(
+            type=TransactionType.CONVERSION,
+            status=TransactionStatus.ACCEPTED,
+            commodity=commodity,
+            volume=volume,
+            seller=user,
+            created_by=user,
+            group_id=group_id,
+        ),
+        Transaction(
+            type=TransactionType.CONVERSION,
+            status=TransactionStatus.ACCEPTED,
+            commodity=processed,
+            volume=volume * Decimal("0.8"),
+            buyer=user,
+            created_by=user,
+            group_id=group_id,
+        ),
+    ]
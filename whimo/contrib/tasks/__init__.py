@@ -1,13 +1,18 @@
-from whimo.contrib.tasks.cleanup import cleanup_unverified_gadgets
+from whimo.contrib.tasks.cleanup import archive_notifications, cleanup_unverified_gadgets
+from whimo.contrib.tasks.history import write_historical_records
 from whimo.contrib.tasks.notifications import send_apns_push, send_gcm_push
+from whimo.contrib.tasks.partitions import create_partitions
 from whimo.contrib.tasks.transactions import expire_transactions
 from whimo.contrib.tasks.users import send_email, send_sms
 
 __all__ = (
+    "archive_notifications",
     "cleanup_unverified_gadgets",
+    "create_partitions",
     "expire_transactions",
     "send_apns_push",
     "send_email",
     "send_gcm_push",
     "send_sms",
+    "write_historical_records",
 )
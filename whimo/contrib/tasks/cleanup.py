@@ -2,9 +2,11 @@ import logging
 from datetime import timedelta
 
 from celery import current_app
+from django.conf import settings
 from django.utils import timezone
 
 from whimo.db.models import Gadget
+from whimo.notifications.services.notifications import NotificationsService
 
 logger = logging.getLogger(__name__)
 
@@ -20,3 +22,13 @@ def cleanup_unverified_gadgets() -> None:
 
     deleted_count, _ = unverified_gadgets.delete()
     logger.info("Cleaned up %d unverified gadgets older than 30 days", deleted_count)
+
+
+@current_app.task(
+    autoretry_for=[Exception],
+    retry_backoff=True,
+    max_retries=3,
+)
+def archive_notifications() -> None:
+    archived_count = NotificationsService.archive_notifications(batch_size=settings.NOTIFICATIONS_ARCHIVE_BATCH_SIZE)
+    logger.info("Archived %d expired notifications", archived_count)
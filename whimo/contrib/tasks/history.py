@@ -0,0 +1,18 @@
+import logging
+
+from celery import current_app
+from django.conf import settings
+
+from whimo.db.history import write_queued_historical_records
+
+logger = logging.getLogger(__name__)
+
+
+@current_app.task(
+    autoretry_for=[Exception],
+    retry_backoff=True,
+    max_retries=3,
+)
+def write_historical_records() -> None:
+    written = write_queued_historical_records(batch_size=settings.HISTORY_WRITE_BATCH_SIZE)
+    logger.info("Wrote %d queued historical records", written)
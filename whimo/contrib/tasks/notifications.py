@@ -1,17 +1,35 @@
 import json
 import logging
+import threading
+from functools import cache
 
+import firebase_admin
 from celery import current_app
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from firebase_admin.messaging import Message
 from push_notifications.apns_async import Alert
 from push_notifications.models import APNSDevice, GCMDevice
 
 from whimo.db.models import NotificationSettings
+from whimo.db.storages.notifications import NOTIFICATION_COUNTERS_TOTAL, NotificationCountersStorage
 from whimo.notifications.schemas.dto import NotificationDTO
 
 logger = logging.getLogger(__name__)
 
+firebase_app_lock = threading.Lock()
+
+
+@cache
+def get_firebase_app() -> firebase_admin.App:
+    """Default Firebase app, initialized on first use so processes that never send pushes skip the setup."""
+    with firebase_app_lock:
+        try:
+            return firebase_admin.get_app()
+        except ValueError:
+            credential = firebase_admin.credentials.Certificate(settings.PUSH_NOTIFICATIONS_FCM_CREDENTIALS_PATH)
+            return firebase_admin.initialize_app(credential=credential)
+
 
 @current_app.task(
     autoretry_for=[Exception],
@@ -33,7 +51,11 @@ def send_gcm_push(notification_data: dict) -> None:
     notification_json = json.dumps(notification_data, cls=DjangoJSONEncoder)
     message = Message(data={"data": notification_json})
 
-    for device in GCMDevice.objects.filter(user_id=notification.received_by.id):
+    devices = list(GCMDevice.objects.filter(user_id=notification.received_by.id))
+    if devices and settings.PUSH_NOTIFICATIONS_FCM_ENABLED:
+        get_firebase_app()
+
+    for device in devices:
         device.send_message(message)
 
 
@@ -57,15 +79,8 @@ def send_apns_push(notification_data: dict) -> None:
     notification_json = json.dumps(notification_data, cls=DjangoJSONEncoder)
     alert = Alert(body=notification_json)
 
-    # TODO: Uncomment when IOS app is ready
-    # from whimo.db.enums.notifications import NotificationStatus
-    # from whimo.db.models import Notification
-    # badge_count = Notification.objects.filter(
-    #     received_by_id=notification.received_by.id,
-    #     status=NotificationStatus.PENDING,
-    # ).count()
+    counters = NotificationCountersStorage.get_counters(notification.received_by.id)
+    badge_count = counters.get(NOTIFICATION_COUNTERS_TOTAL, 0)
 
     for device in APNSDevice.objects.filter(user_id=notification.received_by.id):
-        device.send_message(alert, mutable_content=True)
-        # TODO: Uncomment when IOS app is ready
-        # device.send_message(alert, badge=badge_count, mutable_content=True)
+        device.send_message(alert, badge=badge_count, mutable_content=True)
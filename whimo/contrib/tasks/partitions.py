@@ -0,0 +1,20 @@
+import logging
+
+from celery import current_app
+from django.db import connection
+
+from whimo.db.partitioning import create_future_partitions
+
+logger = logging.getLogger(__name__)
+
+PARTITIONS_MONTHS_AHEAD = 3
+
+
+@current_app.task(
+    autoretry_for=[Exception],
+    retry_backoff=True,
+    max_retries=3,
+)
+def create_partitions() -> None:
+    created = create_future_partitions(connection, months_ahead=PARTITIONS_MONTHS_AHEAD)
+    logger.info("Created %d partitions: %s", len(created), ", ".join(created))
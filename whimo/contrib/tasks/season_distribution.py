@@ -5,6 +5,7 @@ from uuid import UUID
 from celery import current_app
 from django.db.models import Q
 
+from whimo.db.history import bulk_update_with_history
 from whimo.db.models import Season, Transaction
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ def distribute_transactions_over_seasons(batch_size: int = 500) -> None:
             transaction.season = _find_matching_season(transaction.created_at, transaction.commodity_id)
             transactions_to_update.append(transaction)
 
-        Transaction.objects.bulk_update(transactions_to_update, ["season", "updated_at"])
+        bulk_update_with_history(transactions_to_update, Transaction, ["season", "updated_at"])
 
 
 def _find_matching_season(created_at: datetime, commodity_id: UUID) -> Season | None:
@@ -1,4 +1,5 @@
 import logging
+from uuid import UUID
 
 from celery import current_app
 from django.db import transaction as db_transaction
@@ -32,3 +33,13 @@ def expire_transactions() -> None:
                 created_by_id=None,
             )
             NotificationsPushService.send_push([notification.id])
+
+
+@current_app.task
+def notify_downstream_buyers(transaction_ids: list[str]) -> None:
+    from whimo.transactions.services import TransactionsService
+
+    notified = TransactionsService.notify_downstream_buyers(
+        [UUID(transaction_id) for transaction_id in transaction_ids]
+    )
+    logger.info("Notified %d buyers downstream of %d transactions", notified, len(transaction_ids))
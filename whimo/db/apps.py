@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ModelsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "whimo.db"
+
+    def ready(self) -> None:
+        from whimo.db import signals  # noqa: F401 Imported for signal receivers registration
+        from whimo.db.history import validate_history_policies
+
+        validate_history_policies()
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class HistoryPolicy(StrEnum):
+    SYNC = "sync"
+    SAMPLED = "sampled"
+    ASYNC = "async"
+    OFF = "off"
@@ -0,0 +1,184 @@
+import json
+import logging
+import random
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Sequence, TypeVar
+
+from django.conf import settings
+from django.core import serializers
+from django.core.exceptions import ImproperlyConfigured
+from django.db import OperationalError, models, transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+from simple_history import utils
+from simple_history.manager import HistoryManager
+from simple_history.models import HistoricalRecords
+
+from whimo.db.enums.history import HistoryPolicy
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=models.Model)
+
+HISTORY_QUEUE_KEY = "history:queue"
+HISTORY_DEAD_LETTER_KEY = "history:dead_letter"
+HISTORY_CREATED, HISTORY_CHANGED = "+", "~"
+
+history_records: dict[type[models.Model], "PolicyHistoricalRecords"] = {}
+
+
+def validate_history_policies() -> None:
+    """Fail on startup when `HISTORY_POLICIES` names a model without history or an unknown policy."""
+    labels = {model._meta.label for model in history_records}
+    for label, policy in settings.HISTORY_POLICIES.items():
+        if label not in labels:
+            raise ImproperlyConfigured(f"HISTORY_POLICIES: {label} is not a model with history")
+        if policy not in HistoryPolicy:
+            choices = ", ".join(HistoryPolicy)
+            raise ImproperlyConfigured(f"HISTORY_POLICIES: {policy} policy of {label} is not one of {choices}")
+
+
+def get_history_policy(model: type[models.Model]) -> HistoryPolicy:
+    return HistoryPolicy(settings.HISTORY_POLICIES.get(model._meta.label, HistoryPolicy.SYNC))
+
+
+def is_sampled() -> bool:
+    return random.random() < settings.HISTORY_SAMPLE_RATE
+
+
+class PolicyHistoricalRecords(HistoricalRecords):
+    """`HistoricalRecords` writing history rows as configured for the model in `HISTORY_POLICIES`.
+
+    - sync: one insert per change, in the same transaction
+    - sampled: creations and deletions are recorded, changes only for a `HISTORY_SAMPLE_RATE` share of them
+    - async: rows are queued in Redis after commit and written in batches by `write_historical_records`
+    - off: nothing is recorded
+    """
+
+    if TYPE_CHECKING:
+        # The model attribute is replaced by a descriptor returning the history manager
+        def __get__(self, instance: models.Model | None, owner: type[models.Model]) -> HistoryManager: ...
+
+    def contribute_to_class(self, cls: type[models.Model], name: str) -> None:
+        super().contribute_to_class(cls, name)
+        history_records[cls] = self
+
+    def create_historical_record(self, instance: models.Model, history_type: str, using: str | None = None) -> None:
+        match get_history_policy(type(instance)):
+            case HistoryPolicy.OFF:
+                return
+            case HistoryPolicy.SAMPLED if history_type == HISTORY_CHANGED and not is_sampled():
+                return
+            case HistoryPolicy.ASYNC:
+                enqueue_historical_records([self.build_historical_record(instance, history_type, using=using)])
+            case _:
+                super().create_historical_record(instance, history_type, using=using)
+
+    def build_historical_record(self, instance: models.Model, history_type: str, using: str | None = None) -> Any:
+        """Unsaved history row of `instance`, with the same values `create_historical_record` would save."""
+        manager = getattr(instance, self.manager_name)
+        attrs = {field.attname: getattr(instance, field.attname) for field in self.fields_included(instance)}
+        return manager.model(
+            history_date=getattr(instance, "_history_date", timezone.now()),
+            history_type=history_type,
+            history_user=self.get_history_user(instance),
+            history_change_reason=self.get_change_reason_for_object(instance, history_type, using),
+            **attrs,
+        )
+
+
+def enqueue_historical_records(records: Sequence[models.Model]) -> None:
+    if not records:
+        return
+
+    # Values are stringified, the deserializer converts them back with the field types
+    payload = [json.dumps(item, default=str) for item in serializers.serialize("python", records)]
+    transaction.on_commit(lambda: get_redis_connection().rpush(HISTORY_QUEUE_KEY, *payload))
+
+
+def write_queued_historical_records(batch_size: int) -> int:
+    """Write history rows queued by async policies, one bulk insert per model and batch. Returns the rows count.
+
+    A batch failing for another reason than an unavailable database is written row by row, and the rows that
+    still fail are parked in `HISTORY_DEAD_LETTER_KEY`, so they do not block the rows queued after them.
+    """
+    redis = get_redis_connection()
+
+    written = 0
+    while items := redis.lpop(HISTORY_QUEUE_KEY, batch_size):
+        try:
+            _write_historical_records(items)
+        except OperationalError:
+            # Put the batch back in its original order, so it is retried before newer rows
+            redis.lpush(HISTORY_QUEUE_KEY, *reversed(items))
+            raise
+        except Exception:
+            logger.warning("Failed to write %d historical records, writing them one by one", len(items), exc_info=True)
+            written += _write_historical_records_one_by_one(items)
+        else:
+            written += len(items)
+
+    return written
+
+
+def _write_historical_records(items: Sequence[bytes]) -> None:
+    records: dict[type[models.Model], list[models.Model]] = defaultdict(list)
+    for deserialized in serializers.deserialize("python", [json.loads(item) for item in items]):
+        records[type(deserialized.object)].append(deserialized.object)
+
+    with transaction.atomic():
+        for model, model_records in records.items():
+            model._default_manager.bulk_create(model_records)
+
+
+def _write_historical_records_one_by_one(items: Sequence[bytes]) -> int:
+    redis = get_redis_connection()
+
+    written = 0
+    for item in items:
+        try:
+            _write_historical_records([item])
+        except Exception:
+            logger.exception("Failed to write a historical record, moved it to %s", HISTORY_DEAD_LETTER_KEY)
+            redis.rpush(HISTORY_DEAD_LETTER_KEY, item)
+        else:
+            written += 1
+
+    return written
+
+
+def bulk_create_with_history(objs: Sequence[M], model: type[M]) -> list[M]:
+    """`bulk_create` recording the history of all created rows in one insert, following the model policy."""
+    policy = get_history_policy(model)
+    if policy in {HistoryPolicy.SYNC, HistoryPolicy.SAMPLED}:
+        # Creations are always recorded by the sampled policy
+        return list(utils.bulk_create_with_history(objs, model))
+
+    created = model._default_manager.bulk_create(objs)
+    if policy == HistoryPolicy.ASYNC:
+        records = history_records[model]
+        enqueue_historical_records([records.build_historical_record(obj, HISTORY_CREATED) for obj in created])
+    return created
+
+
+def bulk_update_with_history(objs: Sequence[M], model: type[M], fields: list[str]) -> None:
+    """`bulk_update` recording the history of updated rows in one insert, following the model policy."""
+    model._default_manager.bulk_update(objs, fields)
+    record_changes_history(objs, model)
+
+
+def record_changes_history(objs: Sequence[M], model: type[M]) -> None:
+    """Record the history of rows changed by a bulk query, like `queryset.update`, following the model policy."""
+    policy = get_history_policy(model)
+    if policy == HistoryPolicy.SAMPLED:
+        objs = [obj for obj in objs if is_sampled()]
+
+    if not objs or policy == HistoryPolicy.OFF:
+        return
+
+    # Built like single saves, so the rows record the user of the request
+    records = [history_records[model].build_historical_record(obj, HISTORY_CHANGED) for obj in objs]
+    if policy == HistoryPolicy.ASYNC:
+        enqueue_historical_records(records)
+    else:
+        utils.get_history_model_for_model(model)._default_manager.bulk_create(records)
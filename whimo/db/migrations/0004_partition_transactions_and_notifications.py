@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+from whimo.db.partitioning import PARTITIONED_TABLES, is_partitioned, partition_table
+
+
+def partition_tables(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(schema_editor.connection, table):
+            partition_table(schema_editor.connection, table)
+
+
+def register_create_partitions_task(apps, schema_editor) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+
+    crontab, _ = CrontabSchedule.objects.get_or_create(
+        minute="0",
+        hour="1",
+        day_of_month="*",
+        month_of_year="*",
+        day_of_week="*",
+    )
+
+    PeriodicTask.objects.get_or_create(
+        name="Create partitions",
+        task="whimo.contrib.tasks.partitions.create_partitions",
+        crontab=crontab,
+    )
+
+
+def remove_create_partitions_task(apps, schema_editor) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(task="whimo.contrib.tasks.partitions.create_partitions").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0003_register_periodic_tasks"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        # Irreversible: rows of every monthly partition would have to be moved back into a plain table
+        migrations.RunPython(code=partition_tables),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["received_by", "-created_at"], name="db_notif_recv_created_idx"),
+        ),
+        migrations.RunPython(
+            code=register_create_partitions_task,
+            reverse_code=remove_create_partitions_task,
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+
+def register_write_historical_records_task(apps, schema_editor) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+
+    crontab, _ = CrontabSchedule.objects.get_or_create(
+        minute="*",
+        hour="*",
+        day_of_month="*",
+        month_of_year="*",
+        day_of_week="*",
+    )
+
+    PeriodicTask.objects.get_or_create(
+        name="Write historical records",
+        task="whimo.contrib.tasks.history.write_historical_records",
+        crontab=crontab,
+    )
+
+
+def remove_write_historical_records_task(apps, schema_editor) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(task="whimo.contrib.tasks.history.write_historical_records").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0004_partition_transactions_and_notifications"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=register_write_historical_records_task,
+            reverse_code=remove_write_historical_records_task,
+        ),
+    ]
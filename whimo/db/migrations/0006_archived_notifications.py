@@ -0,0 +1,131 @@
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def register_archive_notifications_task(apps, schema_editor) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    CrontabSchedule = apps.get_model("django_celery_beat", "CrontabSchedule")
+
+    crontab, _ = CrontabSchedule.objects.get_or_create(
+        minute="0",
+        hour="2",
+        day_of_month="*",
+        month_of_year="*",
+        day_of_week="*",
+    )
+
+    PeriodicTask.objects.get_or_create(
+        name="Archive notifications",
+        task="whimo.contrib.tasks.cleanup.archive_notifications",
+        crontab=crontab,
+    )
+
+
+def remove_archive_notifications_task(apps, schema_editor) -> None:
+    PeriodicTask = apps.get_model("django_celery_beat", "PeriodicTask")
+    PeriodicTask.objects.filter(task="whimo.contrib.tasks.cleanup.archive_notifications").delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0005_register_write_historical_records_task"),
+        ("django_celery_beat", "0019_alter_periodictasks_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedNotification",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        editable=False,
+                        help_text="Identifier of the archived notification.",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(help_text="Timestamp when the notification was created.")),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, help_text="Timestamp when the notification was archived."),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Notification data",
+                        null=True,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "PENDING"), ("read", "READ")],
+                        help_text="Status of the notification",
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("transaction_pending", "TRANSACTION_PENDING"),
+                            ("transaction_accepted", "TRANSACTION_ACCEPTED"),
+                            ("transaction_rejected", "TRANSACTION_REJECTED"),
+                            ("transaction_expired", "TRANSACTION_EXPIRED"),
+                            ("geodata_missing", "GEODATA_MISSING"),
+                            ("geodata_updated", "GEODATA_UPDATED"),
+                        ],
+                        help_text="Type of notification",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "history",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Changes of the notification, oldest first",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="User who created this notification",
+                        null=True,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "received_by",
+                    models.ForeignKey(
+                        help_text="User who received this notification",
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="archived_notifications",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived Notification",
+                "verbose_name_plural": "Archived Notifications",
+                "db_table": "notifications_archive",
+                "ordering": ("created_at",),
+                "indexes": [
+                    models.Index(fields=["received_by", "-created_at"], name="db_notif_arch_recv_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=register_archive_notifications_task,
+            reverse_code=remove_archive_notifications_task,
+        ),
+    ]
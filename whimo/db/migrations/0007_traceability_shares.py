@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0006_archived_notifications"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="balance",
+            name="traceability_shares",
+            field=models.JSONField(
+                blank=True,
+                help_text="Fractions of the volume by traceability, following the mass balance of the chain",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="transaction",
+            name="traceability_shares",
+            field=models.JSONField(
+                blank=True,
+                help_text="Fractions of the volume by traceability, following the mass balance of the chain",
+                null=True,
+            ),
+        ),
+    ]
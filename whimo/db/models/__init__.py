@@ -2,12 +2,13 @@ from whimo.db.models.base import BaseModel  # noqa: I001 Import block is un-sort
 from whimo.db.models.balances import Balance
 from whimo.db.models.commodities import Commodity, CommodityGroup
 from whimo.db.models.conversions import ConversionInput, ConversionOutput, ConversionRecipe
-from whimo.db.models.notifications import Notification, NotificationSettings
+from whimo.db.models.notifications import ArchivedNotification, Notification, NotificationSettings
 from whimo.db.models.seasons import Season, SeasonCommodity
 from whimo.db.models.transactions import Transaction
 from whimo.db.models.users import Gadget, User
 
 __all__ = (
+    "ArchivedNotification",
     "Balance",
     "BaseModel",
     "Commodity",
@@ -1,12 +1,17 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models import BaseModel
 
 
 class Balance(BaseModel):
     volume = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    traceability_shares = models.JSONField(
+        null=True,
+        blank=True,
+        help_text=_("Fractions of the volume by traceability, following the mass balance of the chain"),
+    )
     commodity = models.ForeignKey(
         "db.Commodity",
         on_delete=models.PROTECT,
@@ -18,11 +23,12 @@ class Balance(BaseModel):
         help_text=_("Balance user"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
             "updated_at",
+            "traceability_shares",
         ),
         table_name="balances_history",
     )
@@ -6,8 +6,8 @@ from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import Exists, OuterRef, QuerySet, Subquery
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models import Balance, BaseModel
 
 COMMODITY_BALANCE_FIELD = "_balance"
@@ -39,7 +39,7 @@ class CommodityGroup(BaseModel):
         help_text=_("Alternative name variations and translations"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -87,7 +87,7 @@ class Commodity(BaseModel):
             raise AttributeError("`.objects.annotate_balances` must be called to use `balance`.")
         return cast(Decimal | None, balance)
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
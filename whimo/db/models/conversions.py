@@ -3,8 +3,8 @@ from typing import cast
 from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models.base import BaseModel
 
 _not_set = object()
@@ -36,7 +36,7 @@ class ConversionRecipe(BaseModel):
         help_text=_("Name or description of this conversion recipe"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -87,7 +87,7 @@ class ConversionInput(BaseModel):
         help_text=_("Quantity of this commodity required as input"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -123,7 +123,7 @@ class ConversionOutput(BaseModel):
         help_text=_("Quantity of this commodity produced as output"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -1,9 +1,10 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
 from whimo.common.encoders import PrettyJSONEncoder
 from whimo.db.enums.notifications import NotificationStatus, NotificationType
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models import BaseModel
 
 
@@ -39,7 +40,7 @@ class Notification(BaseModel):
         help_text=_("User who created this notification"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -53,6 +54,72 @@ class Notification(BaseModel):
         verbose_name = _("Notification")
         verbose_name_plural = _("Notifications")
         ordering = ("created_at",)
+        indexes = [
+            # Lets each monthly partition return a user's latest notifications without sorting
+            models.Index(fields=["received_by", "-created_at"], name="db_notif_recv_created_idx"),
+        ]
+
+
+class ArchivedNotification(models.Model):
+    """Notification moved out of `notifications` by the retention task, with its history kept inline."""
+
+    id = models.UUIDField(
+        primary_key=True,
+        editable=False,
+        help_text=_("Identifier of the archived notification."),
+    )
+
+    created_at = models.DateTimeField(help_text=_("Timestamp when the notification was created."))
+    archived_at = models.DateTimeField(auto_now_add=True, help_text=_("Timestamp when the notification was archived."))
+
+    data = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder, help_text=_("Notification data"))
+
+    status = models.CharField(
+        max_length=30,
+        choices=[(item.value, item.name) for item in NotificationStatus],
+        help_text=_("Status of the notification"),
+    )
+
+    type = models.CharField(
+        max_length=20,
+        choices=[(item.value, item.name) for item in NotificationType],
+        help_text=_("Type of notification"),
+    )
+
+    received_by = models.ForeignKey(
+        "db.User",
+        on_delete=models.PROTECT,
+        related_name="archived_notifications",
+        help_text=_("User who received this notification"),
+    )
+
+    created_by = models.ForeignKey(
+        "db.User",
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="+",
+        help_text=_("User who created this notification"),
+    )
+
+    history = models.JSONField(
+        default=list,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        help_text=_("Changes of the notification, oldest first"),
+    )
+
+    class Meta:
+        db_table = "notifications_archive"
+        verbose_name = _("Archived Notification")
+        verbose_name_plural = _("Archived Notifications")
+        ordering = ("created_at",)
+        indexes = [
+            models.Index(fields=["received_by", "-created_at"], name="db_notif_arch_recv_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"ArchivedNotification: {self.id.hex[:4]}...{self.id.hex[-4:]}"
 
 
 class NotificationSettings(BaseModel):
@@ -74,7 +141,7 @@ class NotificationSettings(BaseModel):
         help_text=_("Indicates whether notifications of this type are enabled"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
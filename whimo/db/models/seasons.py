@@ -4,8 +4,8 @@ from django.db import models
 from django.db.models import Count, QuerySet
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models import BaseModel
 
 SEASON_TRANSACTIONS_COUNT_FIELD = "_transactions_count"
@@ -64,7 +64,7 @@ class Season(BaseModel):
             raise AttributeError("`.objects.annotate_transactions_count()` must be called to use `transactions_count`.")
         return cast(int, transactions_count)
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -97,7 +97,7 @@ class SeasonCommodity(BaseModel):
         help_text=_("Commodity"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
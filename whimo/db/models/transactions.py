@@ -1,9 +1,9 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
 from whimo.db.enums import TransactionLocation, TransactionStatus, TransactionType
 from whimo.db.enums.transactions import TransactionTraceability
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models import BaseModel
 
 
@@ -43,6 +43,12 @@ class Transaction(BaseModel):
         help_text=_("Traceability status of the transaction"),
     )
 
+    traceability_shares = models.JSONField(
+        null=True,
+        blank=True,
+        help_text=_("Fractions of the volume by traceability, following the mass balance of the chain"),
+    )
+
     transaction_latitude = models.DecimalField(
         max_digits=9,
         null=True,
@@ -138,11 +144,12 @@ class Transaction(BaseModel):
         help_text=_("When this transaction expires"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
             "updated_at",
+            "traceability_shares",
         ),
         table_name="transactions_history",
     )
@@ -6,10 +6,10 @@ from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
-from simple_history.models import HistoricalRecords
 
 from whimo.db.enums import GadgetType
 from whimo.db.enums.notifications import NotificationType
+from whimo.db.history import PolicyHistoricalRecords
 from whimo.db.models import BaseModel, NotificationSettings
 
 USER_GADGETS_FIELD = "_gadgets"
@@ -58,7 +58,7 @@ class User(AbstractUser, BaseModel):
         help_text=_("Indicates whether this user has been soft deleted"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "password",
@@ -111,7 +111,7 @@ class Gadget(BaseModel):
         help_text=_("The user this gadget belongs to"),
     )
 
-    history = HistoricalRecords(
+    history = PolicyHistoricalRecords(
         excluded_fields=(
             "pk",
             "created_at",
@@ -0,0 +1,238 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time
+
+from django.db import transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils import timezone
+
+MAX_NAME_LENGTH = 63
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedTable:
+    """Table range partitioned by month on `column`, with rows outside monthly partitions kept in `<name>_default`.
+
+    Old partitions are only detached from tables with `has_retention`, other tables keep all their rows.
+    """
+
+    name: str
+    column: str
+    has_retention: bool = False
+
+    @property
+    def default_partition(self) -> str:
+        return f"{self.name}_default"
+
+    def get_partition_name(self, month: date) -> str:
+        return f"{self.name}_p{month:%Y_%m}"
+
+
+PARTITIONED_TABLES = (
+    # Chains, traceability counts and mass balances are built from all transactions
+    PartitionedTable(name="transactions", column="created_at"),
+    PartitionedTable(name="transactions_history", column="history_date", has_retention=True),
+    PartitionedTable(name="notifications", column="created_at", has_retention=True),
+    PartitionedTable(name="notifications_history", column="history_date", has_retention=True),
+)
+
+
+def get_month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    year, month_index = divmod(month.year * 12 + month.month - 1 + months, 12)
+    return date(year, month_index + 1, 1)
+
+
+def get_month_bounds(month: date) -> tuple[datetime, datetime]:
+    tz = timezone.get_current_timezone()
+    return (
+        datetime.combine(month, time.min, tzinfo=tz),
+        datetime.combine(add_months(month, 1), time.min, tzinfo=tz),
+    )
+
+
+def is_partitioned(connection: BaseDatabaseWrapper, table: PartitionedTable) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [table.name],
+        )
+        return bool(cursor.fetchone()[0])
+
+
+def get_partitions(connection: BaseDatabaseWrapper, table: PartitionedTable) -> dict[date, str]:
+    """Monthly partitions attached to `table`, by the first day of their month."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [table.name],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    pattern = re.compile(rf"^{re.escape(table.name)}_p(\d{{4}})_(\d{{2}})$")
+    return {date(int(match[1]), int(match[2]), 1): name for name in names if (match := pattern.match(name)) is not None}
+
+
+def partition_table(connection: BaseDatabaseWrapper, table: PartitionedTable) -> None:
+    """Replace `table` with a partitioned one, the existing table and its rows become the default partition.
+
+    The primary key of the partitioned table includes the partition column, as PostgreSQL requires.
+    Foreign keys and indexes keep their names on the partitioned table, the ones of the default partition
+    are renamed and attached to them.
+    """
+    qn = connection.ops.quote_name
+    parent, default = qn(table.name), qn(table.default_partition)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table.name],
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(
+            "SELECT index_class.relname, pg_get_indexdef(pg_index.indexrelid), pg_index.indisprimary "
+            "FROM pg_index JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid "
+            "WHERE pg_index.indrelid = %s::regclass",
+            [table.name],
+        )
+        indexes = cursor.fetchall()
+
+        cursor.execute(
+            "SELECT conname, ARRAY(SELECT attname FROM pg_attribute "
+            "WHERE attrelid = conrelid AND attnum = ANY(conkey) ORDER BY attnum) "
+            "FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'",
+            [table.name],
+        )
+        primary_key_name, primary_key_columns = cursor.fetchone()
+
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = %s AND is_identity = 'YES'",
+            [table.name],
+        )
+        identity_columns = [row[0] for row in cursor.fetchall()]
+
+        columns = ", ".join(qn(column) for column in [*primary_key_columns, table.column])
+
+        # The primary key of the default partition is replaced by one matching the partitioned table, which is
+        # attached to it instead of a second primary key being added to the partition
+        cursor.execute(f"ALTER TABLE {parent} RENAME TO {default}")
+        cursor.execute(
+            f"ALTER TABLE {default} DROP CONSTRAINT {qn(primary_key_name)}, "
+            f"ADD CONSTRAINT {qn(f'{table.default_partition}_pkey'[:MAX_NAME_LENGTH])} PRIMARY KEY ({columns})"
+        )
+        for index_name, _, is_primary in indexes:
+            if not is_primary:
+                cursor.execute(f"ALTER INDEX {qn(index_name)} RENAME TO {qn(get_default_index_name(index_name))}")
+
+        cursor.execute(
+            f"CREATE TABLE {parent} (LIKE {default} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING STORAGE "
+            f"INCLUDING COMMENTS) PARTITION BY RANGE ({qn(table.column)})"
+        )
+        cursor.execute(f"ALTER TABLE {parent} ADD CONSTRAINT {qn(primary_key_name)} PRIMARY KEY ({columns})")
+        for constraint_name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {parent} ADD CONSTRAINT {qn(constraint_name)} {definition}")
+        for _, definition, is_primary in indexes:
+            if not is_primary:
+                # Definitions were read before the rename, so they already point to the partitioned table
+                cursor.execute(definition)
+
+        # Identity values are generated by the partitioned table from now on
+        for column in identity_columns:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence(%s, %s), COALESCE(MAX({qn(column)}), 0) + 1, false) "
+                f"FROM {default}",
+                [table.name, column],
+            )
+            cursor.execute(f"ALTER TABLE {default} ALTER COLUMN {qn(column)} DROP IDENTITY")
+
+        cursor.execute(f"ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT")
+
+
+def get_default_index_name(index_name: str) -> str:
+    suffix = "_default"
+    return f"{index_name[: MAX_NAME_LENGTH - len(suffix)]}{suffix}"
+
+
+def create_partition(connection: BaseDatabaseWrapper, table: PartitionedTable, month: date) -> bool:
+    """Create the partition of `month`, moving its rows out of the default partition. Returns False if it exists."""
+    if month in get_partitions(connection, table):
+        return False
+
+    qn = connection.ops.quote_name
+    parent, default = qn(table.name), qn(table.default_partition)
+    partition = qn(table.get_partition_name(month))
+    start, end = get_month_bounds(month)
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT attname FROM pg_attribute WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped "
+            "ORDER BY attnum",
+            [table.name],
+        )
+        columns = ", ".join(qn(row[0]) for row in cursor.fetchall())
+
+        # Attaching a range checks that the default partition holds no rows of it, so they are moved first
+        cursor.execute(f"CREATE TABLE {partition} (LIKE {parent} INCLUDING DEFAULTS INCLUDING STORAGE)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {default} WHERE {qn(table.column)} >= %s AND {qn(table.column)} < %s "
+            f"RETURNING {columns}) INSERT INTO {partition} ({columns}) SELECT {columns} FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {parent} ATTACH PARTITION {partition} FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+
+    return True
+
+
+def detach_partition(connection: BaseDatabaseWrapper, table: PartitionedTable, month: date) -> str | None:
+    """Detach the partition of `month`, leaving it as a standalone table to archive or drop. Returns its name."""
+    if (name := get_partitions(connection, table).get(month)) is None:
+        return None
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table.name)} DETACH PARTITION {qn(name)}")
+
+    return name
+
+
+def create_future_partitions(connection: BaseDatabaseWrapper, months_ahead: int) -> list[str]:
+    """Create partitions of the current month and `months_ahead` next ones. Returns the names of created ones."""
+    current_month = get_month_start(timezone.localdate())
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        for offset in range(months_ahead + 1):
+            month = add_months(current_month, offset)
+            if create_partition(connection, table, month):
+                created.append(table.get_partition_name(month))
+
+    return created
+
+
+def detach_old_partitions(connection: BaseDatabaseWrapper, retention_months: int) -> list[str]:
+    """Detach partitions of tables with retention of months before the last `retention_months` ones.
+
+    Returns the names of detached ones.
+    """
+    oldest_kept_month = add_months(get_month_start(timezone.localdate()), -retention_months)
+
+    detached = []
+    for table in PARTITIONED_TABLES:
+        if not table.has_retention:
+            continue
+
+        for month in sorted(get_partitions(connection, table)):
+            if month < oldest_kept_month and (name := detach_partition(connection, table, month)):
+                detached.append(name)
+
+    return detached
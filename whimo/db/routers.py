@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse
+
+REPLICA_DATABASE = "replica"
+PRIMARY_READS_CACHE_KEY = "primary_reads:{user_id}"
+
+
+@dataclass(slots=True)
+class WriteTracker:
+    has_written: bool = False
+
+
+replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+request_writes: ContextVar[WriteTracker | None] = ContextVar("request_writes", default=None)
+
+
+def get_read_database(user_id: UUID | None = None) -> str:
+    """Database for read-only queries of `user_id`, the primary while their own writes may not be replicated."""
+    if REPLICA_DATABASE not in settings.DATABASES:
+        return DEFAULT_DB_ALIAS
+
+    if (tracker := request_writes.get()) is not None and tracker.has_written:
+        return DEFAULT_DB_ALIAS
+
+    if user_id is not None and cache.get(PRIMARY_READS_CACHE_KEY.format(user_id=user_id)):
+        return DEFAULT_DB_ALIAS
+
+    return REPLICA_DATABASE
+
+
+@contextmanager
+def using_replica(user_id: UUID | None = None) -> Iterator[None]:
+    """Route reads inside the block to the replica, for read-only service methods and lazy export querysets."""
+    token = replica_reads.set(get_read_database(user_id) == REPLICA_DATABASE)
+    try:
+        yield
+    finally:
+        replica_reads.reset(token)
+
+
+def pin_primary_reads(user_id: UUID) -> None:
+    if REPLICA_DATABASE not in settings.DATABASES:
+        return
+
+    cache.set(PRIMARY_READS_CACHE_KEY.format(user_id=user_id), True, timeout=settings.REPLICA_READ_YOUR_WRITES_TIMEOUT)
+
+
+class ReplicaRouter:
+    """Sends reads inside `using_replica` to the replica database and everything else to the primary."""
+
+    def db_for_read(self, _: type[Model], **__: Any) -> str:
+        # Reads inside a transaction must see its uncommitted writes
+        if replica_reads.get() and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return REPLICA_DATABASE
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, _: type[Model], **__: Any) -> str:
+        if (tracker := request_writes.get()) is not None:
+            tracker.has_written = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, *_: Any, **__: Any) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, *_: Any, **__: Any) -> bool:
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReadYourWritesMiddleware:
+    """Keeps replica reads of a user on the primary for a while after one of their requests wrote to it."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        tracker = WriteTracker()
+        token = request_writes.set(tracker)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_writes.reset(token)
+
+        # DRF stores the user authenticated by the view on the underlying request
+        user = getattr(request, "user", None)
+        if tracker.has_written and user is not None and user.is_authenticated:
+            pin_primary_reads(user.id)
+
+        return response
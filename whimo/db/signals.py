@@ -0,0 +1,103 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+
+from whimo.db.models import (
+    Balance,
+    Commodity,
+    CommodityGroup,
+    ConversionInput,
+    ConversionOutput,
+    ConversionRecipe,
+    Gadget,
+    Notification,
+    Transaction,
+    User,
+)
+from whimo.db.storages import (
+    AuthStateStorage,
+    ChainsStorage,
+    CommoditiesStorage,
+    ConversionRecipesStorage,
+    UserChangesStorage,
+)
+
+
+def invalidate_conversion_recipes_catalog(**_: Any) -> None:
+    ConversionRecipesStorage.invalidate_catalog()
+
+
+for sender in (ConversionRecipe, ConversionInput, ConversionOutput, Commodity, CommodityGroup):
+    post_save.connect(invalidate_conversion_recipes_catalog, sender=sender)
+    post_delete.connect(invalidate_conversion_recipes_catalog, sender=sender)
+
+
+def invalidate_commodities_catalog(**_: Any) -> None:
+    CommoditiesStorage.invalidate_catalog()
+
+
+for sender in (Commodity, CommodityGroup, ConversionInput):
+    post_save.connect(invalidate_commodities_catalog, sender=sender)
+    post_delete.connect(invalidate_commodities_catalog, sender=sender)
+
+
+def bump_transaction_chains_versions(instance: Transaction, **_: Any) -> None:
+    # Accepting, converting and updating geodata change the chains going through the buyer and the seller
+    ChainsStorage.bump(instance.buyer_id, instance.seller_id)
+
+
+post_save.connect(bump_transaction_chains_versions, sender=Transaction)
+post_delete.connect(bump_transaction_chains_versions, sender=Transaction)
+
+
+def bump_transaction_users_changes(instance: Transaction, **_: Any) -> None:
+    UserChangesStorage.bump(instance.buyer_id, instance.seller_id, instance.created_by_id)
+
+
+def bump_balance_user_changes(instance: Balance, **_: Any) -> None:
+    UserChangesStorage.bump(instance.user_id)
+
+
+def bump_notification_user_changes(instance: Notification, **_: Any) -> None:
+    UserChangesStorage.bump(instance.received_by_id)
+
+
+def bump_gadget_user_changes(instance: Gadget, **_: Any) -> None:
+    UserChangesStorage.bump_with_counterparties(instance.user_id)
+
+
+def bump_user_changes(
+    instance: User, created: bool = False, update_fields: frozenset[str] | None = None, **_: Any
+) -> None:
+    # Logins only touch `last_login`, which is not exposed to other users
+    if created or update_fields == {"last_login"}:
+        return
+    UserChangesStorage.bump_with_counterparties(instance.pk)
+
+
+for model, receiver in (
+    (Transaction, bump_transaction_users_changes),
+    (Balance, bump_balance_user_changes),
+    (Notification, bump_notification_user_changes),
+    (Gadget, bump_gadget_user_changes),
+):
+    post_save.connect(receiver, sender=model)
+    post_delete.connect(receiver, sender=model)
+
+post_save.connect(bump_user_changes, sender=User)
+
+
+def invalidate_gadget_auth_state(instance: Gadget, **_: Any) -> None:
+    AuthStateStorage.invalidate(instance.user_id)
+
+
+def invalidate_user_auth_state(instance: User, update_fields: frozenset[str] | None = None, **_: Any) -> None:
+    if update_fields == {"last_login"}:
+        return
+    AuthStateStorage.invalidate(instance.pk)
+
+
+post_save.connect(invalidate_gadget_auth_state, sender=Gadget)
+post_delete.connect(invalidate_gadget_auth_state, sender=Gadget)
+post_save.connect(invalidate_user_auth_state, sender=User)
+post_delete.connect(invalidate_user_auth_state, sender=User)
@@ -1,7 +1,21 @@
+from whimo.db.storages.auth import AuthState, AuthStateStorage
+from whimo.db.storages.chains import ChainsStorage, ChainSummary
+from whimo.db.storages.changes import UserChangesStorage
+from whimo.db.storages.commodities import CommoditiesStorage
+from whimo.db.storages.conversions import ConversionRecipesStorage
+from whimo.db.storages.notifications import NotificationCountersStorage
 from whimo.db.storages.transactions import TransactionsStorage
 from whimo.db.storages.users import UsersStorage
 
 __all__ = [
+    "AuthState",
+    "AuthStateStorage",
+    "ChainSummary",
+    "ChainsStorage",
+    "CommoditiesStorage",
+    "ConversionRecipesStorage",
+    "NotificationCountersStorage",
     "TransactionsStorage",
+    "UserChangesStorage",
     "UsersStorage",
 ]
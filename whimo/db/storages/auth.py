@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from whimo.common.cache import LocalCache
+from whimo.db.models import Gadget, User
+
+AUTH_STATE_CACHE_KEY = "auth_state:{user_id}"
+AUTH_STATE_CACHE_TIMEOUT = 60 * 5
+AUTH_STATE_LOCAL_CACHE_TIMEOUT = 5
+AUTH_STATE_LOCAL_CACHE_MAXSIZE = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class AuthState:
+    is_active: bool
+    is_deleted: bool
+    has_verified_gadget: bool
+
+
+auth_states = LocalCache[AuthState](maxsize=AUTH_STATE_LOCAL_CACHE_MAXSIZE, timeout=AUTH_STATE_LOCAL_CACHE_TIMEOUT)
+
+
+@dataclass(slots=True)
+class AuthStateStorage:
+    """User fields checked on every authenticated request, cached in Redis and in a per-process LRU."""
+
+    @staticmethod
+    def get_state(user_id: UUID) -> AuthState | None:
+        if state := auth_states.get(user_id):
+            return state
+
+        cache_key = AUTH_STATE_CACHE_KEY.format(user_id=user_id)
+        if (state := cache.get(cache_key)) is None:
+            if (state := AuthStateStorage.load_state(user_id)) is None:
+                return None
+            cache.set(cache_key, state, timeout=AUTH_STATE_CACHE_TIMEOUT)
+
+        auth_states.set(user_id, state)
+        return state
+
+    @staticmethod
+    def load_state(user_id: UUID) -> AuthState | None:
+        verified_gadgets = Gadget.objects.filter(user_id=OuterRef("pk"), is_verified=True)
+        row = (
+            User.objects.filter(pk=user_id)
+            .annotate(has_verified_gadget=Exists(verified_gadgets))
+            .values_list("is_active", "is_deleted", "has_verified_gadget")
+            .first()
+        )
+        if row is None:
+            return None
+
+        is_active, is_deleted, has_verified_gadget = row
+        return AuthState(is_active=is_active, is_deleted=is_deleted, has_verified_gadget=has_verified_gadget)
+
+    @staticmethod
+    def invalidate(user_id: UUID) -> None:
+        def delete_state() -> None:
+            cache.delete(AUTH_STATE_CACHE_KEY.format(user_id=user_id))
+            auth_states.delete(user_id)
+
+        # Delete once more after commit, so a state read by another request before the commit is dropped
+        delete_state()
+        transaction.on_commit(delete_state)
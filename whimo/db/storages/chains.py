@@ -0,0 +1,239 @@
+import hashlib
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Collection, NamedTuple, cast
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+
+from whimo.common.cache import CacheVersion
+from whimo.db.enums import TransactionLocation, TransactionStatus, TransactionType
+from whimo.db.enums.transactions import TransactionTraceability
+from whimo.db.models import Transaction
+from whimo.db.routers import replica_reads
+
+CHAIN_VERSION_KEY = "chain:{user_id}:version"
+CHAIN_SUMMARY_CACHE_KEY = "chain_summary:{transaction_id}"
+CHAIN_SUMMARY_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+class ChainTransaction(NamedTuple):
+    id: UUID
+    type: str
+    status: str
+    buyer_id: UUID | None
+    seller_id: UUID | None
+    group_id: UUID | None
+    traceability: str | None
+    location: str | None
+    commodity_id: UUID
+    volume: Decimal
+    created_at: datetime
+
+
+CHAIN_TRANSACTION_FIELDS = ChainTransaction._fields
+
+
+@dataclass(slots=True, frozen=True)
+class ChainSummary:
+    """Everything chain endpoints need from one traversal of the transactions upstream of a transaction."""
+
+    transaction_ids: list[UUID]
+    # Buyers and sellers of the chain transactions, their versions make up the version of the chain
+    user_ids: list[UUID]
+    first_transaction_ids: list[UUID]
+    traceability_counts: dict[TransactionTraceability, int]
+    # First transactions by source of their location, `None` for the ones without location
+    location_counts: dict[TransactionLocation | None, int]
+    volumes: dict[UUID, Decimal]
+
+
+@dataclass(slots=True)
+class ChainsStorage:
+    """Chains of transactions with a version stamp, which changes whenever a transaction of the chain changes.
+
+    A chain is made of purchases of its sellers and of conversions of its buyers, so every write of a transaction
+    bumps the versions of its buyer and seller. The version of a chain is a digest of the versions of all
+    buyers and sellers of its transactions.
+    """
+
+    @staticmethod
+    def get_user_versions(user_ids: list[UUID]) -> dict[UUID, str]:
+        keys = {user_id: CHAIN_VERSION_KEY.format(user_id=user_id) for user_id in user_ids}
+        versions = cache.get_many(list(keys.values()))
+        return {user_id: versions.get(key) or CacheVersion(key=key).get() for user_id, key in keys.items()}
+
+    @staticmethod
+    def get_version(user_ids: list[UUID], user_versions: dict[UUID, str] | None = None) -> str:
+        if user_versions is None:
+            user_versions = ChainsStorage.get_user_versions(user_ids)
+        digest = hashlib.blake2b(digest_size=16)
+        for user_id in user_ids:
+            digest.update(user_versions[user_id].encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_chain_version(transaction_id: UUID) -> str:
+        """Version of the chain of `transaction_id`, to key caches of results derived from the chain."""
+        return ChainsStorage.get_version(ChainsStorage.get_summary(transaction_id).user_ids)
+
+    @staticmethod
+    def bump(*user_ids: UUID | None) -> None:
+        CacheVersion.bump_many(CHAIN_VERSION_KEY.format(user_id=user_id) for user_id in user_ids if user_id)
+
+    @staticmethod
+    def get_summary(transaction_id: UUID) -> ChainSummary:
+        cache_key = CHAIN_SUMMARY_CACHE_KEY.format(transaction_id=transaction_id)
+        previous_versions: dict[UUID, str] = {}
+        if cached := cache.get(cache_key):
+            version, summary = cached
+            previous_versions = ChainsStorage.get_user_versions(summary.user_ids)
+            if version == ChainsStorage.get_version(summary.user_ids, previous_versions):
+                return summary
+
+        summary = ChainsStorage.load_summary(transaction_id)
+        if not summary.transaction_ids:
+            return summary
+
+        # A write committed during the traversal may be missing from the summary, but it bumped a version of
+        # one of the summary users. Only versions read before the traversal tell it apart, so a summary with
+        # users unknown beforehand is stored without a version and cached by the next traversal.
+        user_versions = ChainsStorage.get_user_versions(summary.user_ids)
+        unchanged = user_versions.items() <= previous_versions.items()
+        version = ChainsStorage.get_version(summary.user_ids, user_versions) if unchanged else None
+
+        # A replica may not have replicated the change behind the current version yet
+        timeout = settings.REPLICA_READ_YOUR_WRITES_TIMEOUT if replica_reads.get() else CHAIN_SUMMARY_CACHE_TIMEOUT
+        cache.set(cache_key, (version, summary), timeout=timeout)
+        return summary
+
+    @staticmethod
+    def load_summary(transaction_id: UUID) -> ChainSummary:
+        transactions = ChainsStorage.get_chain_transactions(transaction_id)
+        first_transactions = [
+            item for item in transactions if item.seller_id is None and item.type != TransactionType.CONVERSION
+        ]
+
+        traceability_counts: dict[TransactionTraceability, int] = dict.fromkeys(TransactionTraceability, 0)
+        volumes: dict[UUID, Decimal] = defaultdict(Decimal)
+        for item in transactions:
+            if item.traceability:
+                traceability_counts[TransactionTraceability(item.traceability)] += 1
+            volumes[item.commodity_id] += item.volume
+
+        location_counts = Counter(
+            TransactionLocation(item.location) if item.location else None for item in first_transactions
+        )
+
+        user_ids = {user_id for item in transactions for user_id in (item.buyer_id, item.seller_id) if user_id}
+
+        return ChainSummary(
+            transaction_ids=[item.id for item in transactions],
+            user_ids=sorted(user_ids),
+            first_transaction_ids=[item.id for item in first_transactions],
+            traceability_counts=traceability_counts,
+            location_counts=dict(location_counts),
+            volumes=dict(volumes),
+        )
+
+    @staticmethod
+    def get_chain_transactions(transaction_id: UUID) -> list[ChainTransaction]:
+        """Transactions the commodity of `transaction_id` comes from, the transaction included.
+
+        The chain is walked level by level: accepted purchases of the sellers of the previous level, and the
+        inputs of its conversion outputs. Each level costs one query, and one more when it has conversions.
+        """
+        chain: dict[UUID, ChainTransaction] = {}
+        level = ChainsStorage._fetch(pk=transaction_id)
+
+        while level:
+            chain.update((item.id, item) for item in level)
+
+            sellers_ids = {item.seller_id for item in level if item.seller_id}
+            groups_ids = {
+                item.group_id
+                for item in level
+                if item.type == TransactionType.CONVERSION and item.seller_id is None and item.group_id
+            }
+
+            level = []
+            if sellers_ids:
+                purchases = ChainsStorage._fetch(buyer_id__in=sellers_ids, status=TransactionStatus.ACCEPTED)
+                level += [item for item in purchases if item.id not in chain]
+
+            if groups_ids:
+                inputs = ChainsStorage._fetch(
+                    type=TransactionType.CONVERSION,
+                    buyer_id__isnull=True,
+                    group_id__in=groups_ids,
+                )
+                inputs = [item for item in inputs if item.id not in chain]
+                # Inputs belong to the chain whatever their status, only accepted ones are followed upstream
+                chain.update((item.id, item) for item in inputs)
+                level += [item for item in inputs if item.status == TransactionStatus.ACCEPTED]
+
+        return list(chain.values())
+
+    @staticmethod
+    def get_downstream_transactions(transaction_ids: Collection[UUID]) -> list[ChainTransaction]:
+        """Transactions the commodity of `transaction_ids` went into, the transactions included.
+
+        The chain is walked level by level: accepted sales of the buyers of the previous level made after their
+        purchases, and the outputs of its conversion inputs. Each level costs one query, and one more when it has
+        conversions.
+
+        Unlike `get_chain_transactions`, which follows every purchase of a seller, sales made before a purchase
+        are skipped as they cannot contain its commodity. So a transaction is not always downstream of the
+        transactions of its own chain.
+        """
+        chain: dict[UUID, ChainTransaction] = {}
+        level = ChainsStorage._fetch(pk__in=transaction_ids)
+
+        while level:
+            chain.update((item.id, item) for item in level)
+
+            # A buyer can only pass on what it bought before selling
+            purchased_at: dict[UUID, datetime] = {}
+            for item in level:
+                if item.buyer_id:
+                    purchased_at[item.buyer_id] = min(item.created_at, purchased_at.get(item.buyer_id, item.created_at))
+
+            groups_ids = {
+                item.group_id
+                for item in level
+                if item.type == TransactionType.CONVERSION and item.buyer_id is None and item.group_id
+            }
+
+            level = []
+            if purchased_at:
+                sales = ChainsStorage._fetch(
+                    seller_id__in=purchased_at,
+                    status=TransactionStatus.ACCEPTED,
+                    created_at__gte=min(purchased_at.values()),
+                )
+                level += [
+                    item
+                    for item in sales
+                    if item.id not in chain and item.created_at >= purchased_at[cast(UUID, item.seller_id)]
+                ]
+
+            if groups_ids:
+                outputs = ChainsStorage._fetch(
+                    type=TransactionType.CONVERSION,
+                    seller_id__isnull=True,
+                    group_id__in=groups_ids,
+                )
+                outputs = [item for item in outputs if item.id not in chain]
+                # Outputs belong to the chain whatever their status, only accepted ones are followed downstream
+                chain.update((item.id, item) for item in outputs)
+                level += [item for item in outputs if item.status == TransactionStatus.ACCEPTED]
+
+        return list(chain.values())
+
+    @staticmethod
+    def _fetch(**filters: Any) -> list[ChainTransaction]:
+        rows = Transaction.objects.filter(**filters).order_by().values_list(*CHAIN_TRANSACTION_FIELDS)
+        return [ChainTransaction(*row) for row in rows]
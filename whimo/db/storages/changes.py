@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.db.models import Q
+
+from whimo.common.cache import CacheVersion
+from whimo.db.models import Transaction
+
+USER_CHANGES_VERSION_KEY = "user_changes:{user_id}:version"
+
+
+@dataclass(slots=True)
+class UserChangesStorage:
+    @staticmethod
+    def get_version(user_id: UUID) -> str:
+        return CacheVersion(key=USER_CHANGES_VERSION_KEY.format(user_id=user_id)).get()
+
+    @staticmethod
+    def bump(*user_ids: UUID | None) -> None:
+        CacheVersion.bump_many(USER_CHANGES_VERSION_KEY.format(user_id=user_id) for user_id in user_ids if user_id)
+
+    @staticmethod
+    def bump_with_counterparties(user_id: UUID) -> None:
+        # Users are embedded into the transactions of their counterparties, so their lists change as well
+        counterparties = (
+            Transaction.objects.filter(Q(buyer_id=user_id) | Q(seller_id=user_id))
+            .order_by()
+            .values_list("buyer_id", "seller_id")
+            .distinct()
+        )
+        UserChangesStorage.bump(user_id, *(item for row in counterparties for item in row))
@@ -0,0 +1,152 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.conf import settings
+from django.utils import translation
+
+from whimo.common.cache import VersionedCache
+from whimo.common.utils import normalize_search_text
+from whimo.db.models import Commodity, CommodityGroup
+from whimo.db.models.commodities import COMMODITY_HAS_RECIPE_FIELD
+
+COMMODITIES_CACHE_NAME = "commodities"
+
+
+@dataclass(slots=True, frozen=True)
+class CommoditiesCatalog:
+    commodities: list[Commodity]
+    commodities_by_id: dict[UUID, Commodity]
+    commodities_by_group: dict[UUID, list[Commodity]]
+    groups: list[CommodityGroup]
+    groups_by_id: dict[UUID, CommodityGroup]
+    has_recipe_ids: frozenset[UUID]
+    # Translated names keyed by language code, then by entity id
+    commodity_names: dict[str, dict[UUID, str]]
+    group_names: dict[str, dict[UUID, str]]
+    # Normalized code, name, name variants and translated names of every entity
+    commodity_search_texts: dict[UUID, str]
+    group_search_texts: dict[UUID, str]
+
+
+@dataclass(slots=True)
+class CommoditiesStorage:
+    @staticmethod
+    def get_catalog() -> CommoditiesCatalog:
+        return commodities_cache.get()
+
+    @staticmethod
+    def get_commodity(commodity_id: UUID) -> Commodity | None:
+        return CommoditiesStorage.get_catalog().commodities_by_id.get(commodity_id)
+
+    @staticmethod
+    def get_group(group_id: UUID) -> CommodityGroup | None:
+        return CommoditiesStorage.get_catalog().groups_by_id.get(group_id)
+
+    @staticmethod
+    def has_recipe(commodity_id: UUID) -> bool:
+        return commodity_id in CommoditiesStorage.get_catalog().has_recipe_ids
+
+    @staticmethod
+    def get_commodity_name(commodity: Commodity) -> str:
+        names = CommoditiesStorage.get_catalog().commodity_names.get(_get_language_key(), {})
+        return names.get(commodity.pk) or translation.gettext(commodity.name)
+
+    @staticmethod
+    def get_group_name(group: CommodityGroup) -> str:
+        names = CommoditiesStorage.get_catalog().group_names.get(_get_language_key(), {})
+        return names.get(group.pk) or translation.gettext(group.name)
+
+    @staticmethod
+    def search_commodities(search: str, commodities: list[Commodity] | None = None) -> list[Commodity]:
+        catalog = CommoditiesStorage.get_catalog()
+        search = normalize_search_text(search)
+
+        return [
+            commodity
+            for commodity in (catalog.commodities if commodities is None else commodities)
+            if search in catalog.commodity_search_texts.get(commodity.pk, "")
+        ]
+
+    @staticmethod
+    def search_groups(search: str) -> list[CommodityGroup]:
+        catalog = CommoditiesStorage.get_catalog()
+        search = normalize_search_text(search)
+
+        return [group for group in catalog.groups if search in catalog.group_search_texts.get(group.pk, "")]
+
+    @staticmethod
+    def get_version() -> str:
+        return commodities_cache.get_version()
+
+    @staticmethod
+    def invalidate_catalog() -> None:
+        commodities_cache.invalidate()
+
+    @staticmethod
+    def load_catalog() -> CommoditiesCatalog:
+        groups = list(CommodityGroup.objects.all())
+        groups_by_id = {group.pk: group for group in groups}
+
+        commodities = list(Commodity.objects.annotate_has_recipe())
+        commodities_by_group: dict[UUID, list[Commodity]] = defaultdict(list)
+        for commodity in commodities:
+            # Reuse loaded groups instead of joining them to every commodity row
+            commodity.group = groups_by_id[commodity.group_id]
+            commodities_by_group[commodity.group_id].append(commodity)
+
+        commodity_names: dict[str, dict[UUID, str]] = {}
+        group_names: dict[str, dict[UUID, str]] = {}
+        for language, _ in settings.LANGUAGES:
+            with translation.override(language):
+                language_key = _get_language_key()
+                commodity_names[language_key] = {item.pk: translation.gettext(item.name) for item in commodities}
+                group_names[language_key] = {item.pk: translation.gettext(item.name) for item in groups}
+
+        commodity_search_texts = {
+            commodity.pk: _build_search_text(
+                commodity.code,
+                commodity.name,
+                *commodity.name_variants,
+                *(names[commodity.pk] for names in commodity_names.values()),
+            )
+            for commodity in commodities
+        }
+        group_search_texts = {
+            group.pk: _build_search_text(
+                group.name,
+                *group.name_variants,
+                *(names[group.pk] for names in group_names.values()),
+            )
+            for group in groups
+        }
+
+        return CommoditiesCatalog(
+            commodities=commodities,
+            commodities_by_id={commodity.pk: commodity for commodity in commodities},
+            commodities_by_group=dict(commodities_by_group),
+            groups=groups,
+            groups_by_id=groups_by_id,
+            has_recipe_ids=frozenset(
+                commodity.pk for commodity in commodities if getattr(commodity, COMMODITY_HAS_RECIPE_FIELD, False)
+            ),
+            commodity_names=commodity_names,
+            group_names=group_names,
+            commodity_search_texts=commodity_search_texts,
+            group_search_texts=group_search_texts,
+        )
+
+
+def _build_search_text(*values: object) -> str:
+    # Values are separated by a newline, so a search term never matches across two of them
+    return "\n".join(normalize_search_text(str(value)) for value in values)
+
+
+def _get_language_key() -> str:
+    return translation.to_language(translation.get_language() or settings.LANGUAGE_CODE)
+
+
+commodities_cache = VersionedCache(
+    name=COMMODITIES_CACHE_NAME,
+    loader=CommoditiesStorage.load_catalog,
+)
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from whimo.common.cache import VersionedCache
+from whimo.db.models import ConversionRecipe
+
+CONVERSION_RECIPES_CACHE_NAME = "conversion_recipes"
+
+
+@dataclass(slots=True, frozen=True)
+class ConversionRecipesCatalog:
+    recipes: list[ConversionRecipe]
+    recipes_by_id: dict[UUID, ConversionRecipe]
+    recipes_by_input: dict[UUID, list[ConversionRecipe]]
+    recipes_by_output: dict[UUID, list[ConversionRecipe]]
+    inputs: dict[UUID, dict[UUID, Decimal]]
+    outputs: dict[UUID, dict[UUID, Decimal]]
+
+
+@dataclass(slots=True)
+class ConversionRecipesStorage:
+    @staticmethod
+    def get_catalog() -> ConversionRecipesCatalog:
+        return conversion_recipes_cache.get()
+
+    @staticmethod
+    def invalidate_catalog() -> None:
+        conversion_recipes_cache.invalidate()
+
+    @staticmethod
+    def load_catalog() -> ConversionRecipesCatalog:
+        recipes = list(ConversionRecipe.objects.prefetch_conversion_data().order_by("-created_at", "-id"))
+
+        recipes_by_input: dict[UUID, list[ConversionRecipe]] = defaultdict(list)
+        recipes_by_output: dict[UUID, list[ConversionRecipe]] = defaultdict(list)
+        inputs: dict[UUID, dict[UUID, Decimal]] = {}
+        outputs: dict[UUID, dict[UUID, Decimal]] = {}
+
+        for recipe in recipes:
+            inputs[recipe.pk] = {item.commodity_id: item.quantity for item in recipe.inputs_list}
+            outputs[recipe.pk] = {item.commodity_id: item.quantity for item in recipe.outputs_list}
+
+            for commodity_id in inputs[recipe.pk]:
+                recipes_by_input[commodity_id].append(recipe)
+
+            for commodity_id in outputs[recipe.pk]:
+                recipes_by_output[commodity_id].append(recipe)
+
+        return ConversionRecipesCatalog(
+            recipes=recipes,
+            recipes_by_id={recipe.pk: recipe for recipe in recipes},
+            recipes_by_input=dict(recipes_by_input),
+            recipes_by_output=dict(recipes_by_output),
+            inputs=inputs,
+            outputs=outputs,
+        )
+
+
+conversion_recipes_cache = VersionedCache(
+    name=CONVERSION_RECIPES_CACHE_NAME,
+    loader=ConversionRecipesStorage.load_catalog,
+)
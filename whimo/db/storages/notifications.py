@@ -0,0 +1,83 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count
+from django_redis import get_redis_connection
+
+from whimo.db.enums.notifications import NotificationStatus
+from whimo.db.models import Notification
+
+NOTIFICATION_COUNTERS_KEY = "notification_counters:{user_id}"
+# Counters are reloaded from the database after expiring, which bounds the drift of changes made outside the services
+NOTIFICATION_COUNTERS_TIMEOUT = 60 * 60 * 24
+NOTIFICATION_COUNTERS_TOTAL = "total"
+
+# Only existing counters are adjusted, missing ones are loaded from the database on the next read
+ADJUST_COUNTERS_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+for index = 1, #ARGV, 2 do
+    redis.call("HINCRBY", KEYS[1], ARGV[index], ARGV[index + 1])
+end
+return 1
+"""
+
+
+@dataclass(slots=True)
+class NotificationCountersStorage:
+    """Pending notifications counts of users, in total and by type, kept in Redis hashes."""
+
+    @staticmethod
+    def get_counters(user_id: UUID) -> dict[str, int]:
+        """Counts by notification type, with the overall count under `NOTIFICATION_COUNTERS_TOTAL`."""
+        redis = get_redis_connection()
+        key = NOTIFICATION_COUNTERS_KEY.format(user_id=user_id)
+
+        if values := redis.hgetall(key):
+            return {field.decode(): int(value) for field, value in values.items()}
+
+        counters = NotificationCountersStorage.load_counters(user_id)
+        pipeline = redis.pipeline()
+        pipeline.hset(key, mapping=counters)
+        pipeline.expire(key, NOTIFICATION_COUNTERS_TIMEOUT)
+        pipeline.execute()
+        return counters
+
+    @staticmethod
+    def load_counters(user_id: UUID) -> dict[str, int]:
+        counts = dict(
+            Notification.objects.filter(received_by_id=user_id, status=NotificationStatus.PENDING)
+            .order_by()
+            .values("type")
+            .annotate(count=Count("pk"))
+            .values_list("type", "count")
+        )
+        return {NOTIFICATION_COUNTERS_TOTAL: sum(counts.values()), **counts}
+
+    @staticmethod
+    def adjust(notifications: Iterable[Notification], delta: int) -> None:
+        """Add `delta` to the counters of every notification type and receiver once the transaction commits."""
+        deltas: dict[UUID, Counter[str]] = {}
+        for notification in notifications:
+            user_deltas = deltas.setdefault(notification.received_by_id, Counter())
+            user_deltas[notification.type] += delta
+            user_deltas[NOTIFICATION_COUNTERS_TOTAL] += delta
+
+        if not deltas:
+            return
+
+        def apply_deltas() -> None:
+            redis = get_redis_connection()
+            adjust_counters = redis.register_script(ADJUST_COUNTERS_SCRIPT)
+
+            pipeline = redis.pipeline()
+            for user_id, user_deltas in deltas.items():
+                args = [item for field, value in user_deltas.items() for item in (field, value)]
+                adjust_counters(keys=[NOTIFICATION_COUNTERS_KEY.format(user_id=user_id)], args=args, client=pipeline)
+            pipeline.execute()
+
+        transaction.on_commit(apply_deltas)
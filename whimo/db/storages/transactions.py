@@ -1,9 +1,9 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import cast
 from uuid import UUID
 
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 
 from whimo.common.schemas.errors import NotFound
@@ -11,6 +11,8 @@ from whimo.common.utils import get_user_model
 from whimo.db.enums import TransactionAction, TransactionStatus, TransactionType
 from whimo.db.enums.transactions import TransactionTraceability
 from whimo.db.models import Transaction
+from whimo.db.storages.chains import ChainsStorage
+from whimo.db.storages.commodities import CommoditiesStorage
 from whimo.transactions.schemas.requests import TransactionListRequest
 
 User = get_user_model()
@@ -23,7 +25,7 @@ class TransactionsStorage:
         try:
             return (
                 Transaction.objects.filter(Q(buyer_id=user_id) | Q(seller_id=user_id), pk=transaction_id)
-                .select_related("commodity__group", "commodity", "buyer", "seller")
+                .select_related("buyer", "seller")
                 .prefetch_related(
                     User.objects.generate_prefetch_gadgets("buyer__"),
                     User.objects.generate_prefetch_gadgets("seller__"),
@@ -58,12 +60,7 @@ class TransactionsStorage:
 
     @staticmethod
     def filter_transactions(user_id: UUID, request: TransactionListRequest) -> QuerySet[Transaction]:
-        queryset = Transaction.objects.select_related(
-            "commodity__group",
-            "commodity",
-            "buyer",
-            "seller",
-        ).prefetch_related(
+        queryset = Transaction.objects.select_related("buyer", "seller").prefetch_related(
             User.objects.generate_prefetch_gadgets("buyer__"),
             User.objects.generate_prefetch_gadgets("seller__"),
         )
@@ -71,11 +68,9 @@ class TransactionsStorage:
         _filter = Q(buyer_id=request.buyer_id) if request.buyer_id else Q(buyer_id=user_id) | Q(seller_id=user_id)
 
         if search := request.search:
-            _filter &= (
-                Q(commodity__name__icontains=search)
-                | Q(commodity__code__icontains=search)
-                | Q(commodity__name_variants__icontains=search)
-            )
+            # Commodities are matched in the in-memory registry, so the filter uses the commodity index
+            commodities = CommoditiesStorage.search_commodities(search)
+            _filter &= Q(commodity_id__in=[commodity.pk for commodity in commodities])
 
         if status := request.status:
             _filter &= Q(status=status)
@@ -93,7 +88,8 @@ class TransactionsStorage:
             _filter &= Q(created_at__lte=created_at_to)
 
         if commodity_group_id := request.commodity_group_id:
-            _filter &= Q(commodity__group_id=commodity_group_id)
+            commodities = CommoditiesStorage.get_catalog().commodities_by_group.get(commodity_group_id, [])
+            _filter &= Q(commodity_id__in=[commodity.pk for commodity in commodities])
 
         if commodity_id := request.commodity_id:
             _filter &= Q(commodity_id=commodity_id)
@@ -107,22 +103,11 @@ class TransactionsStorage:
 
     @staticmethod
     def get_traceability_counts(transaction_id: UUID) -> dict[TransactionTraceability, int]:
-        chain_transactions = TransactionsStorage.get_chain_transactions(transaction_id)
-
-        counts = {TransactionTraceability(traceability): 0 for traceability in TransactionTraceability}
-        counts_query = chain_transactions.values("traceability").annotate(count=Count("id"))
-        for item in counts_query:
-            if traceability := item["traceability"]:
-                counts[TransactionTraceability(traceability)] += item["count"]
-
-        return counts
+        return ChainsStorage.get_summary(transaction_id).traceability_counts
 
     @staticmethod
     def get_first_chain_transactions(transaction_id: UUID) -> QuerySet[Transaction]:
-        chain_transactions = TransactionsStorage.get_chain_transactions(transaction_id)
-        first_transactions = chain_transactions.filter(seller_id__isnull=True).exclude(type=TransactionType.CONVERSION)
-
-        return cast(QuerySet[Transaction], first_transactions)
+        return Transaction.objects.filter(pk__in=ChainsStorage.get_summary(transaction_id).first_transaction_ids)
 
     @staticmethod
     def get_downstream_traceability(seller_id: UUID | None, commodity_id: UUID) -> TransactionTraceability:
@@ -162,38 +147,4 @@ class TransactionsStorage:
 
     @staticmethod
     def get_chain_transactions(transaction_id: UUID) -> QuerySet[Transaction]:
-        chain_transactions = Transaction.objects.none()
-        base_query = Transaction.objects.all()
-
-        transactions_ids = {transaction_id}
-        filters: dict[str, Any] = {}
-        visited: set[UUID] = set()
-
-        while transactions_ids:
-            filters["pk__in"] = transactions_ids
-            transactions_query = base_query.filter(**filters).exclude(pk__in=visited)
-            chain_transactions |= transactions_query
-
-            filters["status"] = TransactionStatus.ACCEPTED
-            visited |= transactions_ids
-
-            sellers_ids = transactions_query.filter(seller_id__isnull=False).values_list("seller_id", flat=True)
-            transactions_ids = set(base_query.filter(buyer_id__in=sellers_ids).values_list("pk", flat=True))
-
-            conversion_outputs = transactions_query.filter(
-                type=TransactionType.CONVERSION,
-                seller_id__isnull=True,
-            )
-
-            for conversion_output in conversion_outputs:
-                input_transactions = Transaction.objects.filter(
-                    type=TransactionType.CONVERSION,
-                    buyer_id__isnull=True,
-                    group_id=conversion_output.group_id,
-                ).exclude(pk__in=visited)
-
-                chain_transactions |= input_transactions
-
-                transactions_ids |= set(input_transactions.values_list("pk", flat=True))
-
-        return cast(QuerySet[Transaction], chain_transactions)
+        return Transaction.objects.filter(pk__in=ChainsStorage.get_summary(transaction_id).transaction_ids)
@@ -1,4 +1,48 @@
+import os
 from multiprocessing import cpu_count
+from typing import Any
+
+# Worker profiles, selected with GUNICORN_PROFILE and tuned with the variables below:
+# - sync: one request per process, for CPU bound traffic
+# - gthread: fewer processes with several threads, for I/O bound traffic (e.g. chain downloads waiting for S3)
+PROFILES: dict[str, dict[str, Any]] = {
+    "sync": {"workers": cpu_count() * 2 + 1, "worker_class": "sync", "threads": 1},
+    "gthread": {"workers": cpu_count() + 1, "worker_class": "gthread", "threads": 8},
+}
+
+profile_name = os.environ.get("GUNICORN_PROFILE", "sync")
+if profile_name not in PROFILES:
+    raise ValueError(f"GUNICORN_PROFILE {profile_name!r} is not one of {', '.join(PROFILES)}")
+profile = PROFILES[profile_name]
 
 bind = "0.0.0.0:8000"
-workers = cpu_count() * 2 + 1
+workers = int(os.environ.get("GUNICORN_WORKERS", str(profile["workers"])))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", profile["worker_class"])
+threads = int(os.environ.get("GUNICORN_THREADS", str(profile["threads"])))
+
+# Recycle workers to bound memory growth, the jitter keeps them from restarting at the same time
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Load Django once in the master, workers share the imported modules through copy-on-write pages
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() in {"1", "true", "yes"}
+
+
+def when_ready(_: Any) -> None:
+    if not preload_app:
+        return
+
+    from django.urls import get_resolver
+
+    # Import views before forking, otherwise every worker imports them on its first request
+    get_resolver().url_patterns  # noqa: B018
+
+
+def post_fork(_server: Any, _worker: Any) -> None:
+    if not preload_app:
+        return
+
+    from django.db import connections
+
+    # Sockets opened by the master must not be shared between workers
+    connections.close_all()
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from typing import Mapping
 from uuid import UUID
 
+from whimo.db.enums import TransactionStatus, TransactionType
 from whimo.db.enums.notifications import NotificationStatus, NotificationType
-from whimo.db.models import Notification, Transaction
-from whimo.notifications.schemas.dto import NotificationDTO
+from whimo.db.models import ArchivedNotification, Notification, Transaction
+from whimo.db.storages import CommoditiesStorage
+from whimo.db.storages.notifications import NOTIFICATION_COUNTERS_TOTAL
+from whimo.notifications.schemas.dto import NotificationDTO, NotificationSummaryDTO, NotificationTransactionDTO
 from whimo.transactions.mappers import TransactionsMapper
 from whimo.users.mappers.users import UsersMapper
 
@@ -11,14 +15,28 @@ from whimo.users.mappers.users import UsersMapper
 @dataclass(slots=True)
 class NotificationsMapper:
     @staticmethod
-    def to_dto(notification: Notification) -> NotificationDTO:
+    def to_dto(
+        notification: Notification | ArchivedNotification,
+        transactions: Mapping[UUID, Transaction] | None = None,
+    ) -> NotificationDTO:
         received_by = UsersMapper.to_dto(notification.received_by) if notification.received_by else None
         created_by = UsersMapper.to_dto(notification.created_by) if notification.created_by else None
 
+        # Notification data keeps a compact copy of the transaction, the full one is used when it was loaded
+        data = notification.data
+        if (
+            data
+            and transactions
+            and (transaction_id := NotificationsMapper.get_transaction_id(notification))
+            and (transaction := transactions.get(transaction_id))
+        ):
+            transaction_dto = TransactionsMapper.to_dto(transaction, notification.received_by_id, with_gadgets=False)
+            data = {**data, "transaction": transaction_dto.model_dump(mode="json")}
+
         return NotificationDTO(
             id=notification.id,
             created_at=notification.created_at,
-            data=notification.data,
+            data=data,
             # ---
             status=NotificationStatus(notification.status),
             type=NotificationType(notification.type),
@@ -28,8 +46,29 @@ class NotificationsMapper:
         )
 
     @staticmethod
-    def to_dto_list(notifications: list[Notification]) -> list[NotificationDTO]:
-        return [NotificationsMapper.to_dto(notification) for notification in notifications]
+    def to_dto_list(
+        notifications: list[Notification] | list[ArchivedNotification],
+        transactions: Mapping[UUID, Transaction] | None = None,
+    ) -> list[NotificationDTO]:
+        return [NotificationsMapper.to_dto(notification, transactions) for notification in notifications]
+
+    @staticmethod
+    def get_transaction_id(notification: Notification | ArchivedNotification) -> UUID | None:
+        transaction = (notification.data or {}).get("transaction")
+        if not isinstance(transaction, dict):
+            return None
+
+        try:
+            return UUID(str(transaction.get("id")))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def to_summary_dto(counters: dict[str, int]) -> NotificationSummaryDTO:
+        return NotificationSummaryDTO(
+            pending=counters.get(NOTIFICATION_COUNTERS_TOTAL, 0),
+            pending_by_type={item: counters.get(item, 0) for item in NotificationType},
+        )
 
     @staticmethod
     def from_transaction(
@@ -38,7 +77,21 @@ class NotificationsMapper:
         received_by_id: UUID,
         created_by_id: UUID | None = None,
     ) -> Notification:
-        transaction_dto = TransactionsMapper.to_dto(transaction, received_by_id, with_gadgets=False)
+        commodity = CommoditiesStorage.get_commodity(transaction.commodity_id) or transaction.commodity
+        transaction_dto = NotificationTransactionDTO(
+            id=transaction.pk,
+            type=TransactionType(transaction.type),
+            status=TransactionStatus(transaction.status),
+            action=TransactionsMapper.get_action(transaction, received_by_id),
+            commodity_id=transaction.commodity_id,
+            volume=transaction.volume,
+            seller_id=transaction.seller_id,
+            buyer_id=transaction.buyer_id,
+            # ---
+            commodity_name=commodity.name,
+            seller_username=transaction.seller.username if transaction.seller else None,
+            buyer_username=transaction.buyer.username if transaction.buyer else None,
+        )
 
         data = {
             "transaction": transaction_dto.model_dump(mode="json"),
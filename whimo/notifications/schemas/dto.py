@@ -1,14 +1,15 @@
-from datetime import datetime
+from uuid import UUID
 
 from pydantic import BaseModel
 
-from whimo.common.schemas.dto import BaseModelDTO
+from whimo.common.schemas.dto import BaseModelDTO, FloatDecimal, IsoDatetime
+from whimo.db.enums import TransactionAction, TransactionStatus, TransactionType
 from whimo.db.enums.notifications import NotificationDeviceType, NotificationStatus, NotificationType
 from whimo.users.schemas.dto import UserDTO
 
 
 class NotificationDTO(BaseModelDTO):
-    created_at: datetime
+    created_at: IsoDatetime
     data: dict | None
 
     type: NotificationType
@@ -18,6 +19,30 @@ class NotificationDTO(BaseModelDTO):
     created_by: UserDTO | None
 
 
+class NotificationTransactionDTO(BaseModelDTO):
+    """Transaction fields stored in notification data, the full transaction is loaded when notifications are read."""
+
+    type: TransactionType
+    status: TransactionStatus
+    action: TransactionAction | None
+
+    commodity_id: UUID
+    volume: FloatDecimal
+
+    seller_id: UUID | None
+    buyer_id: UUID | None
+
+    # Display fields matched by the search of notifications
+    commodity_name: str
+    seller_username: str | None
+    buyer_username: str | None
+
+
+class NotificationSummaryDTO(BaseModel):
+    pending: int
+    pending_by_type: dict[NotificationType, int]
+
+
 class NotificationSettingsDTO(BaseModel):
     type: NotificationType
     is_enabled: bool
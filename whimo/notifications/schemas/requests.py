@@ -29,6 +29,13 @@ class NotificationStatusUpdateRequest(BaseRequest):
         raise InvalidUpdateStatusError
 
 
+class NotificationsStatusBulkUpdateRequest(NotificationStatusUpdateRequest):
+    ids: list[UUID] | None = None
+    types: list[NotificationType] | None = None
+    created_at_from: datetime | None = None
+    created_at_to: datetime | None = None
+
+
 class NotificationSettingsUpdateRequest(BaseRequest):
     settings: list[NotificationSettingsDTO]
 
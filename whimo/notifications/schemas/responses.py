@@ -8,6 +8,10 @@ class NotificationStatusUpdatedResponse(MessageResponse):
     message: StrPromise = _("Notification status updated")
 
 
+class NotificationsStatusUpdatedResponse(MessageResponse):
+    message: StrPromise = _("Notifications status updated")
+
+
 class NotificationSettingsUpdatedResponse(MessageResponse):
     message: StrPromise = _("Notification settings updated")
 
@@ -1,22 +1,33 @@
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import cast
+from datetime import timedelta
+from typing import Sequence, TypeVar, cast
 from uuid import UUID
 
+from django.conf import settings
+from django.db import connection
+from django.db import transaction as db_transaction
 from django.db.models import Q, QuerySet
+from django.utils import timezone
 
 from whimo.common.schemas.base import Pagination
 from whimo.common.schemas.errors import NotFound
 from whimo.common.utils import get_user_model, paginate_queryset
 from whimo.db.enums.notifications import NotificationStatus, NotificationType
-from whimo.db.models import Notification, Transaction
+from whimo.db.history import record_changes_history
+from whimo.db.models import ArchivedNotification, Notification, Transaction
+from whimo.db.storages import NotificationCountersStorage, UserChangesStorage
 from whimo.notifications.mappers.notifications import NotificationsMapper
 from whimo.notifications.schemas.requests import (
     NotificationListRequest,
+    NotificationsStatusBulkUpdateRequest,
     NotificationStatusUpdateRequest,
 )
 
 User = get_user_model()
 
+N = TypeVar("N", Notification, ArchivedNotification)
+
 
 @dataclass(slots=True)
 class NotificationsService:
@@ -35,10 +46,23 @@ class NotificationsService:
         except Notification.DoesNotExist as err:
             raise NotFound(errors={"notification": [notification_id]}) from err
 
+    @staticmethod
+    def get_transactions(notifications: Sequence[Notification | ArchivedNotification]) -> dict[UUID, Transaction]:
+        """Transactions referenced by `notifications`, loaded with one query to expand their compact data."""
+        transaction_ids = {
+            transaction_id
+            for notification in notifications
+            if (transaction_id := NotificationsMapper.get_transaction_id(notification))
+        }
+        if not transaction_ids:
+            return {}
+
+        return Transaction.objects.select_related("buyer", "seller").in_bulk(transaction_ids)
+
     @staticmethod
     def list_notifications(user_id: UUID, request: NotificationListRequest) -> tuple[list[Notification], Pagination]:
         queryset = (
-            NotificationsService._filter_notifications(user_id, request)
+            NotificationsService._filter_notifications(Notification.objects.all(), user_id, request)
             .prefetch_related(
                 User.objects.generate_prefetch_gadgets("received_by__"),
                 User.objects.generate_prefetch_gadgets("created_by__"),
@@ -47,6 +71,42 @@ class NotificationsService:
         )
         return paginate_queryset(queryset=queryset, request=request)
 
+    @staticmethod
+    def list_archived_notifications(
+        user_id: UUID, request: NotificationListRequest
+    ) -> tuple[list[ArchivedNotification], Pagination]:
+        queryset = (
+            NotificationsService._filter_notifications(ArchivedNotification.objects.all(), user_id, request)
+            .prefetch_related(
+                User.objects.generate_prefetch_gadgets("received_by__"),
+                User.objects.generate_prefetch_gadgets("created_by__"),
+            )
+            .order_by("-created_at")
+        )
+        return paginate_queryset(queryset=queryset, request=request)
+
+    @staticmethod
+    def archive_notifications(batch_size: int) -> int:
+        """Move expired notifications with their history to the archive, one transaction per batch.
+
+        Read notifications expire after `NOTIFICATIONS_READ_RETENTION_DAYS`, the others after
+        `NOTIFICATIONS_RETENTION_DAYS`. Returns the number of archived notifications.
+        """
+        now = timezone.now()
+        expired = Notification.objects.filter(
+            Q(
+                status=NotificationStatus.READ,
+                created_at__lt=now - timedelta(days=settings.NOTIFICATIONS_READ_RETENTION_DAYS),
+            )
+            | Q(created_at__lt=now - timedelta(days=settings.NOTIFICATIONS_RETENTION_DAYS))
+        )
+
+        archived = 0
+        while batch_count := NotificationsService._archive_batch(expired, batch_size):
+            archived += batch_count
+
+        return archived
+
     @staticmethod
     def create_from_transaction(
         notification_type: NotificationType,
@@ -72,6 +132,7 @@ class NotificationsService:
         )
 
         notification.save()
+        NotificationCountersStorage.adjust([notification], delta=1)
         return notification
 
     @staticmethod
@@ -109,10 +170,99 @@ class NotificationsService:
 
         notification.status = request.status
         notification.save(update_fields=["updated_at", "status"])
+        NotificationCountersStorage.adjust([notification], delta=-1)
+
+    @staticmethod
+    def bulk_update_status(user_id: UUID, request: NotificationsStatusBulkUpdateRequest) -> int:
+        """Update pending notifications matching `request` with a single query. Returns the number updated."""
+        queryset = Notification.objects.filter(received_by_id=user_id, status=NotificationStatus.PENDING)
+
+        if (notification_ids := request.ids) is not None:
+            queryset = queryset.filter(pk__in=notification_ids)
+
+        if notification_types := request.types:
+            queryset = queryset.filter(type__in=notification_types)
+
+        if created_at_from := request.created_at_from:
+            queryset = queryset.filter(created_at__gte=created_at_from)
+
+        if created_at_to := request.created_at_to:
+            queryset = queryset.filter(created_at__lte=created_at_to)
+
+        with db_transaction.atomic():
+            notifications = list(queryset.order_by().select_for_update())
+            if not notifications:
+                return 0
+
+            updated_at = timezone.now()
+            Notification.objects.filter(pk__in=[notification.pk for notification in notifications]).update(
+                status=request.status, updated_at=updated_at
+            )
+
+            for notification in notifications:
+                notification.status = request.status
+                notification.updated_at = updated_at
+            record_changes_history(notifications, Notification)
+
+        # Signals are not sent by `update`
+        NotificationCountersStorage.adjust(notifications, delta=-1)
+        UserChangesStorage.bump(user_id)
+        return len(notifications)
+
+    @staticmethod
+    def get_counters(user_id: UUID) -> dict[str, int]:
+        return NotificationCountersStorage.get_counters(user_id)
+
+    @staticmethod
+    def _archive_batch(queryset: QuerySet[Notification], batch_size: int) -> int:
+        with db_transaction.atomic():
+            notifications = list(queryset.order_by("created_at").select_for_update(skip_locked=True)[:batch_size])
+            if not notifications:
+                return 0
+
+            notification_ids = [notification.pk for notification in notifications]
+            history_queryset = Notification.history.filter(id__in=notification_ids)
+
+            history = defaultdict(list)
+            for record in history_queryset.order_by("history_date", "history_id").values(
+                "id", "history_date", "history_type", "history_user_id", "status"
+            ):
+                history[record.pop("id")].append(record)
+
+            ArchivedNotification.objects.bulk_create(
+                [
+                    ArchivedNotification(
+                        id=notification.pk,
+                        created_at=notification.created_at,
+                        data=notification.data,
+                        status=notification.status,
+                        type=notification.type,
+                        received_by_id=notification.received_by_id,
+                        created_by_id=notification.created_by_id,
+                        history=history[notification.pk],
+                    )
+                    for notification in notifications
+                ]
+            )
+
+            history_queryset.delete()
+            # Deleting through the ORM would record a deletion in the history of every archived notification
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {connection.ops.quote_name(Notification._meta.db_table)} WHERE id = ANY(%s::uuid[])",
+                    [[str(notification_id) for notification_id in notification_ids]],
+                )
+
+        pending_notifications = [
+            notification for notification in notifications if notification.status == NotificationStatus.PENDING
+        ]
+        NotificationCountersStorage.adjust(pending_notifications, delta=-1)
+        UserChangesStorage.bump(*{notification.received_by_id for notification in notifications})
+        return len(notifications)
 
     @staticmethod
-    def _filter_notifications(user_id: UUID, request: NotificationListRequest) -> QuerySet[Notification]:
-        queryset = Notification.objects.select_related("received_by", "created_by").filter(received_by_id=user_id)
+    def _filter_notifications(queryset: QuerySet[N], user_id: UUID, request: NotificationListRequest) -> QuerySet[N]:
+        queryset = queryset.select_related("received_by", "created_by").filter(received_by_id=user_id)
 
         if search := request.search:
             queryset = queryset.filter(Q(type__icontains=search) | Q(data__icontains=search))
@@ -132,4 +282,4 @@ class NotificationsService:
         if created_by_id := request.created_by_id:
             queryset = queryset.filter(created_by_id=created_by_id)
 
-        return cast(QuerySet[Notification], queryset)
+        return cast(QuerySet[N], queryset)
@@ -3,13 +3,19 @@ from django.urls import path
 from whimo.notifications.views import (
     NotificationDetailView,
     NotificationDevicesView,
+    NotificationsArchiveListView,
     NotificationSettingsView,
     NotificationsListView,
+    NotificationsStatusBulkUpdateView,
+    NotificationsSummaryView,
     NotificationStatusUpdateView,
 )
 
 urlpatterns = [
     path("", NotificationsListView.as_view(), name="notifications_list"),
+    path("archive/", NotificationsArchiveListView.as_view(), name="notifications_archive_list"),
+    path("status/", NotificationsStatusBulkUpdateView.as_view(), name="notifications_status_bulk_update"),
+    path("summary/", NotificationsSummaryView.as_view(), name="notifications_summary"),
     path("<uuid:notification_id>/", NotificationDetailView.as_view(), name="notification_detail"),
     path("<uuid:notification_id>/status/", NotificationStatusUpdateView.as_view(), name="notification_status_update"),
     path("settings/", NotificationSettingsView.as_view(), name="notification_settings"),
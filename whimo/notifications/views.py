@@ -5,6 +5,7 @@ from rest_framework import views
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from whimo.common.conditional import build_user_etag, get_not_modified_response
 from whimo.common.schemas.base import DataResponse, PaginatedDataResponse
 from whimo.notifications.mappers.notifications import NotificationsMapper
 from whimo.notifications.mappers.notifications_push import NotificationsPushMapper
@@ -13,11 +14,13 @@ from whimo.notifications.schemas.requests import (
     DeviceAddRequest,
     NotificationListRequest,
     NotificationSettingsUpdateRequest,
+    NotificationsStatusBulkUpdateRequest,
     NotificationStatusUpdateRequest,
 )
 from whimo.notifications.schemas.responses import (
     DeviceAddedResponse,
     NotificationSettingsUpdatedResponse,
+    NotificationsStatusUpdatedResponse,
     NotificationStatusUpdatedResponse,
 )
 from whimo.notifications.services.notifications import NotificationsService
@@ -26,19 +29,57 @@ from whimo.notifications.services.notifications_settings import NotificationsSet
 
 
 class NotificationsListView(views.APIView):
+    query_budget = 6
+
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         payload = NotificationListRequest.parse(request, from_query_params=True)
+
+        etag = build_user_etag(request)
+        if not_modified := get_not_modified_response(request, etag):
+            return not_modified
+
         items, pagination = NotificationsService.list_notifications(user_id=request.user.id, request=payload)
+        transactions = NotificationsService.get_transactions(items)
+
+        response = NotificationsMapper.to_dto_list(notifications=items, transactions=transactions)
+        return PaginatedDataResponse(data=response, pagination=pagination).as_response(etag=etag)
+
+
+class NotificationsArchiveListView(views.APIView):
+    query_budget = 6
+
+    def get(self, request: Request, *_: Any, **__: Any) -> Response:
+        payload = NotificationListRequest.parse(request, from_query_params=True)
+
+        etag = build_user_etag(request)
+        if not_modified := get_not_modified_response(request, etag):
+            return not_modified
 
-        response = NotificationsMapper.to_dto_list(notifications=items)
-        return PaginatedDataResponse(data=response, pagination=pagination).as_response()
+        items, pagination = NotificationsService.list_archived_notifications(user_id=request.user.id, request=payload)
+        transactions = NotificationsService.get_transactions(items)
+
+        response = NotificationsMapper.to_dto_list(notifications=items, transactions=transactions)
+        return PaginatedDataResponse(data=response, pagination=pagination).as_response(etag=etag)
+
+
+class NotificationsSummaryView(views.APIView):
+    query_budget = 2
+
+    def get(self, request: Request, *_: Any, **__: Any) -> Response:
+        counters = NotificationsService.get_counters(user_id=request.user.id)
+
+        response = NotificationsMapper.to_summary_dto(counters=counters)
+        return DataResponse(data=response).as_response()
 
 
 class NotificationDetailView(views.APIView):
+    query_budget = 5
+
     def get(self, request: Request, notification_id: UUID, *_: Any, **__: Any) -> Response:
         notification = NotificationsService.get(user_id=request.user.id, notification_id=notification_id)
+        transactions = NotificationsService.get_transactions([notification])
 
-        response = NotificationsMapper.to_dto(notification=notification)
+        response = NotificationsMapper.to_dto(notification=notification, transactions=transactions)
         return DataResponse(data=response).as_response()
 
 
@@ -49,6 +90,13 @@ class NotificationStatusUpdateView(views.APIView):
         return NotificationStatusUpdatedResponse().as_response()
 
 
+class NotificationsStatusBulkUpdateView(views.APIView):
+    def patch(self, request: Request, *_: Any, **__: Any) -> Response:
+        payload = NotificationsStatusBulkUpdateRequest.parse(request)
+        NotificationsService.bulk_update_status(user_id=request.user.id, request=payload)
+        return NotificationsStatusUpdatedResponse().as_response()
+
+
 class NotificationSettingsView(views.APIView):
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         settings = NotificationsSettingsService.list_notification_settings(user_id=request.user.id)
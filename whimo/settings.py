@@ -2,13 +2,14 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
-import firebase_admin
 import sentry_sdk
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from sentry_sdk.integrations.celery import CeleryIntegration
 from sentry_sdk.integrations.django import DjangoIntegration
 
+from whimo.common.sampling import build_traces_sampler
+
 env = environ.Env()
 
 _not_set = object()
@@ -71,6 +72,8 @@ INSTALLED_APPS = (
 )
 
 MIDDLEWARE = (
+    "whimo.common.profiling.ProfilingMiddleware",
+    "whimo.common.metrics.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -81,6 +84,8 @@ MIDDLEWARE = (
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "simple_history.middleware.HistoryRequestMiddleware",
+    "whimo.db.routers.ReadYourWritesMiddleware",
+    "whimo.common.cache.PinVersionedCachesMiddleware",
 )
 
 ROOT_URLCONF = "whimo.urls"
@@ -103,6 +108,13 @@ TEMPLATES = (
 
 CONSTANCE_BACKEND = "constance.backends.database.DatabaseBackend"
 
+CONSTANCE_CONFIG = {
+    "PROFILED_TARGETS": (
+        "",
+        _("Comma separated URL path prefixes and Celery task names to profile, e.g. /api/v1/transactions/"),
+    ),
+}
+
 WSGI_APPLICATION = "whimo.common.wsgi.application"
 
 REST_FRAMEWORK = {
@@ -154,12 +166,20 @@ SENTRY_DSN = env.str("SENTRY_DSN", default="")
 
 SENTRY_ENVIRONMENT = env.str("SENTRY_ENVIRONMENT", default="production")
 
+SENTRY_TRACES_SAMPLE_RATE = env.float("SENTRY_TRACES_SAMPLE_RATE", default=0.05)
+
+# Rates by URL path prefix or Celery task name, overriding the default one, e.g. "/api/v1/system/=0"
+SENTRY_TRACES_SAMPLE_RATES = env.dict("SENTRY_TRACES_SAMPLE_RATES", cast={"value": float}, default={})
+
+# Share of sessions whose sampled traces are profiled, requests and tasks can also be profiled on demand
+SENTRY_PROFILE_SESSION_SAMPLE_RATE = env.float("SENTRY_PROFILE_SESSION_SAMPLE_RATE", default=0.0)
+
 sentry_sdk.init(
     dsn=SENTRY_DSN,
     send_default_pii=True,
     environment=SENTRY_ENVIRONMENT,
-    traces_sample_rate=1.0,
-    profile_session_sample_rate=1.0,
+    traces_sampler=build_traces_sampler(SENTRY_TRACES_SAMPLE_RATE, SENTRY_TRACES_SAMPLE_RATES),
+    profile_session_sample_rate=SENTRY_PROFILE_SESSION_SAMPLE_RATE,
     profile_lifecycle="trace",
     integrations=[
         DjangoIntegration(),
@@ -181,9 +201,30 @@ DATABASES = {
         "USER": env.str("POSTGRES_USER", default="app"),
         "PASSWORD": env.str("POSTGRES_PASSWORD"),
         "NAME": env.str("POSTGRES_DB", default="app"),
+        # Keep connections open between requests and tasks instead of connecting on each one,
+        # connections are checked before reuse so ones dropped by the server are replaced
+        "CONN_MAX_AGE": env.int("POSTGRES_CONN_MAX_AGE", default=60),
+        "CONN_HEALTH_CHECKS": env.bool("POSTGRES_CONN_HEALTH_CHECKS", default=True),
+        "OPTIONS": {
+            "connect_timeout": env.int("POSTGRES_CONNECT_TIMEOUT", default=10),
+        },
     },
 }
 
+# Optional streaming replica for read-only queries run inside `whimo.db.routers.using_replica`
+if POSTGRES_REPLICA_HOST := env.str("POSTGRES_REPLICA_HOST", default=""):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": POSTGRES_REPLICA_HOST,
+        "PORT": env.int("POSTGRES_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ("whimo.db.routers.ReplicaRouter",)
+
+# Seconds reads of a user stay on the primary after their writes, should exceed the replication lag
+REPLICA_READ_YOUR_WRITES_TIMEOUT = env.int("POSTGRES_REPLICA_READ_YOUR_WRITES_TIMEOUT", default=30)
+
 # Caching
 # ______________________________________________________________________________________________________________________
 
@@ -232,7 +273,7 @@ S3_OPTIONS = {option: value for option, value in S3_OPTIONS.items() if value is
 
 STORAGES = {
     "default": {
-        "BACKEND": "storages.backends.s3.S3Storage",
+        "BACKEND": "whimo.common.storages.InstrumentedS3Storage",
         "OPTIONS": S3_OPTIONS,
     },
     "staticfiles": {
@@ -318,18 +359,20 @@ PUSH_NOTIFICATIONS_SETTINGS_FCM_APP_ID = env.str("PUSH_NOTIFICATIONS_FCM_APP_ID"
 
 PUSH_NOTIFICATIONS_SETTINGS_APNS_APP_ID = env.str("PUSH_NOTIFICATIONS_APNS_APP_ID", default="apns")
 
+PUSH_NOTIFICATIONS_FCM_ENABLED = env.bool("PUSH_NOTIFICATIONS_FCM_ENABLED", default=False)
+
+PUSH_NOTIFICATIONS_FCM_CREDENTIALS_PATH = PUSH_NOTIFICATIONS_CONFIG_PATH / "fcm.json"
+
 PUSH_NOTIFICATIONS_SETTINGS = {
     "CONFIG": "push_notifications.conf.AppConfig",
     "USER_MODEL": AUTH_USER_MODEL,
     "APPLICATIONS": {},
 }
 
-if env.bool("PUSH_NOTIFICATIONS_FCM_ENABLED", default=False):  # pragma: no cover
+if PUSH_NOTIFICATIONS_FCM_ENABLED:  # pragma: no cover
+    # Pushes are sent with the default Firebase app, initialized by the first push task of a process
     PUSH_NOTIFICATIONS_SETTINGS["APPLICATIONS"][PUSH_NOTIFICATIONS_SETTINGS_FCM_APP_ID] = {  # type: ignore
         "PLATFORM": "FCM",
-        "FIREBASE_APP": firebase_admin.initialize_app(
-            credential=firebase_admin.credentials.Certificate(PUSH_NOTIFICATIONS_CONFIG_PATH / "fcm.json"),
-        ),
     }
 
 if env.bool("PUSH_NOTIFICATIONS_APNS_ENABLED", default=False):  # pragma: no cover
@@ -372,6 +415,40 @@ USE_X_FORWARDED_HOST = env.bool("DJANGO_USE_X_FORWARDED_HOST", False)
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", env.str("DJANGO_HTTP_X_FORWARDED_PROTO", "http"))
 
+# History
+# ______________________________________________________________________________________________________________________
+
+# History policy per model label: sync (default), sampled, async or off, e.g. "db.Balance=async,db.Notification=off"
+HISTORY_POLICIES = env.dict("HISTORY_POLICIES", default={})
+
+HISTORY_SAMPLE_RATE = env.float("HISTORY_SAMPLE_RATE", default=0.1)
+
+HISTORY_WRITE_BATCH_SIZE = env.int("HISTORY_WRITE_BATCH_SIZE", default=1000)
+
+# Metrics
+# ______________________________________________________________________________________________________________________
+
+# Sum request and task metrics in Redis for `system/metrics/`, `Server-Timing` headers are sent either way
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+
+# Bearer token of the metrics scraper, the endpoint is disabled without it
+METRICS_TOKEN = env.str("METRICS_TOKEN", default="")
+
+# Profiling
+# ______________________________________________________________________________________________________________________
+
+# Requests sending this token in the `X-Profile` header are profiled, header profiling is disabled without it
+PROFILING_TOKEN = env.str("PROFILING_TOKEN", default="")
+
+# Notifications
+# ______________________________________________________________________________________________________________________
+
+# Days after which read notifications, and notifications of any status, are moved to `notifications_archive`
+NOTIFICATIONS_READ_RETENTION_DAYS = env.int("NOTIFICATIONS_READ_RETENTION_DAYS", default=30)
+NOTIFICATIONS_RETENTION_DAYS = env.int("NOTIFICATIONS_RETENTION_DAYS", default=180)
+
+NOTIFICATIONS_ARCHIVE_BATCH_SIZE = env.int("NOTIFICATIONS_ARCHIVE_BATCH_SIZE", default=1000)
+
 # Misc
 # ______________________________________________________________________________________________________________________
 
@@ -1,7 +1,8 @@
 from django.urls import path
 
-from whimo.system.views import HealthcheckView
+from whimo.system.views import HealthcheckView, MetricsView
 
 urlpatterns = [
     path("healthcheck/", HealthcheckView.as_view(), name="system_healthcheck"),
+    path("metrics/", MetricsView.as_view(), name="system_metrics"),
 ]
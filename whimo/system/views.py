@@ -1,14 +1,28 @@
 from typing import Any
 
+from django.http import HttpResponse
 from rest_framework import views
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from whimo.common.authentication import HasMetricsTokenPermission
+from whimo.common.metrics import MetricsStorage
 from whimo.system.schemas.responses import HealthcheckResponse
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 class HealthcheckView(views.APIView):
     permission_classes = (AllowAny,)
 
     def get(self, *_: Any, **__: Any) -> Response:
         return HealthcheckResponse().as_response()
+
+
+class MetricsView(views.APIView):
+    authentication_classes = ()
+    permission_classes = (HasMetricsTokenPermission,)
+    throttle_classes = ()
+
+    def get(self, *_: Any, **__: Any) -> HttpResponse:
+        return HttpResponse(MetricsStorage.export(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1 +1,2 @@
 LOCATION_S3_PREFIX = "locations"
+LOCATION_FILES_DOWNLOAD_WORKERS = 8
@@ -0,0 +1,81 @@
+import json
+import zlib
+from typing import Iterator, NamedTuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, QuerySet
+
+from whimo.transactions.export.streaming import STREAMING_EXPORT_CHUNK_SIZE
+
+GRAPH_FORMAT = "whimo-chain-graph"
+GRAPH_FORMAT_VERSION = 1
+
+# Window bits of `zlib` for a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class GraphColumn(NamedTuple):
+    name: str
+    type: str
+    field: str
+
+
+# Nodes are the buyers and sellers of the chain
+NODE_COLUMNS = (
+    GraphColumn(name="id", type="uuid", field="id"),
+    GraphColumn(name="username", type="string", field="username"),
+)
+
+# Edges are the transactions from seller to buyer, conversion inputs have no buyer and outputs no seller
+EDGE_COLUMNS = (
+    GraphColumn(name="id", type="uuid", field="id"),
+    GraphColumn(name="source", type="uuid?", field="seller_id"),
+    GraphColumn(name="target", type="uuid?", field="buyer_id"),
+    GraphColumn(name="type", type="string", field="type"),
+    GraphColumn(name="status", type="string", field="status"),
+    GraphColumn(name="traceability", type="string?", field="traceability"),
+    GraphColumn(name="traceability_shares", type="object?", field="traceability_shares"),
+    GraphColumn(name="group_id", type="uuid?", field="group_id"),
+    GraphColumn(name="commodity_id", type="uuid", field="commodity_id"),
+    GraphColumn(name="commodity_code", type="string", field="commodity__code"),
+    GraphColumn(name="volume", type="decimal", field="volume"),
+    GraphColumn(name="created_at", type="datetime", field="created_at"),
+)
+
+
+def stream_graph(nodes: QuerySet[Model], edges: QuerySet[Model]) -> Iterator[bytes]:
+    """Gzipped NDJSON of the chain graph, fetched in chunks and compressed while it is written.
+
+    The first line describes the tables and the types of their columns, every other line is a row: a JSON array
+    starting with the table name and followed by the values in column order. Decimals are strings to keep their
+    precision, a `?` marks nullable types.
+    """
+    tables = {"nodes": (nodes, NODE_COLUMNS), "edges": (edges, EDGE_COLUMNS)}
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+
+    header = {
+        "format": GRAPH_FORMAT,
+        "version": GRAPH_FORMAT_VERSION,
+        "tables": {
+            table: [{"name": column.name, "type": column.type} for column in columns]
+            for table, (_, columns) in tables.items()
+        },
+    }
+    yield compressor.compress(_dump_line(header))
+
+    for table, (queryset, columns) in tables.items():
+        rows = queryset.order_by().values_list(*(column.field for column in columns))
+        lines = []
+        for row in rows.iterator(chunk_size=STREAMING_EXPORT_CHUNK_SIZE):
+            lines.append(_dump_line([table, *row]))
+            if len(lines) >= STREAMING_EXPORT_CHUNK_SIZE:
+                yield compressor.compress(b"".join(lines))
+                lines.clear()
+
+        yield compressor.compress(b"".join(lines))
+
+    yield compressor.flush()
+
+
+def _dump_line(value: object) -> bytes:
+    return json.dumps(value, cls=DjangoJSONEncoder, separators=(",", ":")).encode() + b"\n"
@@ -0,0 +1,23 @@
+import csv
+from typing import Iterator
+
+from django.db.models import Model, QuerySet
+from import_export.resources import ModelResource
+
+STREAMING_EXPORT_CHUNK_SIZE = 2_000
+
+
+class Echo:
+    """Pseudo buffer returning what is written, so `csv.writer` hands out the rows instead of storing them."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(resource: ModelResource, queryset: QuerySet[Model]) -> Iterator[str]:
+    """CSV rows of `resource` for `queryset`, fetched in chunks to keep large exports out of memory."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(resource.get_export_headers())
+
+    for instance in queryset.iterator(chunk_size=STREAMING_EXPORT_CHUNK_SIZE):
+        yield writer.writerow(resource.export_resource(instance))
@@ -11,6 +11,7 @@ from whimo.commodities.mappers.commodities import CommoditiesMapper
 from whimo.db.enums import TransactionAction, TransactionLocation, TransactionStatus, TransactionType
 from whimo.db.enums.transactions import TransactionTraceability
 from whimo.db.models import ConversionRecipe, Transaction
+from whimo.db.storages import CommoditiesStorage
 from whimo.transactions.schemas.dto import ConversionDTO, ConversionRecipeDTO, TransactionDTO
 from whimo.transactions.schemas.requests import TransactionDownstreamCreateRequest, TransactionProducerCreateRequest
 from whimo.users.mappers.users import UsersMapper
@@ -19,15 +20,18 @@ from whimo.users.mappers.users import UsersMapper
 @dataclass(slots=True)
 class TransactionsMapper:
     @staticmethod
-    def to_dto(entity: Transaction, user_id: UUID, with_gadgets: bool = True) -> TransactionDTO:
+    def get_action(entity: Transaction, user_id: UUID) -> TransactionAction | None:
         if entity.buyer_id == user_id:
-            action = TransactionAction.BUYING
-        elif entity.seller_id == user_id:
-            action = TransactionAction.SELLING
-        else:
-            action = None
+            return TransactionAction.BUYING
+        if entity.seller_id == user_id:
+            return TransactionAction.SELLING
+        return None
 
-        commodity = CommoditiesMapper.to_dto_with_group(entity.commodity)
+    @staticmethod
+    def to_dto(entity: Transaction, user_id: UUID, with_gadgets: bool = True) -> TransactionDTO:
+        commodity = CommoditiesMapper.to_dto_with_group(
+            CommoditiesStorage.get_commodity(entity.commodity_id) or entity.commodity
+        )
         seller = UsersMapper.to_dto(entity.seller, with_gadgets) if entity.seller else None
         buyer = UsersMapper.to_dto(entity.buyer, with_gadgets) if entity.buyer else None
 
@@ -37,7 +41,7 @@ class TransactionsMapper:
             # ---
             type=TransactionType(entity.type),
             status=TransactionStatus(entity.status),
-            action=action,
+            action=TransactionsMapper.get_action(entity, user_id),
             traceability=TransactionTraceability(entity.traceability) if entity.traceability else None,
             # ---
             location=TransactionLocation(entity.location) if entity.location else None,
@@ -0,0 +1,53 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable
+
+from whimo.db.enums.transactions import TransactionTraceability
+
+# Fraction of a volume by traceability, e.g. `{"full": 0.75, "incomplete": 0.25}`
+Shares = dict[str, float]
+
+SHARES_DIGITS = 4
+
+# Stock recorded before shares were tracked has an unknown origin
+UNKNOWN_SHARES: Shares = {TransactionTraceability.INCOMPLETE.value: 1.0}
+
+
+def get_own_shares(traceability: str | None) -> Shares:
+    """Shares of a transaction starting a chain, e.g. a harvest, all of its volume has its own traceability."""
+    return {str(traceability or TransactionTraceability.INCOMPLETE): 1.0}
+
+
+def mix_shares(parts: Iterable[tuple[Decimal, Shares | None]]) -> Shares:
+    """Shares of volumes put together, weighted by volume.
+
+    Conversion inputs have negative volumes, they are weighted by their size. Their volumes are the recipe input
+    quantities, or the overrides of the conversion, so the weights follow the actual input ratios of the
+    conversion. Recipes do not tell which input ends up in which output, so every output gets the same mix and
+    the output ratios only split the volume. Parts without shares have an unknown origin.
+    """
+    totals: dict[str, float] = defaultdict(float)
+    total_volume = 0.0
+    for volume, shares in parts:
+        if not (weight := abs(float(volume))):
+            continue
+
+        total_volume += weight
+        for traceability, share in (shares or UNKNOWN_SHARES).items():
+            totals[traceability] += weight * share
+
+    if not total_volume:
+        return {}
+
+    mixed = {traceability: round(total / total_volume, SHARES_DIGITS) for traceability, total in totals.items()}
+    return {traceability: share for traceability, share in sorted(mixed.items()) if share}
+
+
+def add_to_balance(balance_volume: Decimal, balance_shares: Shares | None, volume: Decimal, shares: Shares) -> Shares:
+    """Shares of a balance after `volume` with `shares` is added to it.
+
+    Taking volume out of a balance leaves its shares unchanged, the balance is a mass balance of its inputs.
+    """
+    if balance_volume <= 0:
+        return shares
+    return mix_shares([(balance_volume, balance_shares), (volume, shares)])
@@ -1,21 +1,16 @@
-from datetime import datetime
-from decimal import Decimal
-from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field, PlainSerializer
+from pydantic import BaseModel, Field
 
 from whimo.commodities.schemas.dto import CommodityWithGroupDTO
-from whimo.common.schemas.dto import BaseModelDTO
+from whimo.common.schemas.dto import BaseModelDTO, FloatDecimal, IsoDatetime
 from whimo.db.enums import TransactionAction, TransactionLocation, TransactionStatus, TransactionType
 from whimo.db.enums.transactions import TransactionTraceability
 from whimo.users.schemas.dto import UserDTO
 
-FloatDecimal = Annotated[Decimal, PlainSerializer(lambda x: float(x), return_type=float, when_used="json")]
-
 
 class TransactionDTO(BaseModelDTO):
-    created_at: datetime | None
+    created_at: IsoDatetime | None
 
     type: TransactionType
     status: TransactionStatus
@@ -35,8 +30,8 @@ class TransactionDTO(BaseModelDTO):
 
     is_buying_from_farmer: bool
     is_automatic: bool
-    expires_at: datetime | None
-    updated_at: datetime
+    expires_at: IsoDatetime | None
+    updated_at: IsoDatetime
 
     seller: UserDTO | None
     buyer: UserDTO | None
@@ -56,7 +51,7 @@ class FeatureProperties(BaseModel):
 
 class FeatureGeometry(BaseModel):
     type: str = "Polygon"
-    coordinates: list[list[list[Decimal]]]
+    coordinates: list[list[list[FloatDecimal]]]
 
 
 class Feature(BaseModel):
@@ -2,32 +2,41 @@ import io
 import json
 import logging
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import cast
 from uuid import UUID, uuid4
 
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.db import transaction as db_transaction
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from pydantic import ValidationError
 
 from whimo.auth.registration.services import RegistrationService
 from whimo.common.schemas.base import Pagination
 from whimo.common.schemas.errors import NotFound
-from whimo.common.utils import get_user_model, paginate_queryset
+from whimo.common.utils import get_user_model, paginate_list, paginate_queryset
 from whimo.contrib.tasks.users import send_email, send_sms
 from whimo.db.enums import GadgetType, TransactionAction, TransactionStatus, TransactionType
 from whimo.db.enums.notifications import NotificationType
 from whimo.db.enums.transactions import TransactionLocation, TransactionTraceability
-from whimo.db.models import Balance, Commodity, ConversionRecipe, Transaction
-from whimo.db.storages import TransactionsStorage, UsersStorage
+from whimo.db.history import bulk_create_with_history, bulk_update_with_history
+from whimo.db.models import Balance, Commodity, ConversionRecipe, Gadget, Transaction
+from whimo.db.storages import (
+    ChainsStorage,
+    ChainSummary,
+    ConversionRecipesStorage,
+    TransactionsStorage,
+    UserChangesStorage,
+    UsersStorage,
+)
 from whimo.notifications.services.notifications import NotificationsService
 from whimo.notifications.services.notifications_push import NotificationsPushService
-from whimo.transactions.constants import LOCATION_S3_PREFIX
+from whimo.transactions.constants import LOCATION_FILES_DOWNLOAD_WORKERS, LOCATION_S3_PREFIX
 from whimo.transactions.mappers import TransactionsMapper
+from whimo.transactions.mass_balance import UNKNOWN_SHARES, Shares, add_to_balance, get_own_shares, mix_shares
 from whimo.transactions.schemas.dto import ChainLocationBundleDTO, FeatureCollection, TraceabilityCountsDTO
 from whimo.transactions.schemas.errors import (
     AtLeastOneInputRequiredError,
@@ -92,10 +101,14 @@ class TransactionsService:
 
         traceability = TransactionsService._get_producer_traceability(request)
         transaction = TransactionsMapper.from_producer_request(user_id, traceability, request)
+        transaction.traceability_shares = get_own_shares(traceability)
 
         with db_transaction.atomic():
+            balance.traceability_shares = add_to_balance(
+                balance.volume, balance.traceability_shares, request.volume, transaction.traceability_shares
+            )
             balance.volume += request.volume
-            balance.save(update_fields=["updated_at", "volume"])
+            balance.save(update_fields=["updated_at", "volume", "traceability_shares"])
             transaction.save()
 
         TransactionsService._upload_location_file(transaction_id=transaction.pk, location_file=request.location_file)
@@ -227,11 +240,18 @@ class TransactionsService:
             NotificationsPushService.send_push([notification.id])
 
     @staticmethod
-    def get_chain_feature_collection(transaction_id: UUID) -> tuple[FeatureCollection, list[UUID], list[UUID]]:
-        if not Transaction.objects.filter(pk=transaction_id).exists():
+    def get_chain_summary(transaction_id: UUID) -> ChainSummary:
+        """Chain of the transaction, traversed once per chain version for the counts and all the downloads."""
+        summary = ChainsStorage.get_summary(transaction_id)
+        if not summary.transaction_ids:
             raise NotFound(errors={"transaction": [transaction_id]})
 
-        first_transactions = TransactionsStorage.get_first_chain_transactions(transaction_id)
+        return summary
+
+    @staticmethod
+    def get_chain_feature_collection(transaction_id: UUID) -> tuple[FeatureCollection, list[UUID], list[UUID]]:
+        summary = TransactionsService.get_chain_summary(transaction_id)
+        first_transactions = Transaction.objects.filter(pk__in=summary.first_transaction_ids)
 
         data = TransactionsService._get_feature_collections(first_transactions)
         feature_collections, succeed_transactions, failed_transactions = data
@@ -243,10 +263,8 @@ class TransactionsService:
 
     @staticmethod
     def get_chain_location_bundle(transaction_id: UUID) -> tuple[bytes, ChainLocationBundleDTO]:
-        if not Transaction.objects.filter(pk=transaction_id).exists():
-            raise NotFound(errors={"transaction": [transaction_id]})
-
-        chain_transactions = TransactionsStorage.get_chain_transactions(transaction_id=transaction_id)
+        summary = TransactionsService.get_chain_summary(transaction_id)
+        chain_transactions = Transaction.objects.filter(pk__in=summary.transaction_ids)
 
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
@@ -269,15 +287,54 @@ class TransactionsService:
 
     @staticmethod
     def get_chain_csv_export(transaction_id: UUID) -> QuerySet[Transaction]:
-        if not Transaction.objects.filter(pk=transaction_id).exists():
-            raise NotFound(errors={"transaction": [transaction_id]})
+        summary = TransactionsService.get_chain_summary(transaction_id)
+        return (
+            Transaction.objects.filter(pk__in=summary.transaction_ids)
+            .select_related("commodity", "commodity__group", "seller", "buyer", "created_by")
+            .prefetch_related("seller__gadgets", "buyer__gadgets")
+        )
 
+    @staticmethod
+    def get_chain_graph_export(transaction_id: UUID) -> tuple[QuerySet[User], QuerySet[Transaction]]:  # type: ignore
+        """Nodes and edges of the chain: its buyers and sellers, and its transactions."""
+        summary = TransactionsService.get_chain_summary(transaction_id)
+        return (
+            User.objects.filter(pk__in=summary.user_ids),
+            Transaction.objects.filter(pk__in=summary.transaction_ids),
+        )
+
+    @staticmethod
+    def get_downstream_csv_export(transaction_ids: list[UUID]) -> QuerySet[Transaction]:
+        downstream_transactions = ChainsStorage.get_downstream_transactions(transaction_ids)
         return (
-            TransactionsStorage.get_chain_transactions(transaction_id)
+            Transaction.objects.filter(pk__in=[item.id for item in downstream_transactions])
             .select_related("commodity", "commodity__group", "seller", "buyer", "created_by")
             .prefetch_related("seller__gadgets", "buyer__gadgets")
         )
 
+    @staticmethod
+    def notify_downstream_buyers(transaction_ids: list[UUID]) -> int:
+        """Ask buyers of everything made from `transaction_ids` to review their stock, e.g. after a plot is flagged.
+
+        Buyers are reached on their verified gadgets. Returns the number of notified buyers.
+        """
+        downstream_transactions = ChainsStorage.get_downstream_transactions(transaction_ids)
+        buyer_ids = {item.buyer_id for item in downstream_transactions if item.buyer_id}
+
+        gadgets = Gadget.objects.filter(user_id__in=buyer_ids, is_verified=True).values_list(
+            "user_id", "type", "identifier"
+        )
+
+        notified_ids = set()
+        for user_id, gadget_type, identifier in gadgets:
+            if gadget_type == GadgetType.EMAIL:
+                TransactionsService._send_downstream_email(identifier)
+            else:
+                TransactionsService._send_downstream_sms(identifier)
+            notified_ids.add(user_id)
+
+        return len(notified_ids)
+
     @staticmethod
     def get_list_csv_export(user_id: UUID, request: TransactionListRequest) -> QuerySet[Transaction]:
         return (
@@ -288,36 +345,37 @@ class TransactionsService:
 
     @staticmethod
     def create_conversion(user_id: UUID, request: ConversionCreateRequest) -> list[Transaction]:
-        try:
-            recipe = ConversionRecipe.objects.prefetch_conversion_data().get(id=request.recipe_id)
-        except ConversionRecipe.DoesNotExist as err:
-            raise RecipeNotFoundError from err
+        catalog = ConversionRecipesStorage.get_catalog()
+        if request.recipe_id not in catalog.recipes_by_id:
+            raise RecipeNotFoundError
 
-        recipe_input_ids = {inp.commodity_id for inp in recipe.inputs_list}
-        recipe_output_ids = {out.commodity_id for out in recipe.outputs_list}
+        recipe_inputs = catalog.inputs[request.recipe_id]
+        recipe_outputs = catalog.outputs[request.recipe_id]
 
         if request.input_overrides:
             override_input_ids = {item.commodity_id for item in request.input_overrides}
-            if not override_input_ids.issubset(recipe_input_ids):
+            if not override_input_ids.issubset(recipe_inputs.keys()):
                 raise InvalidRecipeOverrideError
 
         if request.output_overrides:
             override_output_ids = {item.commodity_id for item in request.output_overrides}
-            if not override_output_ids.issubset(recipe_output_ids):
+            if not override_output_ids.issubset(recipe_outputs.keys()):
                 raise InvalidRecipeOverrideError
 
         input_override_map = {item.commodity_id: item.quantity for item in request.input_overrides or []}
         output_override_map = {item.commodity_id: item.quantity for item in request.output_overrides or []}
 
         input_commodities = {
-            inp.commodity_id: input_override_map.get(inp.commodity_id, inp.quantity) for inp in recipe.inputs_list
+            commodity_id: input_override_map.get(commodity_id, quantity)
+            for commodity_id, quantity in recipe_inputs.items()
         }
 
         if all(qty == 0 for qty in input_commodities.values()):
             raise AtLeastOneInputRequiredError
 
         output_commodities = {
-            out.commodity_id: output_override_map.get(out.commodity_id, out.quantity) for out in recipe.outputs_list
+            commodity_id: output_override_map.get(commodity_id, quantity)
+            for commodity_id, quantity in recipe_outputs.items()
         }
 
         input_commodities = {k: v for k, v in input_commodities.items() if v > 0}
@@ -343,6 +401,10 @@ class TransactionsService:
                     user_id=user_id,
                     output_commodities=output_commodities,
                     traceability=traceability,
+                    # Outputs are made of the inputs in the proportions of the recipe
+                    traceability_shares=mix_shares(
+                        (item.volume, item.traceability_shares) for item in input_transactions
+                    ),
                     group_id=group_id,
                 )
             )
@@ -351,12 +413,18 @@ class TransactionsService:
             all_transactions = input_transactions + output_transactions
 
             if all_balances_to_update:
-                Balance.objects.bulk_update(all_balances_to_update, ["volume", "updated_at"])
+                bulk_update_with_history(
+                    all_balances_to_update, Balance, ["volume", "traceability_shares", "updated_at"]
+                )
 
             if output_balances_to_create:
-                Balance.objects.bulk_create(output_balances_to_create)
+                bulk_create_with_history(output_balances_to_create, Balance)
+
+            bulk_create_with_history(all_transactions, Transaction)
 
-            Transaction.objects.bulk_create(all_transactions)
+            # Bulk operations skip model signals
+            UserChangesStorage.bump(user_id)
+            ChainsStorage.bump(user_id)
 
             return all_transactions
 
@@ -396,24 +464,43 @@ class TransactionsService:
                     commodity_id=transaction.commodity_id,
                     negative_volume=seller_balance.volume - transaction.volume,
                 )
+                auto_transaction.traceability_shares = get_own_shares(auto_transaction.traceability)
+                seller_balance.traceability_shares = add_to_balance(
+                    seller_balance.volume,
+                    seller_balance.traceability_shares,
+                    auto_transaction.volume,
+                    auto_transaction.traceability_shares,
+                )
                 seller_balance.volume += auto_transaction.volume
                 auto_transaction.save()
 
+            transaction.status = TransactionStatus.ACCEPTED
+            transaction.expires_at = None
+            transaction.traceability = TransactionsStorage.get_downstream_traceability(
+                seller_id=seller_id,
+                commodity_id=transaction.commodity_id,
+            )
             if seller_balance:
+                # The volume is taken out of the seller's balance, so it has the shares of the balance
+                transaction.traceability_shares = seller_balance.traceability_shares or UNKNOWN_SHARES
                 seller_balance.volume -= transaction.volume
-                seller_balance.save(update_fields=["updated_at", "volume"])
+                seller_balance.save(update_fields=["updated_at", "volume", "traceability_shares"])
+            else:
+                transaction.traceability_shares = get_own_shares(transaction.traceability)
 
             if buyer_balance:
+                buyer_balance.traceability_shares = add_to_balance(
+                    buyer_balance.volume,
+                    buyer_balance.traceability_shares,
+                    transaction.volume,
+                    transaction.traceability_shares,
+                )
                 buyer_balance.volume += transaction.volume
-                buyer_balance.save(update_fields=["updated_at", "volume"])
+                buyer_balance.save(update_fields=["updated_at", "volume", "traceability_shares"])
 
-            transaction.status = TransactionStatus.ACCEPTED
-            transaction.expires_at = None
-            transaction.traceability = TransactionsStorage.get_downstream_traceability(
-                seller_id=seller_id,
-                commodity_id=transaction.commodity_id,
+            transaction.save(
+                update_fields=["updated_at", "status", "expires_at", "traceability", "traceability_shares"]
             )
-            transaction.save(update_fields=["updated_at", "status", "expires_at", "traceability"])
 
             notification = NotificationsService.create_from_transaction(
                 notification_type=NotificationType.TRANSACTION_ACCEPTED,
@@ -494,13 +581,20 @@ class TransactionsService:
         succeed_transactions = []
         failed_transactions = []
 
-        for transaction in transactions:
+        transactions_list = list(transactions)
+        location_contents = TransactionsService._download_location_files(
+            [transaction.pk for transaction in transactions_list if transaction.location == TransactionLocation.QR]
+        )
+
+        for transaction in transactions_list:
             if transaction.location != TransactionLocation.QR:
                 failed_transactions.append(transaction.pk)
                 continue
 
             try:
-                location_content = default_storage.open(f"{LOCATION_S3_PREFIX}/{transaction.id}").read().decode()
+                location_content = location_contents[transaction.pk]
+                if isinstance(location_content, Exception):
+                    raise location_content
                 location_data = json.loads(location_content)
             except Exception as exc:
                 raise LocationFileDownloadError from exc
@@ -530,15 +624,19 @@ class TransactionsService:
         custom_location_file_transactions = []
         no_location_file_transactions = []
 
-        for tx in transactions:
+        transactions_list = list(transactions)
+        location_contents = TransactionsService._download_location_files(
+            [tx.pk for tx in transactions_list if tx.location == TransactionLocation.QR]
+        )
+
+        for tx in transactions_list:
             if tx.location != TransactionLocation.QR:
                 no_location_file_transactions.append(tx.pk)
                 continue
 
             custom_location_file_transactions.append(tx.pk)
-            try:
-                location_content = default_storage.open(f"{LOCATION_S3_PREFIX}/{tx.id}").read().decode()
-            except Exception:
+            location_content = location_contents[tx.pk]
+            if isinstance(location_content, Exception):
                 no_location_file_transactions.append(tx.pk)
                 continue
 
@@ -571,6 +669,27 @@ class TransactionsService:
             no_location_file_transactions,
         )
 
+    @staticmethod
+    def _download_location_files(transaction_ids: list[UUID]) -> dict[UUID, str | Exception]:
+        """Download location files concurrently, chain exports spend most of their time waiting for S3.
+
+        Failed downloads are returned as exceptions, so callers decide how to handle them.
+        """
+
+        def download(transaction_id: UUID) -> str | Exception:
+            try:
+                return default_storage.open(f"{LOCATION_S3_PREFIX}/{transaction_id}").read().decode()
+            except Exception as exc:
+                return exc
+
+        if len(transaction_ids) <= 1:
+            return {transaction_id: download(transaction_id) for transaction_id in transaction_ids}
+
+        # Workers only do storage I/O, database access stays in the request thread
+        max_workers = min(LOCATION_FILES_DOWNLOAD_WORKERS, len(transaction_ids))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="location-files") as executor:
+            return dict(zip(transaction_ids, executor.map(download, transaction_ids), strict=True))
+
     @staticmethod
     def _merge_feature_collections(collections: list[FeatureCollection]) -> FeatureCollection:
         features = [feature for collection in collections for feature in collection.features]
@@ -588,6 +707,21 @@ class TransactionsService:
     def _send_invite_sms(phone: str) -> None:
         send_sms.delay(recipient=phone, message=_("You have been invited to Whimo!"))
 
+    @staticmethod
+    def _send_downstream_email(email: str) -> None:
+        send_email.delay(
+            recipients=[email],
+            subject=_("Review your WHIMO transactions"),
+            message=_("Commodities you bought may come from a flagged producer, please review your transactions."),
+        )
+
+    @staticmethod
+    def _send_downstream_sms(phone: str) -> None:
+        send_sms.delay(
+            recipient=phone,
+            message=_("Commodities you bought may come from a flagged producer, please review your transactions."),
+        )
+
     @staticmethod
     def _validate_conversion_commodities(commodity_ids: set[UUID]) -> None:
         existing_count = Commodity.objects.filter(id__in=commodity_ids).count()
@@ -629,6 +763,7 @@ class TransactionsService:
                 is_input=True,
                 group_id=group_id,
             )
+            transaction.traceability_shares = balance.traceability_shares or UNKNOWN_SHARES
             transactions.append(transaction)
 
         return balances_to_update, transactions
@@ -638,6 +773,7 @@ class TransactionsService:
         user_id: UUID,
         output_commodities: dict[UUID, Decimal],
         traceability: TransactionTraceability,
+        traceability_shares: Shares,
         group_id: UUID,
     ) -> tuple[list[Balance], list[Balance], list[Transaction]]:
         existing_output_balances = {
@@ -654,10 +790,18 @@ class TransactionsService:
         for commodity_id, volume in output_commodities.items():
             balance = existing_output_balances.get(commodity_id)
             if balance:
+                balance.traceability_shares = add_to_balance(
+                    balance.volume, balance.traceability_shares, volume, traceability_shares
+                )
                 balance.volume += volume
                 balances_to_update.append(balance)
             else:
-                balance = Balance(user_id=user_id, commodity_id=commodity_id, volume=volume)
+                balance = Balance(
+                    user_id=user_id,
+                    commodity_id=commodity_id,
+                    volume=volume,
+                    traceability_shares=traceability_shares,
+                )
                 balances_to_create.append(balance)
 
             transaction = TransactionsMapper.to_conversion_transaction(
@@ -668,23 +812,27 @@ class TransactionsService:
                 is_input=False,
                 group_id=group_id,
             )
+            transaction.traceability_shares = traceability_shares
             transactions.append(transaction)
 
         return balances_to_update, balances_to_create, transactions
 
     @staticmethod
     def list_conversion_recipes(request: ConversionRecipeListRequest) -> tuple[list[ConversionRecipe], Pagination]:
-        queryset = TransactionsService._filter_conversion_recipes(request)
-        return paginate_queryset(queryset=queryset, request=request)
+        recipes = TransactionsService._filter_conversion_recipes(request)
+        return paginate_list(items=recipes, request=request)
 
     @staticmethod
-    def _filter_conversion_recipes(request: ConversionRecipeListRequest) -> QuerySet[ConversionRecipe]:
-        queryset = ConversionRecipe.objects.prefetch_conversion_data()
-
-        if search := request.search:
-            queryset = queryset.filter(Q(name__icontains=search))
+    def _filter_conversion_recipes(request: ConversionRecipeListRequest) -> list[ConversionRecipe]:
+        catalog = ConversionRecipesStorage.get_catalog()
 
         if commodity_id := request.commodity_id:
-            queryset = queryset.filter(inputs__commodity_id=commodity_id).distinct()
+            recipes = catalog.recipes_by_input.get(commodity_id, [])
+        else:
+            recipes = catalog.recipes
+
+        if search := request.search:
+            search = search.casefold()
+            recipes = [recipe for recipe in recipes if search in recipe.name.casefold()]
 
-        return cast(QuerySet[ConversionRecipe], queryset)
+        return recipes
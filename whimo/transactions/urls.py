@@ -3,6 +3,7 @@ from django.urls import path
 from whimo.transactions.views import (
     ChainCsvDownloadView,
     ChainFeatureCollectionDownloadView,
+    ChainGraphDownloadView,
     ChainLocationBundleDownloadView,
     ConversionView,
     TransactionDetailView,
@@ -51,6 +52,11 @@ urlpatterns = [
         ChainCsvDownloadView.as_view(),
         name="transactions_chain_csv_download",
     ),
+    path(
+        "<uuid:transaction_id>/download/graph/",
+        ChainGraphDownloadView.as_view(),
+        name="transactions_chain_graph_download",
+    ),
     path(
         "<uuid:transaction_id>/download/bundle/",
         ChainLocationBundleDownloadView.as_view(),
@@ -1,13 +1,16 @@
 from typing import Any
 from uuid import UUID
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework import views
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from whimo.common.conditional import build_user_etag, get_not_modified_response
 from whimo.common.schemas.base import DataResponse, PaginatedDataResponse
 from whimo.common.throttling import DownloadThrottle
+from whimo.db.routers import get_read_database, using_replica
+from whimo.transactions.export.graph import stream_graph
 from whimo.transactions.export.resources import TransactionUserResource
 from whimo.transactions.mappers import TransactionsMapper
 from whimo.transactions.schemas.dto import ChainFeatureCollectionDTO
@@ -31,12 +34,19 @@ from whimo.transactions.services import TransactionsService
 
 
 class TransactionListView(views.APIView):
+    query_budget = 7
+
     def get(self, request: Request, *_: Any, **__: Any) -> Response:
         payload = TransactionListRequest.parse(request, from_query_params=True)
+
+        etag = build_user_etag(request)
+        if not_modified := get_not_modified_response(request, etag):
+            return not_modified
+
         items, pagination = TransactionsService.list_transactions(user_id=request.user.id, request=payload)
 
         response = TransactionsMapper.to_dto_list(entities=items, user_id=request.user.id)
-        return PaginatedDataResponse(data=response, pagination=pagination).as_response()
+        return PaginatedDataResponse(data=response, pagination=pagination).as_response(etag=etag)
 
 
 class TransactionListCsvDownloadView(views.APIView):
@@ -44,10 +54,10 @@ class TransactionListCsvDownloadView(views.APIView):
 
     def get(self, request: Request, *_: Any, **__: Any) -> HttpResponse:
         payload = TransactionListRequest.parse(request, from_query_params=True)
-        transactions = TransactionsService.get_list_csv_export(user_id=request.user.id, request=payload)
 
-        resource = TransactionUserResource()
-        dataset = resource.export(transactions)
+        with using_replica(user_id=request.user.id):
+            transactions = TransactionsService.get_list_csv_export(user_id=request.user.id, request=payload)
+            dataset = TransactionUserResource().export(transactions)
         csv_data = dataset.csv
 
         response = HttpResponse(csv_data, content_type="text/csv")
@@ -57,6 +67,8 @@ class TransactionListCsvDownloadView(views.APIView):
 
 
 class TransactionDetailView(views.APIView):
+    query_budget = 7
+
     def get(self, request: Request, transaction_id: UUID, *_: Any, **__: Any) -> Response:
         transaction = TransactionsService.get(user_id=request.user.id, transaction_id=transaction_id)
 
@@ -136,8 +148,9 @@ class TransactionNotificationResendView(views.APIView):
 class ChainFeatureCollectionDownloadView(views.APIView):
     throttle_classes = [DownloadThrottle]
 
-    def get(self, _: Request, transaction_id: UUID, *__: Any, **___: Any) -> Response:
-        data = TransactionsService.get_chain_feature_collection(transaction_id=transaction_id)
+    def get(self, request: Request, transaction_id: UUID, *_: Any, **__: Any) -> Response:
+        with using_replica(user_id=request.user.id):
+            data = TransactionsService.get_chain_feature_collection(transaction_id=transaction_id)
         feature_collection, succeed_transactions, failed_transactions = data
 
         response = ChainFeatureCollectionDTO(
@@ -151,11 +164,10 @@ class ChainFeatureCollectionDownloadView(views.APIView):
 class ChainCsvDownloadView(views.APIView):
     throttle_classes = [DownloadThrottle]
 
-    def get(self, _: Request, transaction_id: UUID, *__: Any, **___: Any) -> HttpResponse:
-        chain_transactions = TransactionsService.get_chain_csv_export(transaction_id)
-
-        resource = TransactionUserResource()
-        dataset = resource.export(chain_transactions)
+    def get(self, request: Request, transaction_id: UUID, *_: Any, **__: Any) -> HttpResponse:
+        with using_replica(user_id=request.user.id):
+            chain_transactions = TransactionsService.get_chain_csv_export(transaction_id)
+            dataset = TransactionUserResource().export(chain_transactions)
         csv_data = dataset.csv
 
         response = HttpResponse(csv_data, content_type="text/csv")
@@ -164,11 +176,29 @@ class ChainCsvDownloadView(views.APIView):
         return response
 
 
+class ChainGraphDownloadView(views.APIView):
+    throttle_classes = [DownloadThrottle]
+
+    def get(self, request: Request, transaction_id: UUID, *_: Any, **__: Any) -> StreamingHttpResponse:
+        database = get_read_database(request.user.id)
+        with using_replica(user_id=request.user.id):
+            nodes, edges = TransactionsService.get_chain_graph_export(transaction_id)
+
+        # Rows are fetched while the response is written, outside of `using_replica`
+        response = StreamingHttpResponse(
+            stream_graph(nodes.using(database), edges.using(database)),
+            content_type="application/gzip",
+        )
+        response["Content-Disposition"] = f'attachment; filename="transaction_{transaction_id}_chain.ndjson.gz"'
+        return response
+
+
 class ChainLocationBundleDownloadView(views.APIView):
     throttle_classes = [DownloadThrottle]
 
-    def get(self, _: Request, transaction_id: UUID, *__: Any, **___: Any) -> HttpResponse:
-        zip_data, bundle_dto = TransactionsService.get_chain_location_bundle(transaction_id=transaction_id)
+    def get(self, request: Request, transaction_id: UUID, *_: Any, **__: Any) -> HttpResponse:
+        with using_replica(user_id=request.user.id):
+            zip_data, bundle_dto = TransactionsService.get_chain_location_bundle(transaction_id=transaction_id)
 
         response = HttpResponse(zip_data, content_type="application/zip")
         response["Content-Disposition"] = f'attachment; filename="transaction_{transaction_id}_location_bundle.zip"'